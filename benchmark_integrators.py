@@ -0,0 +1,190 @@
+"""
+Work-Precision Benchmark for Integrators
+Sweeps step sizes and tolerances on each scenario and measures the cost
+(wall time, force evaluations) against the accuracy achieved (relative
+energy drift, position error versus a high-accuracy reference)
+
+Usage:
+    python benchmark_integrators.py                       # all scenarios, 180 days
+    python benchmark_integrators.py --days 30 --target 1e-6
+    python benchmark_integrators.py --output work_precision.json
+
+Integrators:
+    verlet   PhysicsEngine.update_positions_velocities at fixed dt
+    RK45     scipy solve_ivp, swept over rtol
+    DOP853   scipy solve_ivp, swept over rtol
+The reference is DOP853 at rtol=1e-13 on the same force law.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+import scenarios
+from orbital_simulator import PhysicsEngine, compute_accelerations, total_energy, AU
+
+DAY = 86400.0
+VERLET_STEPS = [2 * DAY, DAY, 6 * 3600.0, 2 * 3600.0, 3600.0]
+ADAPTIVE_TOLERANCES = [1e-4, 1e-6, 1e-8, 1e-10]
+REFERENCE_RTOL = 1e-13
+
+
+SCENARIOS = ['solar_system', '3d_solar_system', 'realistic_space_scene',
+             'binary_star', 'binary_star_demo']
+
+
+def initial_state(scenario):
+    """Masses, positions and velocities of a scenario as arrays"""
+    state = scenarios.load(scenario)
+    return state.masses, state.positions, state.velocities
+
+
+def _scaled_rhs(masses):
+    """
+    Right-hand side for solve_ivp in AU and days, so one absolute
+    tolerance suits positions and velocities alike
+    """
+    n_bodies = len(masses)
+    scale = DAY ** 2 / AU
+    evaluations = [0]
+
+    def rhs(t, y):
+        evaluations[0] += 1
+        positions = y[:3 * n_bodies].reshape(n_bodies, 3) * AU
+        accelerations = compute_accelerations(masses, positions) * scale
+        return np.concatenate([y[3 * n_bodies:], accelerations.ravel()])
+
+    return rhs, evaluations
+
+
+def run_adaptive(masses, positions, velocities, duration, method, rtol):
+    """Integrate with solve_ivp; returns final state, wall time and force evaluations"""
+    n_bodies = len(masses)
+    rhs, evaluations = _scaled_rhs(masses)
+    y0 = np.concatenate([(positions / AU).ravel(), (velocities * DAY / AU).ravel()])
+
+    start = time.perf_counter()
+    solution = solve_ivp(rhs, (0.0, duration / DAY), y0, method=method,
+                         rtol=rtol, atol=rtol * 1e-3)
+    elapsed = time.perf_counter() - start
+    if not solution.success:
+        raise RuntimeError(f"{method} failed: {solution.message}")
+
+    y = solution.y[:, -1]
+    return (y[:3 * n_bodies].reshape(n_bodies, 3) * AU,
+            y[3 * n_bodies:].reshape(n_bodies, 3) * AU / DAY,
+            elapsed, evaluations[0])
+
+
+def run_verlet(scenario, duration, dt):
+    """Integrate with the simulator's own engine at a fixed step"""
+    engine = PhysicsEngine(scenarios.load(scenario).bodies())
+
+    steps = max(1, int(round(duration / dt)))
+    dt = duration / steps
+    start = time.perf_counter()
+    for _ in range(steps):
+        engine.update_positions_velocities(dt)
+    elapsed = time.perf_counter() - start
+
+    # update_positions_velocities evaluates every body's acceleration twice
+    return (np.array([b.position for b in engine.bodies]),
+            np.array([b.velocity for b in engine.bodies]),
+            elapsed, 2 * steps)
+
+
+def work_precision(scenario, duration):
+    """Run every integrator configuration on one scenario"""
+    masses, positions, velocities = initial_state(scenario)
+    energy0 = total_energy(masses, positions, velocities)
+    ref_positions, _, ref_time, _ = run_adaptive(masses, positions, velocities, duration,
+                                                 'DOP853', REFERENCE_RTOL)
+    scale = np.max(np.linalg.norm(ref_positions, axis=1))
+
+    configurations = [('verlet', 'dt', dt, lambda dt=dt: run_verlet(scenario, duration, dt))
+                      for dt in VERLET_STEPS]
+    for method in ('RK45', 'DOP853'):
+        configurations += [(method, 'rtol', rtol,
+                            lambda m=method, r=rtol: run_adaptive(masses, positions, velocities,
+                                                                  duration, m, r))
+                           for rtol in ADAPTIVE_TOLERANCES]
+
+    results = []
+    for integrator, parameter, value, run in configurations:
+        final_positions, final_velocities, elapsed, evaluations = run()
+        energy = total_energy(masses, final_positions, final_velocities)
+        position_error = np.max(np.linalg.norm(final_positions - ref_positions, axis=1))
+        results.append({
+            'scenario': scenario,
+            'integrator': integrator,
+            'parameter': parameter,
+            'value': value,
+            'wall_time_s': elapsed,
+            'force_evaluations': evaluations,
+            'energy_drift': abs((energy - energy0) / energy0),
+            'position_error_m': float(position_error),
+            'relative_position_error': float(position_error / scale),
+        })
+    return results, ref_time
+
+
+def _format_config(record):
+    if record['parameter'] == 'dt':
+        return f"{record['integrator']} dt={record['value'] / 3600:g}h"
+    return f"{record['integrator']} rtol={record['value']:.0e}"
+
+
+def print_table(results):
+    print(f"  {'configuration':<22} {'wall (s)':>9} {'force evals':>12} "
+          f"{'energy drift':>13} {'pos error (km)':>15} {'rel pos err':>12}")
+    for r in results:
+        print(f"  {_format_config(r):<22} {r['wall_time_s']:>9.3f} {r['force_evaluations']:>12d} "
+              f"{r['energy_drift']:>13.2e} {r['position_error_m'] / 1000:>15.3e} "
+              f"{r['relative_position_error']:>12.2e}")
+
+
+def cheapest(results, target, cost='wall_time_s'):
+    """Cheapest configuration whose energy drift and relative position error meet the target"""
+    passing = [r for r in results
+               if r['energy_drift'] <= target and r['relative_position_error'] <= target]
+    return min(passing, key=lambda r: r[cost]) if passing else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Work-precision benchmark for integrators")
+    parser.add_argument('--scenarios', nargs='+', default=SCENARIOS,
+                        choices=list(scenarios.SCENARIOS))
+    parser.add_argument('--days', type=float, default=180.0, help="simulated duration")
+    parser.add_argument('--target', type=float, default=1e-6,
+                        help="accuracy target for the recommendation")
+    parser.add_argument('--output', help="save all results as JSON")
+    args = parser.parse_args()
+
+    print("🎯 Integrator Work-Precision Benchmark")
+    print("=" * 40)
+    duration = args.days * DAY
+
+    all_results = []
+    for scenario in args.scenarios:
+        results, ref_time = work_precision(scenario, duration)
+        all_results += results
+        print(f"\n🪐 {scenario} ({args.days:g} days, reference took {ref_time:.2f}s)")
+        print_table(results)
+
+        best = cheapest(results, args.target)
+        if best:
+            print(f"  ➜ Cheapest meeting {args.target:g}: {_format_config(best)} "
+                  f"({best['wall_time_s']:.3f}s, {best['force_evaluations']} force evals)")
+        else:
+            print(f"  ➜ No configuration meets {args.target:g}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'days': args.days, 'target': args.target, 'results': all_results}, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Physics Engine Microbenchmarks
+Times the PhysicsEngine hot paths across system sizes and scenarios
+
+Usage:
+    python benchmark_physics.py                          # full run, prints a table
+    python benchmark_physics.py --output bench.json      # save results
+    python benchmark_physics.py --compare bench.json     # flag regressions
+    python benchmark_physics.py --sizes 3 10 100 --min-time 0.1
+
+Every case measures one "sweep": a full integration step, a force
+evaluation for every body, or an energy evaluation for every body. Each
+is timed on the per-body Python loop ('python') and on the vectorized
+orbital_physics functions ('numpy'); the numpy step gathers the bodies
+into arrays and writes them back, as a caller of the engine would.
+steps/s is sweeps per second and body-steps/s multiplies that by N.
+Sizes whose predicted cost (O(N^2) from the previous size) exceeds
+--max-case-time or --max-memory are reported as skipped.
+
+Import times are measured in fresh interpreters, along with which heavy
+packages each import pulled in (the headless modules should load none).
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+import scenarios
+from orbital_physics import compute_accelerations
+from orbital_simulator import PhysicsEngine, orbital_energies
+
+DEFAULT_SIZES = [3, 10, 100, 1000, 10000]
+SCENARIOS = ['solar_system', '3d_solar_system', 'realistic_space_scene']
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_MODULES = ['orbital_physics', 'scenarios', 'orbital_simulator', 'simulation_service', 'frame_server']
+HEAVY_PACKAGES = ['matplotlib', 'scipy', 'tkinter']
+
+_IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, *[name for name in {heavy!r} if name in sys.modules])
+"""
+
+
+def random_system(n_bodies, seed=0):
+    """A Sun plus n_bodies - 1 planets on circular, slightly inclined orbits"""
+    return scenarios.load('random', n_bodies=n_bodies, seed=seed).bodies()
+
+
+def scenario_system(name):
+    """Bodies of one of the registered scenarios"""
+    return scenarios.load(name).bodies()
+
+
+# Each case: (name, engine, function(engine) -> None doing one sweep)
+def _step(engine):
+    engine.update_positions_velocities(3600.0)
+
+def _step_vectorized(engine, dt=3600.0):
+    # The same velocity Verlet step as update_positions_velocities, on arrays
+    bodies = engine.bodies
+    masses = np.array([b.mass for b in bodies])
+    positions = np.array([b.position for b in bodies])
+    velocities = np.array([b.velocity for b in bodies])
+    accelerations = compute_accelerations(masses, positions)
+    positions += (velocities + accelerations * dt) * dt
+    velocities += (accelerations + compute_accelerations(masses, positions)) / 2 * dt
+    for body, position, velocity in zip(bodies, positions, velocities):
+        body.position, body.velocity = position, velocity
+    engine.time += dt
+
+def _forces(engine):
+    for body in engine.bodies:
+        engine.calculate_forces(body)
+
+def _forces_vectorized(engine):
+    # Forces, like calculate_forces: mass times acceleration
+    bodies = engine.bodies
+    masses = np.array([b.mass for b in bodies])
+    compute_accelerations(masses, np.array([b.position for b in bodies])) * masses[:, np.newaxis]
+
+def _energy(engine):
+    for body in engine.bodies:
+        engine.get_orbital_energy(body)
+
+def _energy_vectorized(engine):
+    bodies = engine.bodies
+    orbital_energies(np.array([b.mass for b in bodies]),
+                     np.array([b.position for b in bodies]),
+                     np.array([b.velocity for b in bodies]))
+
+CASES = [
+    ('update_positions_velocities', 'python-verlet', _step),
+    ('update_positions_velocities', 'numpy-verlet', _step_vectorized),
+    ('calculate_forces', 'python', _forces),
+    ('calculate_forces', 'numpy', _forces_vectorized),
+    ('get_orbital_energy', 'python', _energy),
+    ('get_orbital_energy', 'numpy', _energy_vectorized),
+]
+
+
+def measure(function, engine, min_time):
+    """Run `function(engine)` repeatedly for at least `min_time` seconds"""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while calls == 0 or elapsed < min_time:
+        function(engine)
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls, elapsed
+
+
+def peak_memory(function, engine):
+    """Peak bytes allocated by a single call"""
+    tracemalloc.start()
+    try:
+        function(engine)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(sizes, min_time=0.2, max_case_time=10.0, max_memory=1 << 30,
+                   include_scenarios=True):
+    """Run every case on every system; returns a list of result dicts"""
+    systems = [(f"N={n}", lambda n=n: random_system(n)) for n in sizes]
+    if include_scenarios:
+        systems += [(name, lambda name=name: scenario_system(name)) for name in SCENARIOS]
+
+    results = []
+    last_random = {}  # (case, engine) -> (n, seconds per call, peak bytes)
+    for system_name, build in systems:
+        n_bodies = len(build())
+        for case, engine_name, function in CASES:
+            record = {'case': case, 'engine': engine_name, 'system': system_name,
+                      'n_bodies': n_bodies}
+
+            previous = last_random.get((case, engine_name)) if system_name.startswith('N=') else None
+            if previous:
+                scale = (n_bodies / previous[0]) ** 2
+                predicted_time, predicted_memory = previous[1] * scale, previous[2] * scale
+                if predicted_time > max_case_time or predicted_memory > max_memory:
+                    record['skipped'] = (f"predicted {predicted_time:.1f}s per sweep, "
+                                         f"{predicted_memory / 2**20:.0f} MiB")
+                    results.append(record)
+                    _print_result(record)
+                    continue
+
+            engine = PhysicsEngine(build())
+            calls, seconds = measure(function, engine, min_time)
+            peak = peak_memory(function, PhysicsEngine(build()))
+            record.update({
+                'calls': calls,
+                'seconds': seconds,
+                'steps_per_s': calls / seconds,
+                'body_steps_per_s': calls * n_bodies / seconds,
+                'peak_memory_bytes': peak,
+            })
+            if system_name.startswith('N='):
+                last_random[(case, engine_name)] = (n_bodies, seconds / calls, peak)
+            results.append(record)
+            _print_result(record)
+    return results
+
+
+def import_times(modules=IMPORT_MODULES, repeats=3):
+    """Best-of-`repeats` cold import time of each module, in a fresh interpreter"""
+    results = []
+    for module in modules:
+        code = _IMPORT_PROBE.format(module=module, heavy=HEAVY_PACKAGES)
+        best, heavy = None, []
+        for _ in range(repeats):
+            # Run from this directory so the probe finds the modules wherever we are called from
+            output = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                    text=True, check=True, cwd=BASE_DIR).stdout.split()
+            seconds, heavy = float(output[0]), output[1:]
+            best = seconds if best is None else min(best, seconds)
+        record = {'module': module, 'import_seconds': best, 'heavy_packages': heavy}
+        results.append(record)
+        loaded = ", ".join(heavy) if heavy else "none"
+        print(f"  import {module:<24} {best * 1e3:>8.1f} ms   heavy packages: {loaded}")
+    return results
+
+
+def _key(record):
+    return f"{record['case']}/{record['engine']}/{record['system']}"
+
+
+def _print_result(record):
+    label = f"{record['case']} [{record['engine']}] {record['system']}"
+    if 'skipped' in record:
+        print(f"  {label:<64} skipped ({record['skipped']})")
+    else:
+        print(f"  {label:<64} {record['steps_per_s']:>12.1f} steps/s "
+              f"{record['body_steps_per_s']:>14.1f} body-steps/s "
+              f"{record['peak_memory_bytes'] / 1024:>10.1f} KiB")
+
+
+def compare(results, baseline, threshold):
+    """Print speed ratios against a baseline; returns the regressed keys"""
+    baseline_by_key = {_key(r): r for r in baseline['results'] if 'skipped' not in r}
+    regressions = []
+    print(f"\n📊 Comparison against baseline from {baseline.get('created', 'unknown')}")
+    for record in results:
+        if 'skipped' in record or _key(record) not in baseline_by_key:
+            continue
+        ratio = record['steps_per_s'] / baseline_by_key[_key(record)]['steps_per_s']
+        flag = ""
+        if ratio < 1 - threshold:
+            flag = "  ⚠️ REGRESSION"
+            regressions.append(_key(record))
+        elif ratio > 1 + threshold:
+            flag = "  ✅ faster"
+        print(f"  {_key(record):<62} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the physics engine")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="random system sizes to benchmark")
+    parser.add_argument('--no-scenarios', action='store_true',
+                        help="skip the built-in scenarios")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="minimum seconds spent timing each case")
+    parser.add_argument('--max-case-time', type=float, default=10.0,
+                        help="skip sizes predicted to need longer than this per sweep")
+    parser.add_argument('--max-memory', type=float, default=1024,
+                        help="skip sizes predicted to allocate more MiB than this")
+    parser.add_argument('--output', help="save results as JSON")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="compare against a saved JSON baseline")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    print("⏱️ Physics Engine Benchmarks")
+    print("=" * 30)
+    imports = import_times()
+    print()
+    results = run_benchmarks(args.sizes, args.min_time, args.max_case_time,
+                             args.max_memory * 2**20, not args.no_scenarios)
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'imports': imports,
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Headless Render Benchmarks
+Times the visualization paths on the Agg backend, without opening windows
+
+Usage:
+    python benchmark_render.py                           # full run, prints a table
+    python benchmark_render.py --output render.json      # save a baseline
+    python benchmark_render.py --compare render.json     # flag regressions
+    python benchmark_render.py --bodies 3 50 --trails 0 500 --min-time 0.5
+
+Cases:
+    visualize        OrbitalSimulator.visualize on a fresh figure, then a full draw
+    animation_frame  one frame of animate_simulation (a single physics step)
+    gui_update       the GUIs' update_visualization body on an Agg figure
+    gui_update_2d    the same in the GUIs' blitted 2D view (the final copy to
+                     the Tk window is not included)
+Each frame is drawn to the Agg canvas, so ms/frame includes rasterization.
+Artists are counted on the figure after the frame.
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+
+import argparse
+import json
+import platform
+import sys
+import time
+import warnings
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from benchmark_physics import random_system, scenario_system
+from orbital_simulator import OrbitalSimulator
+
+DEFAULT_BODIES = [3, 10, 50, 200]
+DEFAULT_TRAILS = [0, 100, 1000]
+SCENARIOS = ['solar_system', '3d_solar_system', 'realistic_space_scene']
+
+# The titles use emoji that the default font lacks; the warning repeats every frame
+warnings.filterwarnings('ignore', message='Glyph .* missing from font')
+
+
+def build_simulator(bodies, trail_length):
+    """
+    Simulator with `trail_length` synthetic trail points per body
+
+    Trails are the current positions rotated back about the z axis, so the
+    drawn geometry looks like real orbits without running the physics.
+    """
+    simulator = OrbitalSimulator(bodies)
+    angles = np.linspace(-0.5, 0.0, trail_length)[:, None]
+    c, s = np.cos(angles), np.sin(angles)
+    positions = np.array([body.position for body in simulator.physics_engine.bodies])
+    x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
+    trails = np.stack([c * x - s * y, s * x + c * y, np.broadcast_to(z, (trail_length, len(z)))], axis=-1)
+    times = (np.arange(trail_length) - trail_length) * simulator.dt
+    simulator.trajectories.extend(times, trails, np.zeros_like(trails))
+    return simulator
+
+
+def count_artists(fig):
+    """Lines, collections, texts, patches and images on every axis of a figure"""
+    return sum(len(ax.lines) + len(ax.collections) + len(ax.texts) + len(ax.patches) + len(ax.images)
+               for ax in fig.axes)
+
+
+def _new_3d_figure():
+    fig = Figure(figsize=(12, 8), facecolor='black')
+    FigureCanvasAgg(fig)  # a bare Figure's canvas.draw() renders nothing
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_facecolor('black')
+    return fig, ax
+
+
+# Each case returns a frame function that draws one frame and returns its figure
+def _visualize(simulator, trail_length, realistic):
+    def frame():
+        fig, _ = simulator.visualize(show_trajectories=trail_length > 0,
+                                     max_trajectory_points=max(trail_length, 1),
+                                     use_3d=True, realistic_space=realistic, interactive=False)
+        fig.canvas.draw()
+        plt.close(fig)
+        return fig
+    return frame
+
+def _animation_frame(simulator, trail_length, realistic):
+    fig, ax = _new_3d_figure()
+    animation_data = simulator.create_animation_data()
+    animation_data['trajectories'] = {name: list(points)
+                                      for name, points in simulator.trajectories.items()}
+
+    def frame():
+        simulator.advance_animation_frame(ax, animation_data, simulator.dt)
+        # Keep the trail length constant across repeats
+        for points in animation_data['trajectories'].values():
+            if len(points) > trail_length:
+                del points[0]
+        fig.canvas.draw()
+        return fig
+    return frame
+
+def _gui_update(simulator, trail_length, realistic):
+    fig, ax = _new_3d_figure()
+
+    def frame():
+        trajectories = simulator.trajectories if trail_length else None
+        simulator.draw_scene(ax, trajectories, max_trajectory_points=max(trail_length, 1),
+                             realistic=realistic, show_labels=True)
+        ax.set_title(f'🌌 Orbital Mechanics Simulator (t = {simulator.time/86400:.1f} days)',
+                     color='white', fontsize=12)
+        fig.canvas.draw()
+        return fig
+    return frame
+
+def _gui_update_2d(simulator, trail_length, realistic):
+    fig = Figure(figsize=(12, 8), facecolor='black')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+
+    def frame():
+        trajectories = simulator.trajectories if trail_length else None
+        renderer = simulator.draw_scene(ax, trajectories, max_trajectory_points=max(trail_length, 1),
+                                        realistic=realistic, show_labels=True, blit=True)
+        ax.set_title(f'🌌 Orbital Mechanics Simulator (t = {simulator.time/86400:.1f} days)',
+                     color='white', fontsize=12)
+        renderer.draw()
+        return fig
+    return frame
+
+# (name, setup, whether the case has a non-realistic mode)
+CASES = [
+    ('visualize', _visualize, True),
+    ('animation_frame', _animation_frame, False),
+    ('gui_update', _gui_update, True),
+    ('gui_update_2d', _gui_update_2d, True),
+]
+
+
+def measure(frame, min_time, min_frames=3):
+    """Draw frames for at least `min_time` seconds; returns per-frame seconds and the last figure"""
+    frame()  # warm-up: fonts, mathtext and the 3D projection caches
+    durations = []
+    start = time.perf_counter()
+    while len(durations) < min_frames or time.perf_counter() - start < min_time:
+        frame_start = time.perf_counter()
+        fig = frame()
+        durations.append(time.perf_counter() - frame_start)
+    return np.array(durations), fig
+
+
+def run_benchmarks(body_counts, trail_lengths, min_time=0.5, include_scenarios=True):
+    """Run every case over every system, trail length and mode; returns a list of result dicts"""
+    systems = [(f"N={n}", lambda n=n: random_system(n)) for n in body_counts]
+    if include_scenarios:
+        systems += [(name, lambda name=name: scenario_system(name)) for name in SCENARIOS]
+
+    results = []
+    for system_name, build in systems:
+        for trail_length in trail_lengths:
+            for case, setup, has_plain_mode in CASES:
+                for realistic in ((True, False) if has_plain_mode else (True,)):
+                    simulator = build_simulator(build(), trail_length)
+                    durations, fig = measure(setup(simulator, trail_length, realistic), min_time)
+                    record = {
+                        'case': case,
+                        'system': system_name,
+                        'n_bodies': len(simulator.physics_engine.bodies),
+                        'trail_length': trail_length,
+                        'realistic': realistic,
+                        'frames': len(durations),
+                        'ms_per_frame': float(durations.mean() * 1e3),
+                        'p50_ms': float(np.percentile(durations, 50) * 1e3),
+                        'p95_ms': float(np.percentile(durations, 95) * 1e3),
+                        'artists': count_artists(fig),
+                    }
+                    results.append(record)
+                    _print_result(record)
+    return results
+
+
+def _key(record):
+    mode = 'realistic' if record['realistic'] else 'plain'
+    return f"{record['case']}/{record['system']}/trail={record['trail_length']}/{mode}"
+
+
+def _print_result(record):
+    print(f"  {_key(record):<58} {record['ms_per_frame']:>9.2f} ms/frame "
+          f"(p95 {record['p95_ms']:>8.2f}) {record['artists']:>6d} artists")
+
+
+def compare(results, baseline, threshold):
+    """Print frame-time ratios against a baseline; returns the regressed keys"""
+    baseline_by_key = {_key(r): r for r in baseline['results']}
+    regressions = []
+    print(f"\n📊 Comparison against baseline from {baseline.get('created', 'unknown')}")
+    for record in results:
+        if _key(record) not in baseline_by_key:
+            continue
+        ratio = record['ms_per_frame'] / baseline_by_key[_key(record)]['ms_per_frame']
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  ⚠️ REGRESSION"
+            regressions.append(_key(record))
+        elif ratio < 1 - threshold:
+            flag = "  ✅ faster"
+        print(f"  {_key(record):<58} {ratio:6.2f}x time{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the rendering paths headlessly")
+    parser.add_argument('--bodies', type=int, nargs='+', default=DEFAULT_BODIES,
+                        help="random system sizes to render")
+    parser.add_argument('--trails', type=int, nargs='+', default=DEFAULT_TRAILS,
+                        help="trail lengths (points per body)")
+    parser.add_argument('--no-scenarios', action='store_true',
+                        help="skip the built-in scenarios")
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help="minimum seconds spent timing each case")
+    parser.add_argument('--output', help="save results as JSON")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="compare against a saved JSON baseline")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    print("🎨 Render Benchmarks (Agg)")
+    print("=" * 30)
+    results = run_benchmarks(args.bodies, args.trails, args.min_time, not args.no_scenarios)
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+if __name__ == "__main__":
+    main()
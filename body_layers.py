@@ -0,0 +1,189 @@
+"""
+Body Layers
+Every body's look (corona, atmosphere, surface features, rings) drawn as
+the points of a single scatter collection
+
+Usage:
+    layers = add_body_layers(ax, bodies, properties, positions_au, use_3d=True)
+    move_body_layers(layers, new_positions_au)     # each frame
+
+Each body is described by a list of Layer rows. A layer is one marker at
+the body's position, sized and offset relative to the body's marker, so a
+whole scene is one collection with per-point sizes, colors, edges and
+marker paths however many bodies and layers it has. In 3D the points are
+drawn bodies back to front, and each body's layers in table order.
+
+Imports matplotlib; scene_renderer and OrbitalSimulator load it lazily.
+The 3D ordering replaces a few Path3DCollection internals (checked against
+matplotlib 3.11); if a release renames them, the scene still draws, with a
+warning, in matplotlib's own point order.
+"""
+
+import warnings
+from typing import List, NamedTuple, Optional, Sequence
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib import colors as mcolors
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+from matplotlib.transforms import IdentityTransform
+from mpl_toolkits.mplot3d.art3d import Path3DCollection
+
+
+class Layer(NamedTuple):
+    """One marker of a body's appearance"""
+    scale: float            # marker diameter as a multiple of the body's size
+    color: Optional[str]    # None uses the body's own color
+    alpha: float
+    dx: float = 0.0         # offset from the body's center, in body sizes
+    dy: float = 0.0
+    edgecolor: Optional[str] = None   # None draws the edge in the face color
+    linewidth: Optional[float] = None  # None is rcParams['lines.linewidth']
+
+
+def _surface(color, edgecolor):
+    return Layer(1.0, color, 0.9, edgecolor=edgecolor, linewidth=0.5)
+
+
+REALISTIC_3D = {
+    'Sun': [Layer(2.5, '#FFD700', 0.1),      # outer corona
+            Layer(2.0, '#FFA500', 0.2),      # middle corona
+            Layer(1.5, '#FFD700', 0.4),      # inner corona
+            Layer(1.0, '#FFFF00', 0.9, edgecolor='#FF4500', linewidth=1)],
+    'Earth': [Layer(1.3, '#87CEEB', 0.3),    # atmosphere
+              _surface('#4169E1', '#228B22'),
+              Layer(0.3, '#228B22', 0.8, 0.1, 0.1),     # continents
+              Layer(0.2, '#32CD32', 0.7, -0.1, -0.1)],
+    'Mars': [_surface('#CD5C5C', '#8B0000'),
+             Layer(0.4, '#F0F8FF', 0.8, 0.0, 0.3),      # polar caps
+             Layer(0.4, '#F0F8FF', 0.8, 0.0, -0.3),
+             Layer(0.1, '#8B0000', 0.6, 0.2, 0.0)],     # surface feature
+    'Moon': [_surface('#C0C0C0', '#A9A9A9'),
+             Layer(0.2, '#A9A9A9', 0.7, 0.2, 0.1),      # craters
+             Layer(0.15, '#A9A9A9', 0.6, -0.15, -0.2)],
+    'Mercury': [_surface('#8C7853', '#696969'),
+                Layer(0.1, '#696969', 0.7, 0.1, 0.0)],
+    'Venus': [Layer(1.2, '#FFA500', 0.3),    # thick atmosphere
+              _surface('#FF8C00', '#FF4500')],
+    'Jupiter': [_surface('#D2691E', '#8B4513'),
+                Layer(0.8, '#CD853F', 0.7, 0.0, 0.2),   # bands
+                Layer(0.8, '#A0522D', 0.7, 0.0, -0.2),
+                Layer(0.3, '#DC143C', 0.8, 0.3, 0.0)],  # Great Red Spot
+    'Saturn': [_surface('#F4A460', '#D2691E'),
+               Layer(1.8, '#DEB887', 0.3),   # rings
+               Layer(2.2, '#F5DEB3', 0.2)],
+    'Uranus': [_surface('#4FD0E7', '#20B2AA')],
+    'Neptune': [_surface('#4169E1', '#0000CD')],
+}
+DEFAULT_3D = [_surface(None, 'white')]
+PLAIN = [Layer(1.0, None, 0.9)]
+
+
+def layers_for(name: str, size: float, realistic: bool = True, use_3d: bool = True) -> List[Layer]:
+    """The layers drawn for a body"""
+    if not realistic:
+        return PLAIN
+    if use_3d:
+        return REALISTIC_3D.get(name, DEFAULT_3D)
+    # 2D: the body, with a glow around large ones
+    layers = [_surface(None, 'white')]
+    if size > 10:
+        layers += [Layer(1.5, None, 0.3), Layer(2.0, None, 0.1)]
+    return layers
+
+
+class BodyLayerCollection(Path3DCollection):
+    """
+    3D scatter that keeps each body's layers together and in order
+
+    A plain 3D scatter sorts points by their own depth, which reorders the
+    layers of a body (all at the same depth) arbitrarily.
+    """
+
+    # Set by Path3DCollection.do_3d_projection and read back when drawing
+    _INTERNALS = ('_vzs', '_z_markers_idx', '_sizes3d', '_linewidths3d', '_offset_zordered')
+
+    def __init__(self, paths, body_index, **kwargs):
+        self.body_index = body_index
+        self._rank = np.arange(len(body_index))
+        self._paths3d = list(paths)
+        super().__init__(paths, **kwargs)
+
+    def do_3d_projection(self):
+        depth = super().do_3d_projection()
+        if not all(hasattr(self, name) for name in self._INTERNALS):
+            warnings.warn("This matplotlib version changed Path3DCollection; "
+                          "body layers are drawn in its default order", RuntimeWarning)
+            return depth
+        # Farthest body first; ties (a body's layers) keep their table order
+        order = np.lexsort((self._rank, -np.ma.getdata(self._vzs)))
+        self._z_markers_idx = order
+        if len(self._sizes3d) > 1:
+            self._sizes = self._sizes3d[order]
+        if len(self._linewidths3d) > 1:
+            self._linewidths = self._linewidths3d[order]
+        self._offset_zordered = self.get_offsets()[order]
+        self._paths = [self._paths3d[i] for i in order]
+        return depth
+
+
+def _marker(dx: float, dy: float, scale: float) -> Path:
+    """A circle of diameter 1 shifted by (dx, dy) body sizes, for a marker of `scale` body sizes"""
+    circle = Path.unit_circle()
+    return Path(circle.vertices * 0.5 + (dx / scale, dy / scale), circle.codes)
+
+
+def add_body_layers(ax, names: Sequence[str], properties, positions_au,
+                    realistic: bool = True, use_3d: bool = True):
+    """
+    Add one collection holding every layer of every body
+
+    Args:
+        ax: 2D or 3D axis
+        names: Body names
+        properties: (color, size in points) per body
+        positions_au: (N, 3) body positions
+        realistic: Decorated bodies instead of plain markers
+        use_3d: Whether `ax` is a 3D axis
+    """
+    default_linewidth = mpl.rcParams['lines.linewidth']
+    body_index, sizes, faces, edges, linewidths, paths = [], [], [], [], [], []
+    markers = {}
+    for i, (name, (color, size)) in enumerate(zip(names, properties)):
+        for layer in layers_for(name, size, realistic, use_3d):
+            face = mcolors.to_rgba(layer.color or color, layer.alpha)
+            body_index.append(i)
+            sizes.append((size * layer.scale) ** 2)
+            faces.append(face)
+            edges.append(face if layer.edgecolor is None
+                         else mcolors.to_rgba(layer.edgecolor, layer.alpha))
+            linewidths.append(default_linewidth if layer.linewidth is None else layer.linewidth)
+            key = (layer.dx, layer.dy, layer.scale)
+            if key not in markers:
+                markers[key] = _marker(*key)
+            paths.append(markers[key])
+
+    body_index = np.array(body_index, dtype=int)
+    positions = np.asarray(positions_au, dtype=float).reshape(-1, 3)[body_index]
+    style = dict(sizes=sizes, facecolors=faces, edgecolors=edges, linewidths=linewidths,
+                 offsets=positions[:, :2], offset_transform=ax.transData)
+    if use_3d:
+        collection = BodyLayerCollection(paths, body_index, zs=positions[:, 2],
+                                         depthshade=False, **style)
+    else:
+        collection = PathCollection(paths, **style)
+        collection.body_index = body_index
+    collection.set_transform(IdentityTransform())  # sizes are in points, as in scatter
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+
+def move_body_layers(collection, positions_au):
+    """Move every layer to its body's new (N, 3) position"""
+    positions = np.asarray(positions_au, dtype=float).reshape(-1, 3)[collection.body_index]
+    if isinstance(collection, Path3DCollection):
+        collection._offsets3d = (positions[:, 0], positions[:, 1], positions[:, 2])
+        collection.stale = True
+    else:
+        collection.set_offsets(positions[:, :2])
@@ -3,7 +3,7 @@ educational features for orbital mechanics simulator
 learning tools and educational content
 """
 
-from orbital_simulator import OrbitalSimulator, CelestialBody, SUN_MASS, EARTH_MASS, AU
+from orbital_simulator import OrbitalSimulator
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle
@@ -160,14 +160,7 @@ class EducationalFeatures:
         print("=" * 35)
         
         simulator = OrbitalSimulator([], dt=3600.0)
-        
-        sun = CelestialBody("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 20, '#FFD700', is_3d=True)
-        
-        planet = CelestialBody("Planet", EARTH_MASS, [2 * AU, 0, 0], 
-                              [0, 20000, 0], 6, '#4169E1', is_3d=True)
-        
-        simulator.physics_engine.bodies = [sun, planet]
-        simulator.trajectories = {body.name: [] for body in simulator.physics_engine.bodies}
+        simulator.load_scenario('keplers_laws')
         
         print("Kepler's Laws:")
         print("1. Law of Ellipses: Planets orbit in elliptical paths")
@@ -188,20 +181,7 @@ class EducationalFeatures:
         print("=" * 40)
         
         simulator = OrbitalSimulator([], dt=1800.0)
-        
-        star = CelestialBody("Star", SUN_MASS, [0, 0, 0], [0, 0, 0], 15, '#FFD700', is_3d=True)
-        
-        circular_orbit = CelestialBody("Circular Orbit", EARTH_MASS, [AU, 0, 0], 
-                                      [0, 29780, 0], 4, '#4169E1', is_3d=True)
-        
-        elliptical_orbit = CelestialBody("Elliptical Orbit", EARTH_MASS, [1.5 * AU, 0, 0], 
-                                        [0, 20000, 0], 4, '#CD5C5C', is_3d=True)
-        
-        inclined_orbit = CelestialBody("Inclined Orbit", EARTH_MASS, [2 * AU, 0, 0.5 * AU], 
-                                      [0, 15000, 5000], 4, '#32CD32', is_3d=True)
-        
-        simulator.physics_engine.bodies = [star, circular_orbit, elliptical_orbit, inclined_orbit]
-        simulator.trajectories = {body.name: [] for body in simulator.physics_engine.bodies}
+        simulator.load_scenario('orbit_types')
         
         print("Orbital Mechanics Concepts:")
         print("• Circular orbits: Constant distance, constant speed")
@@ -251,12 +231,7 @@ class EducationalFeatures:
         print("=" * 45)
         
         simulator = OrbitalSimulator([], dt=3600.0)
-        
-        body1 = CelestialBody("Body 1", SUN_MASS, [-0.5 * AU, 0, 0], [0, 0, 0], 10, '#FFD700', is_3d=True)
-        body2 = CelestialBody("Body 2", SUN_MASS * 0.5, [0.5 * AU, 0, 0], [0, 0, 0], 8, '#4169E1', is_3d=True)
-        
-        simulator.physics_engine.bodies = [body1, body2]
-        simulator.trajectories = {body.name: [] for body in simulator.physics_engine.bodies}
+        simulator.load_scenario('binary_gravity')
         
         print("Gravitational Forces:")
         print("• F = G × m₁ × m₂ / r²")
@@ -5,14 +5,14 @@ Interactive quiz system with GUI for the orbital mechanics simulator
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import subprocess, sys
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
 from orbital_simulator import OrbitalSimulator, CelestialBody, SUN_MASS, EARTH_MASS, AU, G
+from launcher import ToolNavigationMixin
 
-class EducationalQuizGUI:
+class EducationalQuizGUI(ToolNavigationMixin):
     def __init__(self, root):
         self.root = root
         self.root.title("🧠 Orbital Mechanics Quiz - Educational Edition")
@@ -327,7 +327,7 @@ class EducationalQuizGUI:
         # Reset quiz
         self.start_quiz()
 
-class EducationalFeaturesGUI:
+class EducationalFeaturesGUI(ToolNavigationMixin):
     def __init__(self, root):
         self.root = root
         self.root.title("📚 Educational Features - Orbital Mechanics")
@@ -557,31 +557,6 @@ Click "Interactive Simulator" to see these concepts in action!
         scenarios_label = ttk.Label(self.content_frame, text=scenarios_text, 
                                    font=('Arial', 10), justify=tk.LEFT)
         scenarios_label.pack(pady=20)
-        
-    def open_simulator(self):
-        """Open the interactive simulator"""
-        try:
-            subprocess.Popen([sys.executable, "interactive_simulation.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open simulator: {str(e)}")
-
-    def open_main_hub(self):
-        try:
-            subprocess.Popen([sys.executable, "main_hub.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Main Hub: {e}")
-
-    def open_planet_analyzer(self):
-        try:
-            subprocess.Popen([sys.executable, "planet_data_analyzer.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Planet Data Analyzer: {e}")
-
-    def open_professional_features(self):
-        try:
-            subprocess.Popen([sys.executable, "professional_features.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Professional Features: {e}")
 
 def main():
     """Main function to run the educational features"""
@@ -0,0 +1,216 @@
+"""
+Chebyshev Ephemeris
+Integrates a scenario once at high accuracy and fits piecewise Chebyshev
+polynomials to every body's coordinates, so positions at any time come
+from a polynomial evaluation instead of a physics run
+
+Usage:
+    python ephemeris.py realistic_space_scene --years 10 --output solar.npz
+
+    from ephemeris import Ephemeris
+    eph = Ephemeris.load('solar.npz')
+    eph.position('Earth', np.linspace(0, 365 * 86400, 1000))   # (1000, 3) m
+
+Each body's x, y and z are fitted separately on fixed-length segments.
+Lookup finds the segment by division and evaluates one polynomial, so the
+cost per sample does not depend on the time span covered.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+import scenarios
+from orbital_physics import AU, compute_accelerations
+
+DAY = 86400.0
+FORMAT_VERSION = 1
+
+
+class Ephemeris:
+    """Piecewise Chebyshev fits of body positions over [t0, t0 + n_segments * segment_length]"""
+
+    def __init__(self, names, t0, segment_length, coefficients, scenario=''):
+        """
+        Args:
+            names: Body names, in coefficient order
+            t0: Start time in seconds
+            segment_length: Segment duration in seconds
+            coefficients: (n_segments, degree + 1, n_bodies, 3) Chebyshev
+                coefficients of position in meters
+            scenario: Name of the scenario the fit came from
+        """
+        self.names = tuple(names)
+        self.t0 = float(t0)
+        self.segment_length = float(segment_length)
+        self.coefficients = coefficients
+        self.scenario = scenario
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._derivatives = None
+        self.reference = None  # dense-output integration the fit came from; not saved
+
+    @property
+    def t_end(self) -> float:
+        return self.t0 + len(self.coefficients) * self.segment_length
+
+    def _locate(self, t):
+        """Segment index and local coordinate in [-1, 1] for each time"""
+        t = np.asarray(t, dtype=float)
+        if np.any((t < self.t0) | (t > self.t_end)):
+            raise ValueError(f"Time outside the ephemeris span [{self.t0}, {self.t_end}] s")
+        offset = (t - self.t0) / self.segment_length
+        segment = np.minimum(offset.astype(int), len(self.coefficients) - 1)
+        return segment, 2.0 * (offset - segment) - 1.0
+
+    @staticmethod
+    def _evaluate(coefficients, segment, x):
+        """
+        Clenshaw evaluation of per-segment series
+
+        coefficients has shape (n_segments, degree + 1, ...); each term is
+        gathered for the sampled segments only, so no (samples, degree)
+        temporary is built.
+        """
+        x = x.reshape(x.shape + (1,) * (coefficients.ndim - 2))
+        x2 = 2.0 * x
+        b1 = b2 = 0.0
+        for k in range(coefficients.shape[1] - 1, 0, -1):
+            b1, b2 = coefficients[segment, k] + x2 * b1 - b2, b1
+        return coefficients[segment, 0] + x * b1 - b2
+
+    def position(self, body: str, t) -> np.ndarray:
+        """Position of one body at time(s) t in seconds; shape t.shape + (3,), meters"""
+        segment, x = self._locate(t)
+        return self._evaluate(self.coefficients[:, :, self._index[body]], segment, x)
+
+    def positions(self, t) -> np.ndarray:
+        """Positions of all bodies at time(s) t; shape t.shape + (n_bodies, 3), meters"""
+        segment, x = self._locate(t)
+        return self._evaluate(self.coefficients, segment, x)
+
+    def velocity(self, body: str, t) -> np.ndarray:
+        """Velocity of one body at time(s) t from the fitted polynomials, m/s"""
+        if self._derivatives is None:
+            self._derivatives = chebyshev.chebder(self.coefficients, axis=1) * (2.0 / self.segment_length)
+        segment, x = self._locate(t)
+        return self._evaluate(self._derivatives[:, :, self._index[body]], segment, x)
+
+    def save(self, path: str) -> str:
+        """Write the ephemeris to an .npz file; returns the path, with .npz added if missing"""
+        if not path.endswith('.npz'):
+            path += '.npz'  # np.savez would add it anyway
+        np.savez(path, version=FORMAT_VERSION, names=np.array(self.names), t0=self.t0,
+                 segment_length=self.segment_length, coefficients=self.coefficients,
+                 scenario=self.scenario)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'Ephemeris':
+        """Read an ephemeris written by save()"""
+        with np.load(path) as data:
+            if int(data['version']) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported ephemeris version {int(data['version'])}")
+            return cls([str(name) for name in data['names']], float(data['t0']),
+                       float(data['segment_length']), data['coefficients'],
+                       str(data['scenario']))
+
+
+def build_ephemeris(state, duration: float, segment_length: float = 8 * DAY,
+                    degree: int = 12, rtol: float = 1e-12, scenario: str = '') -> Ephemeris:
+    """
+    Integrate a scenario and fit every segment
+
+    Args:
+        state: scenarios.ScenarioState to start from (time 0)
+        duration: Span to cover in seconds (rounded up to whole segments)
+        segment_length: Segment duration in seconds
+        degree: Chebyshev degree per segment
+        rtol: Relative tolerance of the DOP853 reference integration
+        scenario: Name stored in the ephemeris
+    """
+    from scipy.integrate import solve_ivp
+
+    n_bodies = len(state)
+    n_segments = max(1, int(np.ceil(duration / segment_length)))
+    scale = DAY ** 2 / AU
+
+    # Integrate in AU and days so one absolute tolerance suits every component
+    def rhs(t, y):
+        accelerations = compute_accelerations(state.masses, y[:3 * n_bodies].reshape(n_bodies, 3) * AU)
+        return np.concatenate([y[3 * n_bodies:], accelerations.ravel() * scale])
+
+    y0 = np.concatenate([(state.positions / AU).ravel(), (state.velocities * DAY / AU).ravel()])
+    span_days = n_segments * segment_length / DAY
+    solution = solve_ivp(rhs, (0.0, span_days), y0, method='DOP853', rtol=rtol,
+                         atol=rtol * 1e-3, dense_output=True)
+    if not solution.success:
+        raise RuntimeError(f"Integration failed: {solution.message}")
+
+    # Sample every segment at Chebyshev points of the first kind and fit by least squares
+    nodes = np.cos(np.pi * (np.arange(2 * (degree + 1)) + 0.5) / (2 * (degree + 1)))
+    starts = np.arange(n_segments) * segment_length
+    sample_times = starts[:, None] + (nodes[None, :] + 1.0) * 0.5 * segment_length
+    samples = solution.sol(sample_times.ravel() / DAY)[:3 * n_bodies] * AU
+
+    # samples: (3N, n_segments * n_nodes) -> (n_nodes, n_segments * 3N) for one chebfit call
+    values = samples.reshape(3 * n_bodies, n_segments, len(nodes)).transpose(2, 1, 0)
+    fit = chebyshev.chebfit(nodes, values.reshape(len(nodes), -1), degree)
+    coefficients = fit.reshape(degree + 1, n_segments, n_bodies, 3).transpose(1, 0, 2, 3)
+
+    ephemeris = Ephemeris(state.names, 0.0, segment_length, np.ascontiguousarray(coefficients),
+                          scenario)
+    ephemeris.reference = solution
+    return ephemeris
+
+
+def fit_error(ephemeris: Ephemeris, samples_per_segment: int = 7) -> float:
+    """
+    Largest position difference (m) between the fit and its reference integration
+
+    Only ephemerides built in this process have a reference; loaded ones do not.
+    """
+    if ephemeris.reference is None:
+        raise ValueError("Ephemeris has no reference integration; "
+                         "fit_error needs one returned by build_ephemeris")
+    t = np.linspace(ephemeris.t0, ephemeris.t_end,
+                    len(ephemeris.coefficients) * samples_per_segment + 1)
+    n_bodies = len(ephemeris.names)
+    reference = ephemeris.reference.sol(t / DAY)[:3 * n_bodies].T.reshape(len(t), n_bodies, 3) * AU
+    return float(np.max(np.linalg.norm(ephemeris.positions(t) - reference, axis=-1)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit a Chebyshev ephemeris for a scenario")
+    parser.add_argument('scenario', nargs='?', default='realistic_space_scene',
+                        choices=list(scenarios.SCENARIOS))
+    parser.add_argument('--years', type=float, default=10.0, help="span to cover")
+    parser.add_argument('--segment-days', type=float, default=8.0)
+    parser.add_argument('--degree', type=int, default=12)
+    parser.add_argument('--output', help="save the ephemeris as .npz")
+    args = parser.parse_args()
+
+    print("📜 Chebyshev Ephemeris Builder")
+    print("=" * 30)
+    state = scenarios.load(args.scenario)
+    start = time.perf_counter()
+    ephemeris = build_ephemeris(state, args.years * 365.25 * DAY, args.segment_days * DAY,
+                                args.degree, scenario=args.scenario)
+    print(f"Fitted {len(ephemeris.coefficients)} segments x {len(state)} bodies "
+          f"(degree {args.degree}) in {time.perf_counter() - start:.2f}s")
+    print(f"Maximum fit error: {fit_error(ephemeris) / 1000:.3f} km")
+
+    t = np.random.default_rng(0).uniform(ephemeris.t0, ephemeris.t_end, 100_000)
+    start = time.perf_counter()
+    ephemeris.positions(t)
+    elapsed = time.perf_counter() - start
+    print(f"Evaluated all bodies at {len(t):,} random times in {elapsed * 1000:.1f} ms")
+
+    if args.output:
+        path = ephemeris.save(args.output)
+        print(f"💾 Saved to {path} ({os.path.getsize(path) / 1024:.0f} KiB)")
+
+if __name__ == "__main__":
+    main()
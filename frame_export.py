@@ -0,0 +1,527 @@
+"""
+Parallel Frame Export
+Renders an animation's frames with Agg in a pool of worker processes and
+streams them, in order, into an animated GIF or APNG or a numbered PNG
+sequence
+
+Usage:
+    from frame_export import ExportJob, export_animation
+    export_animation(simulator, 'orbit.gif', n_frames=240, fps=24,
+                     time_per_frame=86400, workers=4)
+    export_animation(simulator, 'orbit.apng', n_frames=240)          # animated PNG
+    export_animation(simulator, 'frames/orbit.png', n_frames=240)   # orbit_00000.png, ...
+
+    job = ExportJob(simulator, 'orbit.gif', n_frames=240).start()   # background thread
+    job.done, job.total, job.finished    # poll from the UI; job.cancel() to stop
+
+    python frame_export.py --frames 120 --workers 4 --output orbit.gif
+
+The export runs in three stages:
+    1. states: the simulator is stepped once, here, and every frame's
+       state is taken as in animate_simulation (interpolated between
+       steps), giving (F, N, 3) position and velocity arrays
+    2. frames: each worker process sets up one figure and scene, receives
+       the arrays once, then draws the frames it is given and encodes
+       them (GIF frames are quantized to 256 colors in the worker)
+    3. writing: encoded frames are written in frame order as they finish.
+       At most `2 * workers` frames are in flight, so memory stays flat
+       however long the animation is
+
+Rendering time scales with the number of worker processes. Every frame
+uses one fixed view, so frames drawn by different workers match. With
+workers=1 everything runs in this process. A cancelled export keeps the
+frames written so far as a shorter, valid animation.
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from orbital_simulator import AU, OrbitalSimulator, StateSnapshot
+
+DEFAULT_FIGSIZE = (16, 12)  # inches, as animate_simulation
+DEFAULT_DPI = 100
+FORMATS = {'.gif': 'gif', '.apng': 'apng', '.png': 'png'}
+
+
+def encode_frame(rgb: np.ndarray, fmt: str, duration_ms: int) -> bytes:
+    """
+    Encode one (H, W, 3) uint8 frame for a frame writer
+
+    'gif' gives a self-contained GIF frame (delay, local 256-color palette
+    and image data) for GifWriter; 'png' gives a complete PNG file.
+    """
+    from PIL import GifImagePlugin, Image
+
+    image = Image.fromarray(rgb)
+    if fmt == 'gif':
+        frame = image.convert('P', palette=Image.Palette.ADAPTIVE)
+        return b''.join(GifImagePlugin.getdata(frame, include_color_table=True,
+                                               duration=duration_ms))
+    if fmt == 'png':
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG')
+        return buffer.getvalue()
+    raise ValueError(f"Unknown frame format '{fmt}'")
+
+
+class GifWriter:
+    """
+    Animated GIF written one frame at a time
+
+    Frames arrive encoded by encode_frame(..., 'gif') and each carries its
+    own palette and delay, so the writer only adds the header, the loop
+    block and the trailer and never holds more than the frame it is given.
+    """
+
+    fmt = 'gif'
+
+    def __init__(self, path: str, size: Tuple[int, int], loop: int = 0):
+        """
+        Args:
+            path: Output file
+            size: (width, height) of the frames in pixels
+            loop: Times to repeat (0 repeats forever)
+        """
+        self.path = path
+        self.frames = 0
+        self._file = open(path, 'wb')
+        width, height = size
+        # Logical screen without a global color table
+        self._file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0, 0, 0))
+        # NETSCAPE2.0 application extension: the loop count
+        self._file.write(b'!\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+
+    def write(self, frame: bytes):
+        self._file.write(frame)
+        self.frames += 1
+
+    def close(self):
+        """Finish the file; a GIF without frames is removed"""
+        if not self._file.closed:
+            self._file.write(b';')
+            self._file.close()
+            if not self.frames:
+                os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+def _png_chunks(data: bytes) -> Iterator[Tuple[bytes, bytes]]:
+    """(type, body) of every chunk of a PNG file"""
+    position = 8  # after the signature
+    while position < len(data):
+        length, kind = struct.unpack_from('>I4s', data, position)
+        yield kind, data[position + 8:position + 8 + length]
+        position += 12 + length
+
+
+def _png_chunk(kind: bytes, body: bytes) -> bytes:
+    return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+
+
+class ApngWriter:
+    """
+    Animated PNG written one frame at a time
+
+    Frames arrive as PNG files (encode_frame(..., 'png')) of one size. The
+    first frame's image data is kept as IDAT, so viewers without APNG
+    support show it. Later frames are rewrapped as fdAT chunks. The frame
+    count in the acTL chunk is filled in on close.
+    """
+
+    fmt = 'png'
+
+    def __init__(self, path: str, fps: float, loop: int = 0):
+        """
+        Args:
+            path: Output file
+            fps: Playback rate
+            loop: Times to play (0 plays forever)
+        """
+        self.path = path
+        self.frames = 0
+        self.loop = loop
+        self.delay_ms = int(round(1000 / fps))
+        self._sequence = 0
+        self._actl_offset = None
+        self._file = open(path, 'wb')
+
+    def write(self, frame: bytes):
+        chunks = list(_png_chunks(frame))
+        header = dict(chunks)[b'IHDR']
+        if self.frames == 0:
+            self._file.write(frame[:8] + _png_chunk(b'IHDR', header))
+            self._actl_offset = self._file.tell()
+            self._file.write(self._actl())
+        width, height = struct.unpack_from('>II', header)
+        self._file.write(_png_chunk(b'fcTL', struct.pack(
+            '>IIIIIHHBB', self._next_sequence(), width, height, 0, 0,
+            self.delay_ms, 1000, 0, 0)))  # no disposal, replace the canvas
+        for kind, body in chunks:
+            if kind != b'IDAT':
+                continue
+            if self.frames == 0:
+                self._file.write(_png_chunk(b'IDAT', body))
+            else:
+                self._file.write(_png_chunk(b'fdAT', struct.pack('>I', self._next_sequence()) + body))
+        self.frames += 1
+
+    def close(self):
+        """Finish the file with the final frame count; one without frames is removed"""
+        if self._file.closed:
+            return
+        if self.frames:
+            self._file.write(_png_chunk(b'IEND', b''))
+            self._file.seek(self._actl_offset)
+            self._file.write(self._actl())
+        self._file.close()
+        if not self.frames:
+            os.remove(self.path)
+
+    def _actl(self) -> bytes:
+        return _png_chunk(b'acTL', struct.pack('>II', self.frames, self.loop))
+
+    def _next_sequence(self) -> int:
+        self._sequence += 1
+        return self._sequence - 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+class ImageSequenceWriter:
+    """
+    One PNG file per frame
+
+    `pattern` is formatted with the frame number, e.g. 'frames/orbit_{:05d}.png'.
+    """
+
+    fmt = 'png'
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.frames = 0
+        directory = os.path.dirname(pattern)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, frame: bytes):
+        with open(self.pattern.format(self.frames), 'wb') as f:
+            f.write(frame)
+        self.frames += 1
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def open_writer(path: str, size: Tuple[int, int], fps: float):
+    """The frame writer for `path`, chosen by its extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Unknown export format '{extension}'; use one of {sorted(FORMATS)}")
+    if FORMATS[extension] == 'gif':
+        return GifWriter(path, size)
+    if FORMATS[extension] == 'apng':
+        return ApngWriter(path, fps)
+    if '{' not in path:
+        path = os.path.splitext(path)[0] + '_{:05d}' + extension
+    return ImageSequenceWriter(path)
+
+
+def animation_states(simulator: OrbitalSimulator, n_frames: int, time_per_frame: float,
+                     cancel: Optional[threading.Event] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Step the simulator through an animation and collect every frame's state
+
+    Returns (times, positions, velocities) of shapes (F + 1,), (F + 1, N, 3)
+    and (F + 1, N, 3); index 0 is the state before the first frame, where
+    the trails start. Setting `cancel` stops early with fewer frames.
+    """
+    animation_data = simulator.create_animation_data()
+    states = [animation_data['previous']]
+    for _ in range(n_frames):
+        if cancel is not None and cancel.is_set():
+            break
+        states.append(simulator.next_animation_state(animation_data, time_per_frame))
+    times = np.array([state.time for state in states])
+    positions = np.array([state.positions for state in states]).reshape(len(states), -1, 3)
+    velocities = np.array([state.velocities for state in states]).reshape(len(states), -1, 3)
+    return times, positions, velocities
+
+
+class FrameRenderer:
+    """One Agg figure and scene that draws any frame of an exported animation"""
+
+    def __init__(self, bodies, times: np.ndarray, positions: np.ndarray, velocities: np.ndarray,
+                 use_3d: bool, fmt: str, fps: float, figsize=DEFAULT_FIGSIZE, dpi: int = DEFAULT_DPI,
+                 max_trajectory_points: int = 1000):
+        """
+        Args:
+            bodies: The animated bodies (only their names and looks are used)
+            times, positions, velocities: Output of animation_states
+            use_3d: Whether to draw a 3D view
+            fmt: Frame encoding, 'gif' or 'png' (see encode_frame)
+            fps: Playback rate, for the GIF frame delay
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.simulator = OrbitalSimulator(bodies, record_trajectories=False)  # draws, never steps
+        self.names = tuple(body.name for body in bodies)
+        self.times, self.positions, self.velocities = times, positions, velocities
+        self.fmt = fmt
+        self.duration_ms = int(round(1000 / fps))
+        self.max_trajectory_points = max_trajectory_points
+        self.limit = np.max(np.abs(positions)) / AU * 1.2 if positions.size else 1.0
+
+        self.fig = Figure(figsize=figsize, dpi=dpi, facecolor='black')
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111, projection='3d' if use_3d else None)
+        self.ax.set_facecolor('black')
+
+    def draw(self, index: int) -> np.ndarray:
+        """Draw frame `index` (1 to F) and return it as (H, W, 3) uint8"""
+        start = max(0, index + 1 - self.max_trajectory_points)
+        trails = {name: self.positions[start:index + 1, i] for i, name in enumerate(self.names)}
+        state = StateSnapshot(self.times[index], self.names, self.positions[index],
+                              self.velocities[index])
+        renderer = self.simulator.draw_scene(self.ax, trails, self.max_trajectory_points,
+                                             styled=True, state=state)
+        self.simulator._label_animation_frame(self.ax, renderer, state.time)
+        if not renderer.use_3d:
+            self.ax.set_title('🌌 Realistic 2D Orbital Animation', color='white', fontsize=14, pad=20)
+
+        # One view for the whole export, whichever frames this process draws
+        self.ax.set_xlim(-self.limit, self.limit)
+        self.ax.set_ylim(-self.limit, self.limit)
+        if renderer.use_3d:
+            self.ax.set_zlim(-self.limit, self.limit)
+
+        self.fig.canvas.draw()
+        return np.asarray(self.fig.canvas.buffer_rgba())[..., :3]
+
+    def render(self, index: int) -> bytes:
+        """Draw and encode frame `index`"""
+        return encode_frame(self.draw(index), self.fmt, self.duration_ms)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.fig.canvas.get_width_height()
+
+
+# The FrameRenderer of a worker process, set up once by the pool initializer
+_worker_renderer = None
+
+
+def _init_worker(*args):
+    global _worker_renderer
+    _worker_renderer = FrameRenderer(*args)
+
+
+def _render_in_worker(index: int) -> bytes:
+    return _worker_renderer.render(index)
+
+
+def render_frames(scene: Sequence, indices: range, workers: int = 1,
+                  start_method: Optional[str] = None) -> Iterator[bytes]:
+    """
+    Yield encoded frames in order
+
+    Args:
+        scene: FrameRenderer arguments, sent once to each worker
+        indices: Frames to render
+        workers: Worker processes (1 renders in this process)
+        start_method: multiprocessing start method for the workers
+            (None is the platform default; use 'spawn' from threaded programs)
+    """
+    if workers <= 1:
+        renderer = FrameRenderer(*scene)
+        for index in indices:
+            yield renderer.render(index)
+        return
+
+    context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                             initargs=tuple(scene)) as pool:
+        pending = deque()
+        upcoming = iter(indices)
+        try:
+            for index in upcoming:
+                pending.append(pool.submit(_render_in_worker, index))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:  # stopped early: drop the frames not yet started
+                future.cancel()
+
+
+def export_animation(simulator: OrbitalSimulator, path: str, n_frames: int, fps: float = 30,
+                     time_per_frame: Optional[float] = None, use_3d: Optional[bool] = None,
+                     workers: Optional[int] = None, figsize=DEFAULT_FIGSIZE, dpi: int = DEFAULT_DPI,
+                     start_method: Optional[str] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     cancel: Optional[threading.Event] = None) -> int:
+    """
+    Render `n_frames` of the simulator's animation to a GIF, APNG or PNG sequence
+
+    The simulator is stepped through the animation, as animate_simulation
+    does. Returns the number of frames written.
+
+    Args:
+        path: '.gif' or '.apng' file, or '.png' name for a numbered
+            sequence ('orbit.png' writes orbit_00000.png, ...; a '{:05d}'
+            style field in the name sets the numbering)
+        n_frames: Frames to render
+        fps: Playback rate
+        time_per_frame: Simulated seconds per frame (default fps * dt)
+        use_3d: Whether to draw in 3D (auto-detect if None)
+        workers: Rendering processes (default: one per CPU)
+        figsize, dpi: Frame size in inches and pixels per inch
+        start_method: See render_frames
+        progress: Called with (frames written, n_frames) after each frame
+        cancel: Event that stops the export after the frame being written
+    """
+    if time_per_frame is None:
+        time_per_frame = fps * simulator.dt
+    if use_3d is None:
+        use_3d = any(body.is_3d for body in simulator.physics_engine.bodies)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n_frames))
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    size = FigureCanvasAgg(Figure(figsize=figsize, dpi=dpi)).get_width_height()
+
+    with open_writer(path, size, fps) as writer:
+        bodies = list(simulator.physics_engine.bodies)
+        times, positions, velocities = animation_states(simulator, n_frames, time_per_frame, cancel)
+        scene = (bodies, times, positions, velocities, use_3d, writer.fmt, fps, figsize, dpi)
+        frames = render_frames(scene, range(1, len(times)), workers, start_method)
+        try:
+            for frame in frames:
+                writer.write(frame)
+                if progress is not None:
+                    progress(writer.frames, n_frames)
+                if cancel is not None and cancel.is_set():
+                    break
+        finally:
+            frames.close()
+        return writer.frames
+
+
+class ExportJob:
+    """
+    export_animation on a background thread, with progress and cancellation
+
+    The job's attributes are plain values that a UI thread can poll (e.g.
+    from a Tk after() loop) without locking; nothing here touches the UI.
+    """
+
+    def __init__(self, simulator: OrbitalSimulator, path: str, n_frames: int, **options):
+        """
+        Args:
+            simulator: Simulator to animate; the job steps it, so pass one
+                nothing else is using
+            path, n_frames, options: As for export_animation
+        """
+        self.simulator = simulator
+        self.path = path
+        self.total = n_frames
+        self.options = options
+        self.done = 0
+        self.frames_written = None  # set when the export ends
+        self.error = None
+        self.cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> 'ExportJob':
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stop after the frame being written; the frames so far are kept"""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job ends (for scripts and tests); returns finished"""
+        self._thread.join(timeout)
+        return self.finished
+
+    def _progress(self, done: int, total: int):
+        self.done = done
+
+    def _run(self):
+        try:
+            self.frames_written = export_animation(self.simulator, self.path, self.total,
+                                                   progress=self._progress,
+                                                   cancel=self.cancel_event, **self.options)
+        except Exception as e:
+            self.error = e
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export an animation with parallel frame rendering")
+    parser.add_argument('--scenario', default='realistic_space_scene')
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--fps', type=float, default=24)
+    parser.add_argument('--days-per-frame', type=float, default=2.0)
+    parser.add_argument('--dt-hours', type=float, default=24.0)
+    parser.add_argument('--workers', type=int, default=None, help="default: one per CPU")
+    parser.add_argument('--size', type=float, nargs=2, default=[8, 6], help="inches")
+    parser.add_argument('--2d', dest='flat', action='store_true')
+    parser.add_argument('--output', default='orbit_export.gif')
+    args = parser.parse_args()
+
+    print("🎞️ Parallel Frame Export")
+    print("=" * 30)
+    simulator = OrbitalSimulator([], dt=args.dt_hours * 3600)
+    simulator.load_scenario(args.scenario)
+    workers = args.workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    frames = export_animation(simulator, args.output, args.frames, args.fps,
+                              time_per_frame=args.days_per_frame * 86400,
+                              use_3d=not args.flat, workers=workers, figsize=tuple(args.size))
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {frames} frames to {args.output} with {workers} worker(s) in {elapsed:.1f} s "
+          f"({frames / elapsed:.1f} frames/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+Frame Streaming Server
+Runs a simulation headless and streams packed binary frames over TCP
+
+Wire protocol (all integers little-endian):
+    Every message starts with an envelope: kind (uint8), payload length (uint32)
+    MSG_INFO   payload is UTF-8 JSON: scenario, body names, dt, paused, fps
+    MSG_FRAME  payload is a FRAME_HEADER followed by n_bodies * 3 float32
+               positions in AU; with FLAG_DELTA set they are differences from
+               the previous frame sent on the same connection
+Clients send newline-delimited JSON control messages, e.g.
+    {"cmd": "pause"}  {"cmd": "resume"}  {"cmd": "dt", "value": 1800}
+    {"cmd": "scenario", "name": "realistic"}
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import struct
+from typing import Optional, Set
+
+import numpy as np
+
+import scenarios
+from orbital_simulator import OrbitalSimulator, AU
+from simulation_service import AsyncSimulationRunner, FrameSubscriber
+
+PROTOCOL_VERSION = 1
+FRAME_MAGIC = b'ORBF'
+ENVELOPE = struct.Struct('<BI')
+FRAME_HEADER = struct.Struct('<4sBBIId')  # magic, version, flags, n_bodies, index, time
+
+MSG_INFO = 1
+MSG_FRAME = 2
+FLAG_DELTA = 0x01
+
+# Short names accepted alongside the scenario registry's own
+SCENARIO_ALIASES = {'realistic': 'realistic_space_scene'}
+
+_INFO_CHANGED = object()  # Queued to wake senders when the info message changes
+
+
+class FrameEncoder:
+    """
+    Packs positions into frame messages for one connection
+
+    Delta frames are closed-loop: the encoder tracks exactly what the client
+    has reconstructed, so float32 rounding never accumulates. A full keyframe
+    is sent every `keyframe_interval` frames and after reset().
+    """
+
+    def __init__(self, delta: bool = False, keyframe_interval: int = 30):
+        self.delta = delta
+        self.keyframe_interval = keyframe_interval
+        self.reference = None
+        self.frames_since_keyframe = 0
+
+    def reset(self):
+        """Force the next frame to be a keyframe"""
+        self.reference = None
+
+    def encode(self, index: int, time: float, positions: np.ndarray) -> bytes:
+        """Encode (N, 3) float32 positions as a MSG_FRAME message"""
+        keyframe = (not self.delta or self.reference is None
+                    or self.reference.shape != positions.shape
+                    or self.frames_since_keyframe >= self.keyframe_interval)
+        if keyframe:
+            payload = positions
+            flags = 0
+            self.reference = positions.copy()
+            self.frames_since_keyframe = 0
+        else:
+            payload = positions - self.reference
+            flags = FLAG_DELTA
+            self.reference += payload
+            self.frames_since_keyframe += 1
+
+        header = FRAME_HEADER.pack(FRAME_MAGIC, PROTOCOL_VERSION, flags,
+                                   len(positions), index, time)
+        body = header + payload.astype('<f4', copy=False).tobytes()
+        return ENVELOPE.pack(MSG_FRAME, len(body)) + body
+
+
+class FrameDecoder:
+    """Reverses FrameEncoder for one connection"""
+
+    def __init__(self):
+        self.reference = None
+
+    def decode(self, payload: bytes):
+        """Decode a MSG_FRAME payload into (index, time, positions in AU)"""
+        magic, version, flags, n_bodies, index, time = FRAME_HEADER.unpack_from(payload)
+        if magic != FRAME_MAGIC or version != PROTOCOL_VERSION:
+            raise ValueError("Not an orbital frame (bad magic or version)")
+
+        values = np.frombuffer(payload, dtype='<f4', offset=FRAME_HEADER.size).reshape(n_bodies, 3)
+        if flags & FLAG_DELTA:
+            if self.reference is None:
+                raise ValueError("Delta frame received before a keyframe")
+            self.reference = self.reference + values
+        else:
+            self.reference = values.astype(np.float32)
+        return index, time, self.reference
+
+
+class _ClientConnection:
+    """Per-connection state: its own frame queue and encoder"""
+
+    def __init__(self, writer: asyncio.StreamWriter, delta: bool, keyframe_interval: int,
+                 queue_size: int):
+        self.writer = writer
+        self.frames = FrameSubscriber(queue_size)
+        self.encoder = FrameEncoder(delta, keyframe_interval)
+        self.info_version = -1
+
+
+class FrameServer:
+    """TCP server that streams one shared simulation to many viewers"""
+
+    def __init__(self, scenario: str = 'realistic', dt: float = 3600.0, fps: float = 30.0,
+                 steps_per_frame: int = 1, delta: bool = False, keyframe_interval: int = 30,
+                 host: str = '127.0.0.1', port: int = 8765):
+        """
+        Initialize the server
+
+        Args:
+            scenario: Initial scenario name (see scenarios.SCENARIOS)
+            dt: Physics time step in seconds
+            fps: Frames streamed per wall-clock second
+            steps_per_frame: Physics steps between frames
+            delta: Send delta-encoded frames between keyframes
+            keyframe_interval: Frames between full keyframes in delta mode
+            host, port: Address to listen on (port 0 picks a free port)
+        """
+        # The server runs without end and streams positions only, so keep no trails
+        self.simulator = OrbitalSimulator([], dt=dt, record_trajectories=False)
+        self.runner = AsyncSimulationRunner(self.simulator, steps_per_batch=steps_per_frame,
+                                            frame_interval=1.0 / fps)
+        self.fps = fps
+        self.delta = delta
+        self.keyframe_interval = keyframe_interval
+        self.host = host
+        self.port = port
+        self.scenario = None
+        self.clients: Set[_ClientConnection] = set()
+        self.frame_index = 0
+        self.info_version = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks = []
+
+        self.set_scenario(scenario)
+
+    def info(self) -> dict:
+        """Describe the current stream for clients"""
+        return {
+            'type': 'info',
+            'protocol': PROTOCOL_VERSION,
+            'scenario': self.scenario,
+            'names': [body.name for body in self.simulator.physics_engine.bodies],
+            'dt': self.simulator.dt,
+            'paused': self.runner.paused,
+            'fps': self.fps,
+            'delta': self.delta,
+        }
+
+    def _info_changed(self):
+        self.info_version += 1
+        for client in self.clients:
+            client.frames.put(_INFO_CHANGED)
+
+    def set_scenario(self, name: str):
+        """Replace the running system with a named scenario"""
+        self.simulator.load_scenario(SCENARIO_ALIASES.get(name, name))
+        self.simulator.time = self.simulator.physics_engine.time = 0.0
+        self.scenario = name
+        self._info_changed()
+
+    def handle_control(self, message: dict):
+        """Apply one control message from a client"""
+        command = message.get('cmd')
+        if command == 'pause':
+            self.runner.pause()
+        elif command == 'resume':
+            self.runner.resume()
+        elif command == 'dt':
+            value = float(message['value'])
+            if not (math.isfinite(value) and value > 0):
+                raise ValueError("dt must be a positive number of seconds")
+            self.simulator.dt = value
+        elif command == 'scenario':
+            self.set_scenario(message['name'])
+            return  # set_scenario already notified clients
+        else:
+            raise ValueError(f"Unknown command '{command}'")
+        self._info_changed()
+
+    async def _fan_out(self, source: FrameSubscriber):
+        """Convert each snapshot to float32 once and hand it to every client"""
+        async for snapshot in source:
+            positions = (snapshot.positions / AU).astype(np.float32)
+            frame = (self.frame_index, snapshot.time, positions)
+            self.frame_index += 1
+            for client in self.clients:
+                client.frames.put(frame)
+        for client in list(self.clients):
+            client.frames.close()
+
+    async def _send_frames(self, client: _ClientConnection, writer: asyncio.StreamWriter):
+        """Write queued frames to one client; a slow client only drops its own frames"""
+        while True:
+            if client.info_version != self.info_version:
+                client.info_version = self.info_version
+                client.encoder.reset()
+                writer.write(_encode_info(self.info()))
+
+            item = await client.frames.get()
+            if item is None:
+                break
+            if item is _INFO_CHANGED:
+                continue
+            if client.info_version != self.info_version:
+                continue  # Frame from before a scenario change; send info first
+            writer.write(client.encoder.encode(*item))
+            await writer.drain()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = _ClientConnection(writer, self.delta, self.keyframe_interval, queue_size=2)
+        self.clients.add(client)
+        sender = asyncio.create_task(self._send_frames(client, writer))
+        try:
+            while not sender.done():
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    self.handle_control(json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    writer.write(_encode_info({'type': 'error', 'message': str(e)}))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.clients.discard(client)
+            client.frames.close()
+            sender.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    async def start(self):
+        """Start listening and stepping; returns once the socket is bound"""
+        source = self.runner.subscribe(maxsize=2, name="frame-server")
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tasks = [asyncio.create_task(self.runner.run()),
+                       asyncio.create_task(self._fan_out(source))]
+
+    async def stop(self):
+        """Stop the simulation and close all connections"""
+        self.runner.stop()
+        if self._server is not None:
+            self._server.close()
+        for client in list(self.clients):
+            client.writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"📡 Streaming '{self.scenario}' on {self.host}:{self.port} at {self.fps:g} fps")
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            await self.stop()
+
+
+def _encode_info(info: dict) -> bytes:
+    payload = json.dumps(info).encode('utf-8')
+    return ENVELOPE.pack(MSG_INFO, len(payload)) + payload
+
+
+class FrameClient:
+    """Minimal asyncio client for FrameServer, used by viewers and tests"""
+
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.decoder = FrameDecoder()
+        self.info = None
+
+    async def connect(self, host: str = '127.0.0.1', port: int = 8765):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def read_message(self):
+        """
+        Read the next message
+
+        Returns ('info', dict) or ('frame', (index, time, positions_au))
+        """
+        kind, length = ENVELOPE.unpack(await self.reader.readexactly(ENVELOPE.size))
+        payload = await self.reader.readexactly(length)
+        if kind == MSG_INFO:
+            message = json.loads(payload)
+            if message.get('type') == 'info':
+                self.info = message
+                self.decoder = FrameDecoder()
+            return 'info', message
+        if kind == MSG_FRAME:
+            return 'frame', self.decoder.decode(payload)
+        raise ValueError(f"Unknown message kind {kind}")
+
+    async def read_frame(self):
+        """Skip info messages and return the next (index, time, positions_au)"""
+        while True:
+            kind, message = await self.read_message()
+            if kind == 'frame':
+                return message
+
+    async def send_control(self, cmd: str, **params):
+        params['cmd'] = cmd
+        self.writer.write(json.dumps(params).encode('utf-8') + b'\n')
+        await self.writer.drain()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _watch(host: str, port: int, frames: int):
+    client = FrameClient()
+    await client.connect(host, port)
+    for _ in range(frames):
+        kind, message = await client.read_message()
+        if kind == 'info':
+            print(f"ℹ️  {message}")
+        else:
+            index, time, positions = message
+            print(f"  frame {index:6d}  t = {time/86400:8.2f} days  {len(positions)} bodies")
+    await client.close()
+
+
+def main():
+    """Run the frame server, or watch one with --watch"""
+    parser = argparse.ArgumentParser(description="Stream a headless orbital simulation over TCP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--scenario', default='realistic',
+                        choices=sorted([*scenarios.SCENARIOS, *SCENARIO_ALIASES]))
+    parser.add_argument('--dt', type=float, default=3600.0, help="physics time step (s)")
+    parser.add_argument('--fps', type=float, default=30.0, help="frames streamed per second")
+    parser.add_argument('--steps-per-frame', type=int, default=1)
+    parser.add_argument('--delta', action='store_true', help="delta-encode frames")
+    parser.add_argument('--watch', type=int, metavar='FRAMES',
+                        help="connect as a client and print FRAMES messages")
+    args = parser.parse_args()
+
+    if args.watch:
+        asyncio.run(_watch(args.host, args.port, args.watch))
+        return
+
+    server = FrameServer(args.scenario, dt=args.dt, fps=args.fps,
+                         steps_per_frame=args.steps_per_frame, delta=args.delta,
+                         host=args.host, port=args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n⏹️ Server stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Phase Timing Instrumentation
+Low-overhead monotonic-clock timers for the physics step and drawing loops
+
+Usage:
+    from instrumentation import timings
+    timings.enable(log_interval=5.0)
+    with timings.phase('forces'):
+        ...
+    print(timings.report())
+
+Phases may nest (forces are timed inside integration). Each phase records
+its exclusive time: a nested phase's duration is subtracted from the phase
+enclosing it, so the totals of all phases add up to the timed wall time.
+
+Set ORBITAL_TIMINGS=1 (and optionally ORBITAL_TIMINGS_LOG=<seconds>) to
+enable timing at startup without code changes.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class _NullPhase:
+    """Shared no-op context manager returned while timing is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Times one `with` block and records its exclusive time under a phase name"""
+    __slots__ = ('timings', 'name', 'start', 'nested')
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+        self.nested = 0.0  # time spent in phases entered inside this one
+
+    def __enter__(self):
+        self.timings._open_phases().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        elapsed = end - self.start
+        open_phases = self.timings._open_phases()
+        open_phases.pop()
+        if open_phases:
+            open_phases[-1].nested += elapsed
+        self.timings.record(self.name, elapsed - self.nested, end)
+        return False
+
+
+class PhaseTimings:
+    """
+    Collects per-phase durations
+
+    Counts and totals are exact; percentiles are computed over the most
+    recent `window` samples of each phase.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 10000,
+                 log_interval: Optional[float] = None):
+        self.enabled = enabled
+        self.window = window
+        self.log_interval = log_interval
+        self._counts: Dict[str, int] = {}
+        self._totals: Dict[str, float] = {}
+        self._samples: Dict[str, deque] = {}
+        self._last_log = time.perf_counter()
+        self._local = threading.local()
+
+    def _open_phases(self):
+        """Stack of phases currently open on the calling thread"""
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def enable(self, log_interval: Optional[float] = None):
+        """Start timing; optionally log a summary line every `log_interval` seconds"""
+        self.enabled = True
+        if log_interval is not None:
+            self.log_interval = log_interval
+        self._last_log = time.perf_counter()
+
+    def disable(self):
+        """Stop timing; collected statistics are kept"""
+        self.enabled = False
+
+    def reset(self):
+        """Discard all collected statistics"""
+        self._counts.clear()
+        self._totals.clear()
+        self._samples.clear()
+
+    def phase(self, name: str):
+        """Context manager timing one occurrence of a phase"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def record(self, name: str, seconds: float, now: Optional[float] = None):
+        """Record one duration for a phase"""
+        if name not in self._counts:
+            self._counts[name] = 0
+            self._totals[name] = 0.0
+            self._samples[name] = deque(maxlen=self.window)
+        self._counts[name] += 1
+        self._totals[name] += seconds
+        self._samples[name].append(seconds)
+
+        if self.log_interval:
+            now = time.perf_counter() if now is None else now
+            if now - self._last_log >= self.log_interval:
+                self._last_log = now
+                logger.info(self.report())
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-phase statistics
+
+        Returns a dict mapping phase name to count, total, mean, p50, p95
+        and p99 (durations in seconds). Durations exclude nested phases.
+        """
+        result = {}
+        for name, count in self._counts.items():
+            samples = np.fromiter(self._samples[name], dtype=float)
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+            result[name] = {
+                'count': count,
+                'total': self._totals[name],
+                'mean': self._totals[name] / count,
+                'p50': float(p50),
+                'p95': float(p95),
+                'p99': float(p99),
+            }
+        return result
+
+    def report(self) -> str:
+        """One-line summary of every phase, exclusive durations in milliseconds"""
+        parts = []
+        for name, s in self.stats().items():
+            parts.append(f"{name}: n={s['count']} total={s['total']*1e3:.1f}ms "
+                         f"p50={s['p50']*1e3:.3f} p95={s['p95']*1e3:.3f} p99={s['p99']*1e3:.3f}")
+        return "timings | " + " | ".join(parts) if parts else "timings | no samples"
+
+
+# Process-wide timer used by the simulator and GUIs
+timings = PhaseTimings()
+
+if os.environ.get('ORBITAL_TIMINGS', '').lower() in ('1', 'true', 'yes'):
+    _log_interval = os.environ.get('ORBITAL_TIMINGS_LOG')
+    if _log_interval:
+        logging.basicConfig(level=logging.INFO)
+    timings.enable(float(_log_interval) if _log_interval else None)
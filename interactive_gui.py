@@ -3,16 +3,26 @@ Interactive GUI for Orbital Mechanics Simulator
 User-friendly interface for both professionals and general users
 """
 
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, simpledialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-import numpy as np
-from orbital_simulator import OrbitalSimulator, CelestialBody, SUN_MASS, EARTH_MASS, AU
-import json
+from orbital_simulator import OrbitalSimulator, CelestialBody
+from instrumentation import timings
+from render_scheduler import RenderScheduler
+from simulation_service import LatestState, SteppingController
+from scenarios import GUI_SCENARIOS
+from snapshot import save_snapshot, load_snapshot
+from data_export import export_trajectories
+from frame_export import FORMATS, ExportJob
 import threading
 import time
+import launcher
+
+BASE_RATE = 86400.0  # simulated seconds per wall second at 1x speed
+EXPORT_FPS = 30
 
 class OrbitalMechanicsGUI:
     def __init__(self, root):
@@ -25,11 +35,19 @@ class OrbitalMechanicsGUI:
         self.simulator = None
         self.is_running = False
         self.simulation_thread = None
+        self.stepping = None  # SteppingController of the current run
+        self.latest_state = LatestState()  # what the Tk thread draws; see publish_state
+        self.export_job = None  # ExportJob of the last animation export
         
         # Create GUI elements
         self.create_widgets()
         self.create_menu()
         
+        # Redraws requested by the simulation thread, paced on the Tk thread
+        self.render_scheduler = RenderScheduler(self.root, lambda: self.update_visualization(idle=True),
+                                                max_fps=30)
+        self.render_scheduler.start()
+        
     def create_widgets(self):
         """Create the main GUI widgets"""
         # Main frame
@@ -87,7 +105,7 @@ class OrbitalMechanicsGUI:
         ttk.Label(sim_frame, text="Simulation Speed:").pack(anchor=tk.W)
         self.speed_var = tk.DoubleVar(value=1.0)
         speed_scale = ttk.Scale(sim_frame, from_=0.1, to=10.0, variable=self.speed_var, 
-                               orient=tk.HORIZONTAL)
+                               orient=tk.HORIZONTAL, command=self.on_speed_change)
         speed_scale.pack(fill=tk.X, pady=(0, 10))
         
         # Control buttons
@@ -117,6 +135,10 @@ class OrbitalMechanicsGUI:
         self.realistic_mode = tk.BooleanVar(value=True)
         ttk.Checkbutton(vis_frame, text="Realistic Appearance", variable=self.realistic_mode).pack(anchor=tk.W)
         
+        self.flat_view = tk.BooleanVar(value=False)
+        ttk.Checkbutton(vis_frame, text="2D View (fast redraw)", variable=self.flat_view,
+                        command=self.on_view_change).pack(anchor=tk.W)
+        
         # Planet information
         info_frame = ttk.LabelFrame(parent, text="Planet Information", padding=10)
         info_frame.pack(fill=tk.BOTH, expand=True)
@@ -158,7 +180,8 @@ class OrbitalMechanicsGUI:
         file_menu.add_command(label="Export Animation", command=self.export_animation)
         file_menu.add_command(label="Export Data", command=self.export_data)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        # Destroy only this window: as a hub tool it shares the Tk mainloop
+        file_menu.add_command(label="Exit", command=lambda: launcher.close_window(self.root, self))
         
         # Tools menu
         tools_menu = tk.Menu(menubar, tearoff=0)
@@ -166,6 +189,8 @@ class OrbitalMechanicsGUI:
         tools_menu.add_command(label="Planet Builder", command=self.open_planet_builder)
         tools_menu.add_command(label="Orbit Calculator", command=self.open_orbit_calculator)
         tools_menu.add_command(label="Collision Simulator", command=self.open_collision_simulator)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Performance Timings", command=self.show_performance_timings)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -181,80 +206,25 @@ class OrbitalMechanicsGUI:
         
     def create_scenario(self, scenario_name):
         """Create the selected scenario"""
-        if scenario_name == "Complete Solar System":
-            self.simulator = OrbitalSimulator([], dt=self.dt_var.get() * 3600)
-            self.simulator.create_realistic_space_scene()
-            
-        elif scenario_name == "Inner Planets Only":
-            self.simulator = OrbitalSimulator([], dt=self.dt_var.get() * 3600)
-            self.create_inner_planets()
-            
-        elif scenario_name == "Gas Giants Only":
-            self.simulator = OrbitalSimulator([], dt=self.dt_var.get() * 3600)
-            self.create_gas_giants()
-            
-        elif scenario_name == "Earth-Moon System":
-            self.simulator = OrbitalSimulator([], dt=self.dt_var.get() * 3600)
-            self.create_earth_moon_system()
-            
-        elif scenario_name == "Binary Star System":
+        if scenario_name in GUI_SCENARIOS:
             self.simulator = OrbitalSimulator([], dt=self.dt_var.get() * 3600)
-            self.create_binary_star_system()
+            self.simulator.load_scenario(GUI_SCENARIOS[scenario_name])
             
         elif scenario_name == "Custom System":
             self.open_planet_builder()
-            
-    def create_inner_planets(self):
-        """Create inner planets scenario"""
-        sun = CelestialBody("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 25, '#FFD700', is_3d=True)
-        mercury = CelestialBody("Mercury", EARTH_MASS * 0.055, [0.39 * AU, 0, 0], 
-                               [0, 47870, 0], 4, '#8C7853', is_3d=True)
-        venus = CelestialBody("Venus", EARTH_MASS * 0.815, [0.72 * AU, 0, 0], 
-                             [0, 35020, 0], 7, '#FF8C00', is_3d=True)
-        earth = CelestialBody("Earth", EARTH_MASS, [1.0 * AU, 0, 0], 
-                             [0, 29780, 0], 8, '#4169E1', is_3d=True)
-        mars = CelestialBody("Mars", EARTH_MASS * 0.107, [1.52 * AU, 0, 0], 
-                            [0, 24077, 0], 6, '#CD5C5C', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [sun, mercury, venus, earth, mars]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
-        
-    def create_gas_giants(self):
-        """Create gas giants scenario"""
-        sun = CelestialBody("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 30, '#FFD700', is_3d=True)
-        jupiter = CelestialBody("Jupiter", EARTH_MASS * 317.8, [5.2 * AU, 0, 0], 
-                               [0, 13070, 0], 25, '#D2691E', is_3d=True)
-        saturn = CelestialBody("Saturn", EARTH_MASS * 95.2, [9.58 * AU, 0, 0], 
-                              [0, 9680, 0], 22, '#F4A460', is_3d=True)
-        uranus = CelestialBody("Uranus", EARTH_MASS * 14.5, [19.2 * AU, 0, 0], 
-                              [0, 6800, 0], 15, '#4FD0E7', is_3d=True)
-        neptune = CelestialBody("Neptune", EARTH_MASS * 17.1, [30.1 * AU, 0, 0], 
-                               [0, 5430, 0], 15, '#4169E1', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [sun, jupiter, saturn, uranus, neptune]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
-        
-    def create_earth_moon_system(self):
-        """Create Earth-Moon system"""
-        earth = CelestialBody("Earth", EARTH_MASS, [0, 0, 0], [0, 0, 0], 10, '#4169E1', is_3d=True)
-        moon = CelestialBody("Moon", 7.342e22, [3.844e8, 0, 0], 
-                            [0, 1022, 0], 3, '#C0C0C0', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [earth, moon]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
-        
-    def create_binary_star_system(self):
-        """Create binary star system"""
-        star1 = CelestialBody("Star 1", SUN_MASS, [-0.5 * AU, 0, 0], 
-                             [0, 15000, 0], 20, '#FFD700', is_3d=True)
-        star2 = CelestialBody("Star 2", SUN_MASS * 0.8, [0.5 * AU, 0, 0], 
-                             [0, -15000, 0], 18, '#FFA500', is_3d=True)
-        planet = CelestialBody("Planet", EARTH_MASS, [2 * AU, 0, 0.3 * AU], 
-                              [0, 12000, 2000], 6, '#87CEEB', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [star1, star2, planet]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
         
+        if self.simulator is not None:
+            self.publish_state()
+    
+    def publish_state(self):
+        """
+        Hand the simulator's current state to the Tk thread
+        
+        The Tk thread never reads the bodies the simulation thread is
+        stepping, only the latest published snapshot.
+        """
+        self.latest_state.publish(self.simulator.snapshot(trajectories=True))
+            
     def start_simulation(self):
         """Start the simulation"""
         if self.simulator is None:
@@ -264,7 +234,12 @@ class OrbitalMechanicsGUI:
         self.start_button.config(state=tk.DISABLED)
         self.pause_button.config(state=tk.NORMAL)
         
+        # A paused run's thread may still be finishing its last batch
+        if self.simulation_thread and self.simulation_thread.is_alive():
+            self.simulation_thread.join(timeout=1)
+        
         # Start simulation in separate thread
+        self.stepping = SteppingController(self.simulator, self.speed_var.get() * BASE_RATE)
         self.simulation_thread = threading.Thread(target=self.run_simulation_loop)
         self.simulation_thread.daemon = True
         self.simulation_thread.start()
@@ -278,75 +253,63 @@ class OrbitalMechanicsGUI:
     def reset_simulation(self):
         """Reset the simulation"""
         self.is_running = False
+        # Let the last step finish so it cannot publish after the reset
+        if self.simulation_thread and self.simulation_thread.is_alive():
+            self.simulation_thread.join(timeout=1)
         self.create_scenario(self.scenario_var.get())
         self.update_visualization()
         self.start_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED)
         
     def run_simulation_loop(self):
-        """Run the simulation loop"""
+        """Step the simulation in batches at the speed set by the slider"""
+        stepping = self.stepping
         while self.is_running:
-            if self.simulator:
-                self.simulator.step()
-                self.root.after(0, self.update_visualization)
-                time.sleep(0.1 / self.speed_var.get())  # Adjust speed
+            if self.simulator is None:
+                time.sleep(0.1)
+                continue
+            stepping.simulator = self.simulator  # follows scenario changes
+            if stepping.tick():
+                self.publish_state()
+                self.render_scheduler.request()
+            # Short sleeps keep pausing and speed changes responsive
+            time.sleep(min(stepping.wait_time(), 0.05))
+    
+    def on_speed_change(self, value):
+        """Apply the speed slider to the running simulation"""
+        if self.stepping is not None:
+            self.stepping.rate = self.speed_var.get() * BASE_RATE
                 
-    def update_visualization(self):
-        """Update the visualization"""
-        if self.simulator is None:
-            return
+    def update_visualization(self, idle=False):
+        """Update the visualization (idle=True defers a full redraw with draw_idle)"""
+        with timings.phase('draw'):
+            state = self.latest_state.get()
+            if self.simulator is None or state is None:
+                return
             
-        self.ax.clear()
+            trajectories = state.trajectories if self.show_trajectories.get() else None
+            renderer = self.simulator.draw_scene(self.ax, trajectories, max_trajectory_points=500,
+                                                 realistic=self.realistic_mode.get(),
+                                                 show_labels=self.show_labels.get(),
+                                                 blit=self.flat_view.get(), state=state)
+            title = f'🌌 Orbital Mechanics Simulator (t = {state.time/86400:.1f} days'
+            if self.is_running:
+                title += f', {self.render_scheduler.fps:.0f} FPS'
+                if self.stepping.behind:
+                    title += f', ⚠️ running at {self.stepping.achieved_rate / 86400:.1f} days/s'
+            self.ax.set_title(title + ')', color='white', fontsize=12)
+        
+            renderer.draw(idle)  # blits only the moving artists in the 2D view
+    
+    def on_view_change(self):
+        """Switch between the 3D view and the blitted 2D view"""
+        self.fig.clear()
+        if self.flat_view.get():
+            self.ax = self.fig.add_subplot(111)
+        else:
+            self.ax = self.fig.add_subplot(111, projection='3d')
         self.ax.set_facecolor('black')
-        
-        # Add starfield
-        self.simulator._add_starfield(self.ax, True)
-        
-        # Plot trajectories if enabled
-        if self.show_trajectories.get():
-            for body_name, trajectory in self.simulator.trajectories.items():
-                if len(trajectory) > 1:
-                    recent_trajectory = trajectory[-500:]  # Limit for performance
-                    trajectory_array = np.array(recent_trajectory)
-                    trajectory_au = trajectory_array / AU
-                    
-                    traj_color = self.simulator._get_trajectory_color(body_name)
-                    self.ax.plot(trajectory_au[:, 0], trajectory_au[:, 1], trajectory_au[:, 2],
-                               alpha=0.6, linewidth=1, color=traj_color)
-        
-        # Plot bodies
-        for body in self.simulator.physics_engine.bodies:
-            pos_au = body.position / AU
-            body_color, body_size = self.simulator._get_realistic_body_properties(body)
-            
-            if self.realistic_mode.get():
-                self.simulator._plot_realistic_body_3d(self.ax, pos_au, body_color, body_size, body.name)
-            else:
-                self.ax.scatter(pos_au[0], pos_au[1], pos_au[2], 
-                              s=body_size**2, c=body_color, alpha=0.9)
-            
-            # Add labels if enabled
-            if self.show_labels.get():
-                self.ax.text(pos_au[0], pos_au[1], pos_au[2], body.name, 
-                           color='white', fontsize=8)
-        
-        # Set axis properties
-        self.ax.set_xlabel('X Position (AU)', color='white')
-        self.ax.set_ylabel('Y Position (AU)', color='white')
-        self.ax.set_zlabel('Z Position (AU)', color='white')
-        self.ax.set_title(f'🌌 Orbital Mechanics Simulator (t = {self.simulator.time/86400:.1f} days)', 
-                         color='white', fontsize=12)
-        
-        # Set axis limits
-        all_positions = [body.position / AU for body in self.simulator.physics_engine.bodies]
-        if all_positions:
-            positions_array = np.array(all_positions)
-            max_coord = np.max(np.abs(positions_array)) * 1.2
-            self.ax.set_xlim(-max_coord, max_coord)
-            self.ax.set_ylim(-max_coord, max_coord)
-            self.ax.set_zlim(-max_coord, max_coord)
-        
-        self.canvas.draw()
+        self.update_visualization()
         
     def update_planet_info(self):
         """Update planet information display"""
@@ -401,69 +364,59 @@ class OrbitalMechanicsGUI:
         self.info_text.insert(1.0, info_text)
         
     def save_simulation(self):
-        """Save current simulation state"""
-        if self.simulator is None:
+        """Save the current simulation, including its trajectories, as a binary snapshot"""
+        state = self.latest_state.get()
+        if self.simulator is None or state is None:
             messagebox.showwarning("Warning", "No simulation to save!")
             return
             
         filename = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            defaultextension=".npz",
+            filetypes=[("Simulation snapshots", "*.npz"), ("All files", "*.*")]
         )
         
         if filename:
-            # Save simulation data
-            data = {
-                'bodies': [],
-                'time': self.simulator.time,
-                'dt': self.simulator.dt
-            }
-            
-            for body in self.simulator.physics_engine.bodies:
-                body_data = {
-                    'name': body.name,
-                    'mass': body.mass,
-                    'position': body.position.tolist(),
-                    'velocity': body.velocity.tolist(),
-                    'radius': body.radius,
-                    'color': body.color,
-                    'is_3d': body.is_3d
-                }
-                data['bodies'].append(body_data)
-            
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            messagebox.showinfo("Success", f"Simulation saved to {filename}")
+            try:
+                save_snapshot(filename, self._simulator_from_state(state))
+                messagebox.showinfo("Success", f"Simulation saved to {filename}")
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to save simulation: {str(e)}")
             
+    def _simulator_from_state(self, state, trajectories=True):
+        """
+        A simulator of its own at a published state, for saving and exporting
+        
+        The state carries the bodies' names, masses and motion; their looks
+        come from the current bodies of the same name. With trajectories the
+        state's frozen trails come along; without, none are recorded.
+        """
+        looks = {body.name: body for body in self.simulator.physics_engine.bodies}
+        bodies = []
+        for name, mass, position, velocity in zip(state.names, state.masses,
+                                                  state.positions, state.velocities):
+            body = CelestialBody(name, float(mass), position, velocity)
+            look = looks.get(name)
+            if look is not None:
+                body.radius, body.color, body.is_3d = look.radius, look.color, look.is_3d
+            bodies.append(body)
+        
+        simulator = OrbitalSimulator(bodies, dt=self.simulator.dt, record_trajectories=trajectories)
+        simulator.time = simulator.physics_engine.time = state.time
+        if trajectories and state.trajectories is not None:
+            simulator.trajectories = state.trajectories
+        return simulator
+    
     def load_simulation(self):
-        """Load simulation from file"""
+        """Load a simulation snapshot"""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("Simulation snapshots", "*.npz"), ("All files", "*.*")]
         )
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                
-                # Recreate bodies
-                bodies = []
-                for body_data in data['bodies']:
-                    body = CelestialBody(
-                        name=body_data['name'],
-                        mass=body_data['mass'],
-                        position=body_data['position'],
-                        velocity=body_data['velocity'],
-                        radius=body_data['radius'],
-                        color=body_data['color'],
-                        is_3d=body_data['is_3d']
-                    )
-                    bodies.append(body)
-                
-                # Create new simulator
-                self.simulator = OrbitalSimulator(bodies, dt=data['dt'])
-                self.simulator.time = data['time']
+                self.simulator = load_snapshot(filename)
+                self.dt_var.set(self.simulator.dt / 3600)
+                self.publish_state()
                 
                 messagebox.showinfo("Success", f"Simulation loaded from {filename}")
                 self.update_visualization()
@@ -472,47 +425,125 @@ class OrbitalMechanicsGUI:
                 messagebox.showerror("Error", f"Failed to load simulation: {str(e)}")
                 
     def export_animation(self):
-        """Export animation as GIF"""
-        if self.simulator is None:
+        """
+        Export an animation of the current scenario in the background
+        
+        Frames are rendered offscreen from a copy of the latest state, at
+        the speed and view shown, and streamed to the file as they finish.
+        A progress window polls the job, so the Tk loop never waits on it.
+        """
+        state = self.latest_state.get()
+        if self.simulator is None or state is None:
             messagebox.showwarning("Warning", "No simulation to export!")
             return
+        if self.export_job is not None and not self.export_job.finished:
+            messagebox.showinfo("Export Animation", "An animation export is already running.")
+            return
             
         filename = filedialog.asksaveasfilename(
             defaultextension=".gif",
-            filetypes=[("GIF files", "*.gif"), ("All files", "*.*")]
+            filetypes=[("GIF files", "*.gif"), ("Animated PNG", "*.apng"),
+                       ("PNG image sequence", "*.png"), ("All files", "*.*")]
         )
+        if not filename:
+            return
+        if os.path.splitext(filename)[1].lower() not in FORMATS:
+            messagebox.showerror("Error", f"Animations can be exported as {', '.join(sorted(FORMATS))}")
+            return
+        frames = simpledialog.askinteger("Export Animation", "Frames to render:", parent=self.root,
+                                         initialvalue=10 * EXPORT_FPS, minvalue=1, maxvalue=100000)
+        if not frames:
+            return
         
-        if filename:
-            # This would require implementing animation export
-            messagebox.showinfo("Info", "Animation export feature coming soon!")
+        # Spawned workers: forking a process that runs Tk and a simulation thread is unsafe
+        self.export_job = ExportJob(self._simulator_from_state(state, trajectories=False),
+                                    filename, frames, fps=EXPORT_FPS,
+                                    time_per_frame=self.speed_var.get() * BASE_RATE / EXPORT_FPS,
+                                    use_3d=not self.flat_view.get(),
+                                    figsize=tuple(self.fig.get_size_inches()), start_method='spawn')
+        self.export_job.start()
+        self.show_export_progress(self.export_job)
+        
+    def show_export_progress(self, job):
+        """Progress window for an export job, with a Cancel button"""
+        window = tk.Toplevel(self.root)
+        window.title("Exporting Animation")
+        window.transient(self.root)
+        
+        ttk.Label(window, text=f"Rendering {os.path.basename(job.path)}").pack(padx=15, pady=(15, 5))
+        progress = ttk.Progressbar(window, length=320, maximum=job.total)
+        progress.pack(padx=15, pady=5)
+        status = ttk.Label(window, text="Preparing frames...")
+        status.pack(padx=15, pady=5)
+        
+        def cancel():
+            job.cancel()
+            cancel_button.config(state=tk.DISABLED)
+            status.config(text="Cancelling...")
+        
+        cancel_button = ttk.Button(window, text="Cancel", command=cancel)
+        cancel_button.pack(pady=(5, 15))
+        window.protocol("WM_DELETE_WINDOW", cancel)
+        
+        def poll():
+            if not job.finished:
+                progress['value'] = job.done
+                if job.done and not job.cancelled:
+                    status.config(text=f"{job.done} / {job.total} frames")
+                window.after(100, poll)
+                return
+            
+            window.destroy()
+            if job.error is not None:
+                messagebox.showerror("Error", f"Failed to export animation: {job.error}")
+            elif job.cancelled and not job.frames_written:
+                messagebox.showinfo("Export Animation", "Export cancelled; nothing was written.")
+            elif job.cancelled:
+                messagebox.showinfo("Export Animation", f"Export cancelled; kept the first "
+                                    f"{job.frames_written} frames in {job.path}")
+            else:
+                messagebox.showinfo("Success", f"Exported {job.frames_written} frames to {job.path}")
+        
+        poll()
             
     def export_data(self):
-        """Export simulation data"""
-        if self.simulator is None:
+        """Export every recorded position and velocity sample as a table"""
+        state = self.latest_state.get()
+        if self.simulator is None or state is None:
             messagebox.showwarning("Warning", "No simulation to export!")
             return
             
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"), ("NumPy columns", "*.npz"),
+                       ("Parquet (needs pyarrow)", "*.parquet"),
+                       ("Arrow IPC (needs pyarrow)", "*.arrow"), ("All files", "*.*")]
         )
         
         if filename:
-            # Export trajectory data
-            import csv
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Body', 'Time', 'X', 'Y', 'Z', 'VX', 'VY', 'VZ'])
-                
-                for body in self.simulator.physics_engine.bodies:
-                    for i, pos in enumerate(self.simulator.trajectories[body.name]):
-                        vel = body.velocity
-                        writer.writerow([body.name, i * self.simulator.dt, 
-                                       pos[0], pos[1], pos[2], vel[0], vel[1], vel[2]])
-            
-            messagebox.showinfo("Success", f"Data exported to {filename}")
+            try:
+                # The published trails, not the buffer the simulation thread appends to
+                rows = export_trajectories(filename, state.trajectories,
+                                           metadata={'dt': self.simulator.dt, 'time': state.time})
+                messagebox.showinfo("Success", f"Exported {rows} rows to {filename}")
+            except (ValueError, ImportError, OSError) as e:
+                messagebox.showerror("Error", f"Failed to export data: {str(e)}")
             
-
+    def show_performance_timings(self):
+        """Show per-phase timing statistics, enabling collection on first use"""
+        if not timings.enabled:
+            timings.enable()
+            messagebox.showinfo("Performance Timings",
+                                "Timing collection enabled. Run the simulation, then open this again.")
+            return
+        
+        lines = ["Phase timings (milliseconds)", ""]
+        for name, s in timings.stats().items():
+            lines.append(f"{name}: n={s['count']}, total={s['total']*1e3:.0f}, "
+                         f"p50={s['p50']*1e3:.2f}, p95={s['p95']*1e3:.2f}, p99={s['p99']*1e3:.2f}")
+        if len(lines) == 2:
+            lines.append("No samples yet.")
+        messagebox.showinfo("Performance Timings", "\n".join(lines))
         
     def show_user_guide(self):
         """Show user guide"""
@@ -542,6 +573,18 @@ For more help, visit the project documentation."""
         
         messagebox.showinfo("User Guide", guide_text)
         
+    def open_planet_builder(self):
+        self._tool_unavailable("Planet Builder")
+    
+    def open_orbit_calculator(self):
+        self._tool_unavailable("Orbit Calculator")
+    
+    def open_collision_simulator(self):
+        self._tool_unavailable("Collision Simulator")
+    
+    def _tool_unavailable(self, label):
+        messagebox.showinfo(label, f"The {label} is not available in this installation.")
+    
     def show_about(self):
         """Show about dialog"""
         about_text = """🌌 Orbital Mechanics Simulator
@@ -566,6 +609,7 @@ def main():
     """Main function to run the GUI"""
     root = tk.Tk()
     app = OrbitalMechanicsGUI(root)
+    root.protocol("WM_DELETE_WINDOW", lambda: launcher.close_window(root, app))
     root.mainloop()
 
 if __name__ == "__main__":
@@ -5,16 +5,23 @@ Real-time controls with pause, reset, speed adjustment, and live visualization
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import subprocess, sys
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 import numpy as np
 import threading
 import time
-from orbital_simulator import OrbitalSimulator, CelestialBody, SUN_MASS, EARTH_MASS, AU, G
+from concurrent.futures import ThreadPoolExecutor
+from orbital_simulator import OrbitalSimulator, AU, G, orbital_energies
+from instrumentation import timings
+from render_scheduler import RenderScheduler
+from simulation_service import LatestState, SteppingController
+from scenarios import GUI_SCENARIOS
+from launcher import ToolNavigationMixin
 
-class InteractiveSimulation:
+BASE_RATE = 86400.0  # simulated seconds per wall second at 1x speed
+
+class InteractiveSimulation(ToolNavigationMixin):
     def __init__(self, root):
         self.root = root
         self.root.title("🌌 Interactive Orbital Mechanics Simulator")
@@ -26,7 +33,12 @@ class InteractiveSimulation:
         self.is_running = False
         self.is_paused = False
         self.simulation_thread = None
-        self.update_thread = None
+        self.stepping = None  # SteppingController of the current run
+        self.sim_lock = threading.Lock()  # held for each step, seek or publish; never by the Tk thread
+        self.seek_worker = ThreadPoolExecutor(max_workers=1)  # runs seeks in request order
+        self.seek_status = ""  # outcome of the last seek, for the status panel
+        self.latest_state = LatestState()  # what the Tk thread draws; see publish_state
+        self.keyframe_usage = None  # (count, bytes) of the keyframes, published with the state
         
         # Control variables
         self.speed_var = tk.DoubleVar(value=1.0)
@@ -34,6 +46,9 @@ class InteractiveSimulation:
         self.show_trajectories = tk.BooleanVar(value=True)
         self.show_labels = tk.BooleanVar(value=True)
         self.realistic_mode = tk.BooleanVar(value=True)
+        self.flat_view = tk.BooleanVar(value=False)
+        self.seek_day_var = tk.StringVar(value="0")
+        self.keyframe_days_var = tk.DoubleVar(value=10.0)
         
         # Data tracking
         self.data_history = {
@@ -42,8 +57,12 @@ class InteractiveSimulation:
             'energies': {}
         }
         
+        # Redraws requested by the simulation thread, paced on the Tk thread
+        self.render_scheduler = RenderScheduler(self.root, self.render_frame, max_fps=30)
+        
         self.create_widgets()
         self.create_simulation()
+        self.render_scheduler.start()
         
     def create_widgets(self):
         """Create the main GUI widgets"""
@@ -124,6 +143,24 @@ class InteractiveSimulation:
         self.dt_label = ttk.Label(sim_frame, text="Time Step: 1.0 hours")
         self.dt_label.pack(anchor=tk.W)
         
+        # Time travel through keyframes
+        seek_frame = ttk.LabelFrame(parent, text="Time Travel", padding=10)
+        seek_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        jump_frame = ttk.Frame(seek_frame)
+        jump_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(jump_frame, text="Jump to day:").pack(side=tk.LEFT)
+        seek_entry = ttk.Entry(jump_frame, textvariable=self.seek_day_var, width=10)
+        seek_entry.pack(side=tk.LEFT, padx=5)
+        seek_entry.bind('<Return>', lambda event: self.seek_to_day())
+        ttk.Button(jump_frame, text="⏩ Go", command=self.seek_to_day).pack(side=tk.LEFT)
+        
+        ttk.Label(seek_frame, text="Keyframe Spacing (days):").pack(anchor=tk.W)
+        ttk.Scale(seek_frame, from_=1.0, to=100.0, variable=self.keyframe_days_var,
+                  orient=tk.HORIZONTAL, command=self.on_keyframe_spacing_change).pack(fill=tk.X)
+        self.keyframe_label = ttk.Label(seek_frame, text="Every 10 days")
+        self.keyframe_label.pack(anchor=tk.W)
+        
         # Visualization Options
         vis_frame = ttk.LabelFrame(parent, text="Visualization Options", padding=10)
         vis_frame.pack(fill=tk.X, pady=(0, 10))
@@ -140,6 +177,10 @@ class InteractiveSimulation:
                        variable=self.realistic_mode, 
                        command=self.update_visualization).pack(anchor=tk.W)
         
+        ttk.Checkbutton(vis_frame, text="2D View (fast redraw)", 
+                       variable=self.flat_view, 
+                       command=self.on_view_change).pack(anchor=tk.W)
+        
         # Scenario Selection
         scenario_frame = ttk.LabelFrame(parent, text="Scenarios", padding=10)
         scenario_frame.pack(fill=tk.X, pady=(0, 10))
@@ -168,42 +209,6 @@ class InteractiveSimulation:
         # Update status
         self.update_status()
 
-    def open_main_hub(self):
-        try:
-            subprocess.Popen([sys.executable, "main_hub.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Main Hub: {e}")
-
-    def open_educational_features(self):
-        try:
-            subprocess.Popen([sys.executable, "educational_quiz_gui.py"])  # includes features hub
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Educational Features: {e}")
-
-    def open_educational_quiz(self):
-        try:
-            subprocess.Popen([sys.executable, "educational_quiz_gui.py"])  # opens quiz window
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Educational Quiz: {e}")
-
-    def open_realistic_demo(self):
-        try:
-            subprocess.Popen([sys.executable, "realistic_solar_system_demo.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Realistic Demo: {e}")
-
-    def open_professional_features(self):
-        try:
-            subprocess.Popen([sys.executable, "professional_features.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Professional Features: {e}")
-
-    def open_planet_analyzer(self):
-        try:
-            subprocess.Popen([sys.executable, "planet_data_analyzer.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open Planet Data Analyzer: {e}")
-        
     def create_visualization_panel(self, parent):
         """Create the visualization panel"""
         # Create matplotlib figure
@@ -223,20 +228,13 @@ class InteractiveSimulation:
         """Create the initial simulation"""
         self.simulator = OrbitalSimulator([], dt=self.dt_var.get() * 3600)
         self.create_scenario(self.scenario_var.get())
+        self.simulator.enable_keyframes(self.keyframe_days_var.get() * 86400)
         self.update_visualization()
         
     def create_scenario(self, scenario_name):
         """Create the selected scenario"""
-        if scenario_name == "Complete Solar System":
-            self.simulator.create_realistic_space_scene()
-        elif scenario_name == "Inner Planets Only":
-            self.create_inner_planets()
-        elif scenario_name == "Gas Giants Only":
-            self.create_gas_giants()
-        elif scenario_name == "Earth-Moon System":
-            self.create_earth_moon_system()
-        elif scenario_name == "Binary Star System":
-            self.create_binary_star_system()
+        if scenario_name in GUI_SCENARIOS:
+            self.simulator.load_scenario(GUI_SCENARIOS[scenario_name])
         
         # Initialize data history
         self.data_history = {
@@ -248,57 +246,18 @@ class InteractiveSimulation:
         for body in self.simulator.physics_engine.bodies:
             self.data_history['positions'][body.name] = []
             self.data_history['energies'][body.name] = []
+        self.publish_state()
     
-    def create_inner_planets(self):
-        """Create inner planets scenario"""
-        sun = CelestialBody("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 25, '#FFD700', is_3d=True)
-        mercury = CelestialBody("Mercury", EARTH_MASS * 0.055, [0.39 * AU, 0, 0], 
-                               [0, 47870, 0], 4, '#8C7853', is_3d=True)
-        venus = CelestialBody("Venus", EARTH_MASS * 0.815, [0.72 * AU, 0, 0], 
-                             [0, 35020, 0], 7, '#FF8C00', is_3d=True)
-        earth = CelestialBody("Earth", EARTH_MASS, [1.0 * AU, 0, 0], 
-                              [0, 29780, 0], 8, '#4169E1', is_3d=True)
-        mars = CelestialBody("Mars", EARTH_MASS * 0.107, [1.52 * AU, 0, 0], 
-                            [0, 24077, 0], 6, '#CD5C5C', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [sun, mercury, venus, earth, mars]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
-    
-    def create_gas_giants(self):
-        """Create gas giants scenario"""
-        sun = CelestialBody("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 30, '#FFD700', is_3d=True)
-        jupiter = CelestialBody("Jupiter", EARTH_MASS * 317.8, [5.2 * AU, 0, 0], 
-                               [0, 13070, 0], 25, '#D2691E', is_3d=True)
-        saturn = CelestialBody("Saturn", EARTH_MASS * 95.2, [9.58 * AU, 0, 0], 
-                              [0, 9680, 0], 22, '#F4A460', is_3d=True)
-        uranus = CelestialBody("Uranus", EARTH_MASS * 14.5, [19.2 * AU, 0, 0], 
-                              [0, 6800, 0], 15, '#4FD0E7', is_3d=True)
-        neptune = CelestialBody("Neptune", EARTH_MASS * 17.1, [30.1 * AU, 0, 0], 
-                               [0, 5430, 0], 15, '#4169E1', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [sun, jupiter, saturn, uranus, neptune]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
-    
-    def create_earth_moon_system(self):
-        """Create Earth-Moon system"""
-        earth = CelestialBody("Earth", EARTH_MASS, [0, 0, 0], [0, 0, 0], 10, '#4169E1', is_3d=True)
-        moon = CelestialBody("Moon", 7.342e22, [3.844e8, 0, 0], 
-                            [0, 1022, 0], 3, '#C0C0C0', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [earth, moon]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
-    
-    def create_binary_star_system(self):
-        """Create binary star system"""
-        star1 = CelestialBody("Star 1", SUN_MASS, [-0.5 * AU, 0, 0], 
-                             [0, 15000, 0], 20, '#FFD700', is_3d=True)
-        star2 = CelestialBody("Star 2", SUN_MASS * 0.8, [0.5 * AU, 0, 0], 
-                             [0, -15000, 0], 18, '#FFA500', is_3d=True)
-        planet = CelestialBody("Planet", EARTH_MASS, [2 * AU, 0, 0.3 * AU], 
-                              [0, 12000, 2000], 6, '#87CEEB', is_3d=True)
-        
-        self.simulator.physics_engine.bodies = [star1, star2, planet]
-        self.simulator.trajectories = {body.name: [] for body in self.simulator.physics_engine.bodies}
+    def publish_state(self):
+        """
+        Hand the simulator's current state to the Tk thread
+        
+        The Tk thread never reads the bodies the simulation thread is
+        stepping, only the latest published snapshot.
+        """
+        self.latest_state.publish(self.simulator.snapshot(trajectories=True))
+        keyframes = self.simulator.keyframes
+        self.keyframe_usage = None if keyframes is None else (len(keyframes), keyframes.nbytes)
     
     def start_simulation(self):
         """Start the simulation"""
@@ -311,15 +270,11 @@ class InteractiveSimulation:
         self.pause_button.config(state=tk.NORMAL)
         
         # Start simulation thread
+        self.stepping = SteppingController(self.simulator, self.speed_var.get() * BASE_RATE)
         self.simulation_thread = threading.Thread(target=self.run_simulation_loop)
         self.simulation_thread.daemon = True
         self.simulation_thread.start()
         
-        # Start update thread
-        self.update_thread = threading.Thread(target=self.update_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
-        
     def pause_simulation(self):
         """Pause/resume the simulation"""
         if self.is_paused:
@@ -328,17 +283,16 @@ class InteractiveSimulation:
         else:
             self.is_paused = True
             self.pause_button.config(text="▶ Resume")
+        self.render_scheduler.request()  # show the new status
     
     def reset_simulation(self):
         """Reset the simulation"""
         self.is_running = False
         self.is_paused = False
         
-        # Wait for threads to finish
+        # Wait for the simulation thread to finish
         if self.simulation_thread and self.simulation_thread.is_alive():
             self.simulation_thread.join(timeout=1)
-        if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
         
         # Reset simulation
         self.create_simulation()
@@ -349,133 +303,134 @@ class InteractiveSimulation:
         self.pause_button.config(state=tk.DISABLED, text="⏸ Pause")
         
     def run_simulation_loop(self):
-        """Run the simulation loop"""
+        """Step the simulation in batches at the speed set by the slider"""
+        stepping = self.stepping
         while self.is_running:
-            if not self.is_paused:
-                if self.simulator:
-                    self.simulator.step()
-                    
-                    # Record data
-                    self.data_history['time'].append(self.simulator.time)
-                    for body in self.simulator.physics_engine.bodies:
-                        self.data_history['positions'][body.name].append(body.position.copy())
-                        energy = self.simulator.physics_engine.get_orbital_energy(body)
-                        self.data_history['energies'][body.name].append(energy)
-                
-                # Adjust speed
-                time.sleep(0.1 / self.speed_var.get())
-            else:
+            if self.is_paused:
+                stepping.reset()  # nothing is owed for the time spent paused
                 time.sleep(0.1)
+                continue
+            
+            # Locked per step, so a seek waits for one step rather than a whole batch
+            stepped = stepping.tick(self.step_locked)
+            if stepped:
+                with self.sim_lock:
+                    self.publish_state()
+                    self.record_state(self.latest_state.get())
+                self.render_scheduler.request()
+            # Short sleeps keep pause and speed changes responsive
+            time.sleep(min(stepping.wait_time(), 0.05))
     
-    def update_loop(self):
-        """Update visualization loop"""
-        while self.is_running:
-            self.root.after(0, self.update_visualization)
-            self.root.after(0, self.update_status)
-            time.sleep(0.1)  # Update every 100ms
+    def step_locked(self):
+        """Take one physics step under sim_lock"""
+        with self.sim_lock:
+            self.simulator.step()
     
-    def update_visualization(self):
-        """Update the visualization"""
-        if self.simulator is None:
-            return
+    def record_state(self, state):
+        """Add a published state to the data history"""
+        self.data_history['time'].append(state.time)
+        energies = orbital_energies(state.masses, state.positions, state.velocities)
+        for name, position, energy in zip(state.names, state.positions, energies):
+            self.data_history['positions'][name].append(position)
+            self.data_history['energies'][name].append(energy)
+    
+    def render_frame(self):
+        """Draw a frame for the render scheduler"""
+        self.update_visualization(idle=True)
+        self.update_status()
+    
+    def update_visualization(self, idle=False):
+        """Update the visualization (idle=True defers a full redraw with draw_idle)"""
+        with timings.phase('draw'):
+            state = self.latest_state.get()
+            if self.simulator is None or state is None:
+                return
             
-        self.ax.clear()
+            trajectories = state.trajectories if self.show_trajectories.get() else None
+            renderer = self.simulator.draw_scene(self.ax, trajectories, max_trajectory_points=1000,
+                                                 realistic=self.realistic_mode.get(),
+                                                 show_labels=self.show_labels.get(),
+                                                 blit=self.flat_view.get(), state=state)
+        
+            # Dynamic title
+            status = "Running" if self.is_running and not self.is_paused else "Paused" if self.is_paused else "Stopped"
+            self.ax.set_title(f'🌌 Interactive Simulation - {status} (t = {state.time/86400:.1f} days)', 
+                             color='white', fontsize=12)
+        
+            renderer.draw(idle)  # blits only the moving artists in the 2D view
+    
+    def on_view_change(self):
+        """Switch between the 3D view and the blitted 2D view"""
+        self.fig.clear()
+        if self.flat_view.get():
+            self.ax = self.fig.add_subplot(111)
+        else:
+            self.ax = self.fig.add_subplot(111, projection='3d')
         self.ax.set_facecolor('black')
-        
-        # Add starfield
-        self.simulator._add_starfield(self.ax, True)
-        
-        # Plot trajectories if enabled
-        if self.show_trajectories.get():
-            for body_name, trajectory in self.simulator.trajectories.items():
-                if len(trajectory) > 1:
-                    recent_trajectory = trajectory[-1000:]  # Limit for performance
-                    trajectory_array = np.array(recent_trajectory)
-                    trajectory_au = trajectory_array / AU
-                    
-                    traj_color = self.simulator._get_trajectory_color(body_name)
-                    self.ax.plot(trajectory_au[:, 0], trajectory_au[:, 1], trajectory_au[:, 2],
-                               alpha=0.6, linewidth=1, color=traj_color)
-        
-        # Plot bodies
-        for body in self.simulator.physics_engine.bodies:
-            pos_au = body.position / AU
-            body_color, body_size = self.simulator._get_realistic_body_properties(body)
-            
-            if self.realistic_mode.get():
-                self.simulator._plot_realistic_body_3d(self.ax, pos_au, body_color, body_size, body.name)
-            else:
-                self.ax.scatter(pos_au[0], pos_au[1], pos_au[2], 
-                              s=body_size**2, c=body_color, alpha=0.9)
-            
-            # Add labels if enabled
-            if self.show_labels.get():
-                self.ax.text(pos_au[0], pos_au[1], pos_au[2], body.name, 
-                           color='white', fontsize=8)
-        
-        # Set axis properties
-        self.ax.set_xlabel('X Position (AU)', color='white')
-        self.ax.set_ylabel('Y Position (AU)', color='white')
-        self.ax.set_zlabel('Z Position (AU)', color='white')
-        
-        # Dynamic title
-        status = "Running" if self.is_running and not self.is_paused else "Paused" if self.is_paused else "Stopped"
-        self.ax.set_title(f'🌌 Interactive Simulation - {status} (t = {self.simulator.time/86400:.1f} days)', 
-                         color='white', fontsize=12)
-        
-        # Set axis limits
-        all_positions = [body.position / AU for body in self.simulator.physics_engine.bodies]
-        if all_positions:
-            positions_array = np.array(all_positions)
-            max_coord = np.max(np.abs(positions_array)) * 1.2
-            self.ax.set_xlim(-max_coord, max_coord)
-            self.ax.set_ylim(-max_coord, max_coord)
-            self.ax.set_zlim(-max_coord, max_coord)
-        
-        self.canvas.draw()
+        self.update_visualization()
     
     def update_status(self):
         """Update status information"""
-        if self.simulator is None:
+        state = self.latest_state.get()
+        if self.simulator is None or state is None:
             return
         
         # Clear and update status text
         self.status_text.delete(1.0, tk.END)
         
-        status_info = f"🌌 Simulation Status\n"
+        status_info = "🌌 Simulation Status\n"
         status_info += f"{'='*25}\n\n"
         
-        status_info += f"Time: {self.simulator.time/86400:.2f} days\n"
+        status_info += f"Time: {state.time/86400:.2f} days\n"
         status_info += f"Speed: {self.speed_var.get():.1f}x\n"
         status_info += f"Time Step: {self.dt_var.get():.1f} hours\n"
-        status_info += f"Bodies: {len(self.simulator.physics_engine.bodies)}\n\n"
-        
-        status_info += f"Planet Positions (AU):\n"
-        for body in self.simulator.physics_engine.bodies:
-            if body.name == "Sun":
+        status_info += f"Bodies: {len(state.names)}\n"
+        if self.is_running and not self.is_paused and self.stepping is not None:
+            status_info += (f"Rate: {self.stepping.achieved_rate / 86400:.2f} of "
+                            f"{self.stepping.rate / 86400:.2f} days/s\n")
+            if self.stepping.behind:
+                status_info += "⚠️ Cannot keep up with this speed\n"
+        status_info += (f"Rendering: {self.render_scheduler.fps:.1f} FPS "
+                        f"({self.render_scheduler.frame_time * 1000:.0f} ms/frame)\n")
+        keyframe_usage = self.keyframe_usage
+        if keyframe_usage is not None:
+            count, size = keyframe_usage
+            status_info += f"Keyframes: {count} ({size / 1024:.0f} KiB)\n"
+        if self.seek_status:
+            status_info += f"{self.seek_status}\n"
+        status_info += "\n"
+        
+        status_info += "Planet Positions (AU):\n"
+        for name, position in zip(state.names, state.positions):
+            if name == "Sun":
                 continue
-            pos_au = body.position / AU
-            distance = np.linalg.norm(pos_au)
-            status_info += f"  {body.name}: {distance:.3f} AU\n"
+            distance = np.linalg.norm(position / AU)
+            status_info += f"  {name}: {distance:.3f} AU\n"
         
-        status_info += f"\nPlanet Speeds (km/s):\n"
-        for body in self.simulator.physics_engine.bodies:
-            if body.name == "Sun":
+        status_info += "\nPlanet Speeds (km/s):\n"
+        for name, velocity in zip(state.names, state.velocities):
+            if name == "Sun":
                 continue
-            speed = np.linalg.norm(body.velocity) / 1000
-            status_info += f"  {body.name}: {speed:.1f} km/s\n"
+            speed = np.linalg.norm(velocity) / 1000
+            status_info += f"  {name}: {speed:.1f} km/s\n"
         
         # Energy conservation
-        if len(self.data_history['time']) > 1:
-            total_energy = sum(self.data_history['energies'][body.name][-1] 
-                             for body in self.simulator.physics_engine.bodies)
-            status_info += f"\nTotal Energy: {total_energy:.2e} J\n"
+        total_energy = orbital_energies(state.masses, state.positions, state.velocities).sum()
+        status_info += f"\nTotal Energy: {total_energy:.2e} J\n"
+        
+        # Phase timings (only collected when enabled)
+        if timings.enabled:
+            status_info += "\nPhase Timings (p50 / p95 ms):\n"
+            for name, stats in timings.stats().items():
+                status_info += f"  {name}: {stats['p50']*1e3:.2f} / {stats['p95']*1e3:.2f}\n"
         
         self.status_text.insert(1.0, status_info)
     
     def on_speed_change(self, value):
         """Handle speed change"""
         self.speed_label.config(text=f"Speed: {self.speed_var.get():.1f}x")
+        if self.stepping is not None:
+            self.stepping.rate = self.speed_var.get() * BASE_RATE
     
     def on_dt_change(self, value):
         """Handle time step change"""
@@ -483,6 +438,63 @@ class InteractiveSimulation:
         if self.simulator:
             self.simulator.dt = self.dt_var.get() * 3600
     
+    def seek_to_day(self):
+        """Jump to the day in the seek entry using the simulator's keyframes"""
+        if self.simulator is None:
+            return
+        try:
+            target = float(self.seek_day_var.get()) * 86400
+            if target < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Enter a day number of 0 or more")
+            return
+        
+        # A forward seek integrates the gap past the last keyframe, so it runs off the Tk thread
+        self.seek_status = f"⏳ Seeking to day {target/86400:g}..."
+        self.seek_worker.submit(self.run_seek, self.simulator, target)
+        self.render_scheduler.request()
+    
+    def run_seek(self, simulator, target):
+        """Seek on the seek worker and publish the result like a simulation step"""
+        start = time.perf_counter()
+        with self.sim_lock:
+            if simulator is not self.simulator:
+                return  # reset since the seek was requested
+            try:
+                simulator.seek(target)
+            except (ValueError, RuntimeError) as e:
+                self.seek_status = f"⚠️ Seek failed: {e}"
+            else:
+                if simulator is not self.simulator:
+                    return  # reset while seeking
+                self.publish_state()
+                # Samples after the new time belong to the abandoned future
+                keep = sum(1 for t in self.data_history['time'] if t <= simulator.time)
+                del self.data_history['time'][keep:]
+                for series in (*self.data_history['positions'].values(),
+                               *self.data_history['energies'].values()):
+                    del series[keep:]
+                self.seek_status = (f"⏩ Seeked to day {simulator.time/86400:.1f} in "
+                                    f"{(time.perf_counter() - start) * 1000:.0f} ms")
+        print(self.seek_status)
+        self.render_scheduler.request()
+    
+    def on_keyframe_spacing_change(self, value):
+        """Handle keyframe spacing change"""
+        days = self.keyframe_days_var.get()
+        self.keyframe_label.config(text=f"Every {days:.0f} days")
+        if self.simulator and self.simulator.keyframes is not None:
+            # After any queued seek, and without waiting for the lock here
+            self.seek_worker.submit(self.set_keyframe_interval, self.simulator, days * 86400)
+    
+    def set_keyframe_interval(self, simulator, interval):
+        """Apply a keyframe spacing on the seek worker"""
+        with self.sim_lock:
+            simulator.keyframes.set_interval(interval)
+            if simulator is self.simulator:
+                self.publish_state()
+    
     def on_scenario_change(self):
         """Handle scenario change"""
         if not self.is_running:
@@ -499,6 +511,8 @@ def main():
     # Handle window closing
     def on_closing():
         app.is_running = False
+        app.render_scheduler.stop()
+        app.seek_worker.shutdown(wait=False, cancel_futures=True)
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
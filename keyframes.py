@@ -0,0 +1,164 @@
+"""
+Simulation Keyframes
+Periodic full-state checkpoints that let a simulator jump to any time by
+restoring the nearest earlier keyframe and integrating only the gap
+
+Usage:
+    simulator.enable_keyframes(interval=10 * 86400)                 # in memory
+    simulator.enable_keyframes(interval=10 * 86400, directory='kf')  # on disk
+    simulator.run_simulation(5000 * 86400)
+    simulator.seek(1234 * 86400)   # restores day 1230, integrates 4 days
+
+Time is divided into slots of `interval` seconds and the first state
+reached in each slot is kept. Memory per keyframe is 48 bytes per body;
+with `max_keyframes` set, reaching the limit drops every other keyframe
+and doubles the interval, so long runs stay within a fixed budget.
+"""
+
+import bisect
+import os
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+
+class Keyframe(NamedTuple):
+    """Full state at one instant"""
+    time: float
+    positions: np.ndarray  # (N, 3) in meters
+    velocities: np.ndarray  # (N, 3) in m/s
+    trail_length: int  # trajectory points recorded before this state
+
+
+class KeyframeStore:
+    """Keyframes indexed by time slot, held in memory or as .npy files in a directory"""
+
+    def __init__(self, interval: float, directory: Optional[str] = None,
+                 max_keyframes: Optional[int] = None):
+        """
+        Args:
+            interval: Seconds of simulated time between keyframes
+            directory: Keep the states on disk here instead of in memory
+            max_keyframes: Thin the keyframes when this many are stored
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if max_keyframes is not None and max_keyframes < 2:
+            raise ValueError("max_keyframes must be at least 2")
+        self.interval = float(interval)
+        self.directory = directory
+        self.max_keyframes = max_keyframes
+        self.dt = None  # step size of the run the stored keyframes continue
+        self._slots: Dict[int, tuple] = {}  # slot -> (time, trail_length, state or file, dt)
+        self._times: List[float] = []  # sorted keyframe times
+        self._files_written = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._times)
+
+    @property
+    def times(self) -> List[float]:
+        return list(self._times)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of state held in memory (zero for on-disk stores)"""
+        if self.directory:
+            return 0
+        return sum(entry[2].nbytes for entry in self._slots.values())
+
+    def _slot(self, t: float) -> int:
+        return int(np.floor(t / self.interval + 1e-9))
+
+    def due(self, t: float) -> bool:
+        """Whether a state at time t would start a new keyframe"""
+        return self._slot(t) not in self._slots
+
+    def record(self, t: float, positions, velocities, trail_length: int, dt: float):
+        """Store a state reached with step size dt, if its slot is empty"""
+        self.dt = dt
+        slot = self._slot(t)
+        if slot in self._slots:
+            return
+
+        state = np.stack([np.asarray(positions, dtype=float).reshape(-1, 3),
+                          np.asarray(velocities, dtype=float).reshape(-1, 3)])
+        if self.directory:
+            path = os.path.join(self.directory, f"keyframe_{self._files_written:08d}.npy")
+            np.save(path, state)
+            self._files_written += 1
+            state = path
+        self._slots[slot] = (float(t), int(trail_length), state, dt)
+        bisect.insort(self._times, float(t))
+
+        if self.max_keyframes is not None and len(self._times) > self.max_keyframes:
+            self.set_interval(self.interval * 2)
+
+    def set_interval(self, interval: float):
+        """Change the spacing, keeping the earliest keyframe in each new slot"""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        old = sorted(self._slots.values(), key=lambda entry: entry[0])
+        self.interval = float(interval)
+        self._slots = {}
+        for entry in old:
+            slot = self._slot(entry[0])
+            if slot in self._slots:
+                self._drop(entry)
+            else:
+                self._slots[slot] = entry
+        self._times = sorted(entry[0] for entry in self._slots.values())
+
+    def latest_before(self, t: float) -> Optional[Keyframe]:
+        """The last keyframe at or before time t, or None"""
+        index = bisect.bisect_right(self._times, t + 1e-6)
+        if index == 0:
+            return None
+        time_ = self._times[index - 1]
+        _, trail_length, state, _ = self._slots[self._slot(time_)]
+        if isinstance(state, str):
+            state = np.load(state)
+        return Keyframe(time_, state[0].copy(), state[1].copy(), trail_length)
+
+    def invalidate(self, t: float, dt: float):
+        """
+        Prepare to continue the run from time t with step size dt
+
+        Keyframes after t belong to the run being continued only up to the
+        first one reached with a different step size; that one and every
+        later keyframe are discarded.
+        """
+        for time_ in self._times:
+            if time_ > t + 1e-6 and self._slots[self._slot(time_)][3] != dt:
+                self.discard_after(time_ - 1e-3)
+                break
+        self.dt = dt
+
+    def discard_after(self, t: float):
+        """Remove keyframes later than t"""
+        for slot, entry in list(self._slots.items()):
+            if entry[0] > t + 1e-6:
+                self._drop(entry)
+                del self._slots[slot]
+        self._times = [time_ for time_ in self._times if time_ <= t + 1e-6]
+
+    def clear(self):
+        """Remove every keyframe"""
+        for entry in self._slots.values():
+            self._drop(entry)
+        self._slots = {}
+        self._times = []
+        self.dt = None
+
+    def close(self):
+        """Remove every keyframe and the keyframe directory, if it is left empty"""
+        self.clear()
+        if self.directory and os.path.isdir(self.directory) and not os.listdir(self.directory):
+            os.rmdir(self.directory)
+
+    @staticmethod
+    def _drop(entry):
+        if isinstance(entry[2], str) and os.path.exists(entry[2]):
+            os.remove(entry[2])
@@ -0,0 +1,240 @@
+"""
+In-Process Tool Launcher
+Opens the Tk tools as Toplevel windows in the running process, so NumPy,
+Matplotlib and Tk are only imported once, and runs the script-style demos
+through a pre-forked warm worker
+
+Usage:
+    import launcher
+    launcher.open_tool('interactive_simulation', root)   # Toplevel window
+    launcher.open_tool('realistic_demo', root)           # warm worker
+    launcher.preload(root)                               # warm the cache while idle
+
+Tools call open_tool from their Hub menus through ToolNavigationMixin.
+"""
+
+import importlib
+import os
+import runpy
+import signal
+import subprocess
+import sys
+import time
+import tkinter as tk
+from tkinter import messagebox
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Tk tools: name -> (module, class taking a root/Toplevel)
+WINDOW_TOOLS = {
+    'main_hub': ('main_hub', 'MainHub'),
+    'interactive_simulation': ('interactive_simulation', 'InteractiveSimulation'),
+    'interactive_gui': ('interactive_gui', 'OrbitalMechanicsGUI'),
+    'educational_features': ('educational_quiz_gui', 'EducationalFeaturesGUI'),
+    'educational_quiz': ('educational_quiz_gui', 'EducationalQuizGUI'),
+}
+
+# Script tools own their matplotlib windows and event loop, so they run in
+# a process of their own
+SCRIPT_TOOLS = {
+    'realistic_demo': 'realistic_solar_system_demo.py',
+    'animation_demo': 'realistic_animation_demo.py',
+    'professional_features': 'professional_features.py',
+    'planet_analyzer': 'planet_data_analyzer.py',
+}
+
+# Imported by the warm worker before it forks each script
+WARM_MODULES = ['numpy', 'matplotlib', 'matplotlib.pyplot', 'mpl_toolkits.mplot3d',
+                'tkinter', 'orbital_simulator']
+
+_windows = {}  # tool name -> (Toplevel, app) for single-instance tools
+_worker = None
+
+
+def open_tool(name, master):
+    """
+    Open a tool by name and return its app object (None for script tools)
+
+    Window tools are built in a new Toplevel of `master`. The main hub is
+    single-instance: asking for it again raises the existing window.
+    """
+    if name in SCRIPT_TOOLS:
+        run_script(SCRIPT_TOOLS[name])
+        return None
+    if name not in WINDOW_TOOLS:
+        raise KeyError(f"Unknown tool: {name}")
+
+    existing = _windows.get(name)
+    if existing and existing[0].winfo_exists():
+        existing[0].deiconify()
+        existing[0].lift()
+        return existing[1]
+
+    start = time.perf_counter()
+    module_name, class_name = WINDOW_TOOLS[name]
+    app_class = getattr(importlib.import_module(module_name), class_name)
+
+    window = tk.Toplevel(master)
+    app = app_class(window)
+    window.protocol("WM_DELETE_WINDOW", lambda: close_window(window, app))
+    if name == 'main_hub':
+        _windows[name] = (window, app)
+
+    print(f"🚀 Opened {name} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return app
+
+
+def close_window(window, app):
+    """Stop a tool's background loops and destroy its window"""
+    if hasattr(app, 'is_running'):
+        app.is_running = False
+    if getattr(app, 'render_scheduler', None) is not None:
+        app.render_scheduler.stop()
+    if getattr(app, 'export_job', None) is not None:
+        app.export_job.cancel()
+    window.destroy()
+
+
+def register_root(name, root, app):
+    """Record a tool that owns the Tk root, so open_tool raises it instead of opening a copy"""
+    _windows[name] = (root, app)
+
+
+def preload(master, names=None):
+    """
+    Import the window tools' modules one per idle slot and start the warm
+    worker, so the first launch of each tool skips the import cost
+    """
+    pending = [WINDOW_TOOLS[name][0] for name in (names or WINDOW_TOOLS)]
+    start_worker()
+
+    def import_next():
+        while pending:
+            module_name = pending.pop(0)
+            if module_name not in sys.modules:
+                importlib.import_module(module_name)
+                master.after_idle(import_next)
+                return
+
+    master.after_idle(import_next)
+
+
+class WarmWorker:
+    """
+    A child Python that has already imported the heavy modules
+
+    Each script is run in a fork of the worker, so it starts with NumPy and
+    Matplotlib loaded. The worker is a separate process spawned before any
+    script needs it, so forking never copies the caller's Tk state.
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--worker'],
+            stdin=subprocess.PIPE, text=True, cwd=BASE_DIR)
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def run(self, script_path):
+        self.process.stdin.write(script_path + "\n")
+        self.process.stdin.flush()
+
+    def stop(self):
+        if self.alive():
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+
+
+def start_worker():
+    """Start the shared warm worker if the platform can fork"""
+    global _worker
+    if not hasattr(os, 'fork'):
+        return None
+    if _worker is None or not _worker.alive():
+        _worker = WarmWorker()
+    return _worker
+
+
+def run_script(script):
+    """Run a script tool through the warm worker, or a fresh interpreter without one"""
+    script_path = os.path.join(BASE_DIR, script)
+    if not os.path.exists(script_path):
+        raise FileNotFoundError(f"{script} is not available in this installation")
+
+    if _worker is not None and _worker.alive():
+        try:
+            _worker.run(script_path)
+            return
+        except (BrokenPipeError, OSError):
+            pass  # worker died between the check and the write
+    subprocess.Popen([sys.executable, script_path], cwd=BASE_DIR)
+
+
+def _worker_main():
+    """Worker loop: import once, then fork a child per script path read from stdin"""
+    for module_name in WARM_MODULES:
+        importlib.import_module(module_name)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # children are reaped automatically
+
+    for line in sys.stdin:
+        script_path = line.strip()
+        if not script_path:
+            continue
+        if os.fork() == 0:
+            # Child: detach from the command pipe and become the script
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            sys.argv = [script_path]
+            exit_code = 0
+            try:
+                runpy.run_path(script_path, run_name='__main__')
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else 0
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            os._exit(exit_code)
+
+
+class ToolNavigationMixin:
+    """Hub menu commands shared by the Tk tools; expects `self.root`"""
+
+    def _open_tool(self, name, label):
+        try:
+            open_tool(name, self.root)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open {label}: {e}")
+
+    def open_main_hub(self):
+        self._open_tool('main_hub', "Main Hub")
+
+    def open_simulator(self):
+        self._open_tool('interactive_simulation', "simulator")
+
+    def open_educational_features(self):
+        self._open_tool('educational_features', "Educational Features")
+
+    def open_educational_quiz(self):
+        self._open_tool('educational_quiz', "Educational Quiz")
+
+    def open_realistic_demo(self):
+        self._open_tool('realistic_demo', "Realistic Demo")
+
+    def open_professional_features(self):
+        self._open_tool('professional_features', "Professional Features")
+
+    def open_planet_analyzer(self):
+        self._open_tool('planet_analyzer', "Planet Data Analyzer")
+
+
+if __name__ == "__main__":
+    if '--worker' in sys.argv:
+        _worker_main()
+    else:
+        print(__doc__)
@@ -1,16 +1,20 @@
 """
 Main Hub Launcher
 Central window to launch all features and demos
+
+Tools open in this process (see launcher.py), so after the first launch
+they start with every module already imported.
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import subprocess, sys
+
+import launcher
 
 LAUNCH_ITEMS = [
-    ("Interactive Simulation", "interactive_simulation.py", "🌌"),
-    ("Educational Features & Quiz", "educational_quiz_gui.py", "📚"),
-    ("Realistic Solar System Demo", "realistic_solar_system_demo.py", "🪐")
+    ("Interactive Simulation", "interactive_simulation", "🌌"),
+    ("Educational Features & Quiz", "educational_features", "📚"),
+    ("Realistic Solar System Demo", "realistic_demo", "🪐")
 ]
 
 class MainHub:
@@ -30,23 +34,25 @@ class MainHub:
         container = ttk.Frame(self.root)
         container.pack(fill=tk.BOTH, expand=True, padx=16, pady=16)
         
-        for name, script, icon in LAUNCH_ITEMS:
-            btn = ttk.Button(container, text=f"{icon}  {name}", command=lambda s=script: self.launch(s))
+        for name, tool, icon in LAUNCH_ITEMS:
+            btn = ttk.Button(container, text=f"{icon}  {name}", command=lambda t=tool: self.launch(t))
             btn.pack(fill=tk.X, pady=6)
         
         footer = ttk.Label(self.root, text="Tip: You can navigate between modules from the 'Hub' menu inside each window.")
         footer.pack(pady=(8, 0))
     
-    def launch(self, script):
+    def launch(self, tool):
         try:
-            subprocess.Popen([sys.executable, script])
+            launcher.open_tool(tool, self.root)
         except Exception as e:
-            messagebox.showerror("Error", f"Could not launch {script}: {e}")
+            messagebox.showerror("Error", f"Could not launch {tool}: {e}")
 
 
 def main():
     root = tk.Tk()
-    MainHub(root)
+    hub = MainHub(root)
+    launcher.register_root('main_hub', root, hub)
+    launcher.preload(root)
     root.mainloop()
 
 if __name__ == "__main__":
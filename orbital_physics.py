@@ -0,0 +1,241 @@
+"""
+Orbital Physics Core
+Bodies, gravity and the integrator, importable without any plotting
+dependency (batch jobs, servers and benchmarks use this directly)
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Tuple
+
+from instrumentation import timings
+
+# Physical constants
+G = 6.67430e-11  # Gravitational constant (m^3 kg^-1 s^-2)
+AU = 1.496e11    # Astronomical unit (m)
+EARTH_MASS = 5.972e24  # Earth mass (kg)
+SUN_MASS = 1.989e30    # Sun mass (kg)
+
+@dataclass
+class CelestialBody:
+    """Represents a celestial body with mass, position, and velocity"""
+    name: str
+    mass: float  # kg
+    position: np.ndarray  # [x, y, z] in meters (3D) or [x, y] (2D)
+    velocity: np.ndarray  # [vx, vy, vz] in m/s (3D) or [vx, vy] (2D)
+    radius: float = 0.0  # visual radius for plotting
+    color: str = 'blue'
+    is_3d: bool = True  # Whether this body exists in 3D space
+    
+    def __post_init__(self):
+        """Ensure position and velocity are numpy arrays with correct dimensions"""
+        self.position = np.array(self.position, dtype=float)
+        self.velocity = np.array(self.velocity, dtype=float)
+        
+        # Ensure 3D coordinates
+        if len(self.position) == 2:
+            self.position = np.append(self.position, 0.0)
+            self.is_3d = False
+        elif len(self.position) == 3:
+            self.is_3d = True
+        else:
+            raise ValueError("Position must be 2D [x,y] or 3D [x,y,z]")
+            
+        if len(self.velocity) == 2:
+            self.velocity = np.append(self.velocity, 0.0)
+        elif len(self.velocity) == 3:
+            pass  # Already 3D
+        else:
+            raise ValueError("Velocity must be 2D [vx,vy] or 3D [vx,vy,vz]")
+
+def orbital_energies(masses: np.ndarray, positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+    """
+    Vectorized per-body orbital energies (kinetic + potential)
+    Matches PhysicsEngine.get_orbital_energy, including the 1000 km cutoff
+    """
+    with timings.phase('diagnostics'):
+        masses = np.asarray(masses, dtype=float)
+        kinetic = 0.5 * masses * np.einsum('ij,ij->i', velocities, velocities)
+
+        separations = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
+        distances = np.sqrt(np.einsum('ijk,ijk->ij', separations, separations))
+        pair_potentials = np.divide(G * np.outer(masses, masses), distances,
+                                    out=np.zeros_like(distances), where=distances > 1e6)
+        
+        return kinetic - pair_potentials.sum(axis=1)
+
+def total_energy(masses: np.ndarray, positions: np.ndarray, velocities: np.ndarray) -> float:
+    """
+    Total energy of the system, counting each pair's potential once
+    Unlike summing orbital_energies, this is conserved by exact dynamics
+    """
+    with timings.phase('diagnostics'):
+        masses = np.asarray(masses, dtype=float)
+        kinetic = 0.5 * np.sum(masses * np.einsum('ij,ij->i', velocities, velocities))
+
+        separations = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
+        distances = np.sqrt(np.einsum('ijk,ijk->ij', separations, separations))
+        pair_potentials = np.divide(G * np.outer(masses, masses), distances,
+                                    out=np.zeros_like(distances), where=distances > 1e6)
+
+        return float(kinetic - 0.5 * pair_potentials.sum())
+
+def compute_accelerations(masses: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """
+    Vectorized accelerations of all bodies, shape (N, 3)
+    Matches PhysicsEngine.acceleration, including the 1000 km cutoff
+    """
+    with timings.phase('forces'):
+        masses = np.asarray(masses, dtype=float)
+
+        # separations[i, j] points from body i to body j
+        separations = positions[np.newaxis, :, :] - positions[:, np.newaxis, :]
+        distances = np.sqrt(np.einsum('ijk,ijk->ij', separations, separations))
+        strength = np.divide(G * masses[np.newaxis, :], distances ** 3,
+                             out=np.zeros_like(distances), where=distances >= 1e6)
+
+        return np.einsum('ij,ijk->ik', strength, separations)
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """Read-only copy of the simulation state at a single instant"""
+    time: float  # seconds since the start of the simulation
+    names: Tuple[str, ...]
+    positions: np.ndarray  # (N, 3) in meters
+    velocities: np.ndarray  # (N, 3) in m/s
+    masses: Optional[np.ndarray] = None  # (N,) in kg
+    trajectories: Optional[Mapping[str, np.ndarray]] = None  # frozen trails, when captured
+    
+    def position_of(self, name: str) -> np.ndarray:
+        """Return the position of the named body"""
+        return self.positions[self.names.index(name)]
+    
+    def velocity_of(self, name: str) -> np.ndarray:
+        """Return the velocity of the named body"""
+        return self.velocities[self.names.index(name)]
+
+def interpolate_states(before: StateSnapshot, after: StateSnapshot, t: float) -> StateSnapshot:
+    """
+    State at time t between two snapshots of the same bodies, by cubic
+    Hermite interpolation
+    
+    The cubic matches both snapshots' positions and velocities, so motion
+    stays smooth across consecutive pairs of states. Its error shrinks with
+    the fourth power of the gap, which lets a coarse physics step be drawn
+    at any frame rate.
+    """
+    h = after.time - before.time
+    if h <= 0:
+        return after
+    s = (t - before.time) / h
+    s2, s3 = s * s, s * s * s
+    positions = ((2 * s3 - 3 * s2 + 1) * before.positions + (s3 - 2 * s2 + s) * h * before.velocities
+                 + (3 * s2 - 2 * s3) * after.positions + (s3 - s2) * h * after.velocities)
+    velocities = ((6 * s2 - 6 * s) / h * (before.positions - after.positions)
+                  + (3 * s2 - 4 * s + 1) * before.velocities + (3 * s2 - 2 * s) * after.velocities)
+    return StateSnapshot(t, after.names, positions, velocities, after.masses)
+
+class PhysicsEngine:
+    """Handles the physics calculations for orbital mechanics"""
+    
+    def __init__(self, bodies: List[CelestialBody]):
+        self.bodies = bodies
+        self.time = 0.0
+        
+    def gravitational_force(self, body1: CelestialBody, body2: CelestialBody) -> np.ndarray:
+        """
+        Calculate gravitational force between two bodies
+        Returns force vector on body1 due to body2
+        """
+        # Vector from body1 to body2
+        r_vec = body2.position - body1.position
+        r = np.linalg.norm(r_vec)
+        
+        # Avoid division by zero for overlapping bodies
+        if r < 1e6:  # 1000 km minimum distance
+            return np.zeros(3)
+        
+        # Gravitational force magnitude
+        force_magnitude = G * body1.mass * body2.mass / (r**2)
+        
+        # Force direction (unit vector from body1 to body2)
+        force_direction = r_vec / r
+        
+        return force_magnitude * force_direction
+    
+    def calculate_forces(self, body: CelestialBody) -> np.ndarray:
+        """
+        Calculate net gravitational force on a body from all other bodies
+        """
+        with timings.phase('forces'):
+            net_force = np.zeros(3)
+            
+            for other_body in self.bodies:
+                if other_body != body:
+                    force = self.gravitational_force(body, other_body)
+                    net_force += force
+                    
+            return net_force
+    
+    def acceleration(self, body: CelestialBody) -> np.ndarray:
+        """
+        Calculate acceleration of a body due to gravitational forces
+        F = ma, so a = F/m
+        """
+        force = self.calculate_forces(body)
+        return force / body.mass
+    
+    def update_positions_velocities(self, dt: float):
+        """
+        Update positions and velocities using Verlet integration
+        More stable than Euler's method for orbital mechanics
+        """
+        with timings.phase('integration'):
+            # Store current positions and velocities
+            old_positions = [body.position.copy() for body in self.bodies]
+            old_velocities = [body.velocity.copy() for body in self.bodies]
+        
+            # Calculate accelerations
+            accelerations = [self.acceleration(body) for body in self.bodies]
+        
+            # Update velocities using current acceleration
+            for i, body in enumerate(self.bodies):
+                body.velocity += accelerations[i] * dt
+        
+            # Update positions using new velocities
+            for i, body in enumerate(self.bodies):
+                body.position += body.velocity * dt
+        
+            # Calculate new accelerations with updated positions
+            new_accelerations = [self.acceleration(body) for body in self.bodies]
+        
+            # Correct velocities using average acceleration
+            for i, body in enumerate(self.bodies):
+                avg_acceleration = (accelerations[i] + new_accelerations[i]) / 2
+                body.velocity = old_velocities[i] + avg_acceleration * dt
+        
+            self.time += dt
+    
+    def get_orbital_energy(self, body: CelestialBody) -> float:
+        """
+        Calculate total orbital energy (kinetic + potential) of a body
+        """
+        with timings.phase('diagnostics'):
+            # Kinetic energy
+            kinetic = 0.5 * body.mass * np.dot(body.velocity, body.velocity)
+        
+            # Potential energy
+            potential = 0.0
+            for other_body in self.bodies:
+                if other_body != body:
+                    r = np.linalg.norm(body.position - other_body.position)
+                    if r > 1e6:  # Avoid division by zero
+                        potential -= G * body.mass * other_body.mass / r
+        
+            return kinetic + potential
+    
+    def get_angular_momentum(self, body: CelestialBody) -> np.ndarray:
+        """
+        Calculate angular momentum vector of a body
+        """
+        return body.mass * np.cross(body.position, body.velocity)
@@ -2,183 +2,116 @@
 Orbital Mechanics Simulator
 A Python implementation of orbital mechanics with gravitational forces
 Supports both 2D and 3D simulations
+
+The physics lives in orbital_physics and is re-exported here. Matplotlib
+is only imported the first time something is plotted, so headless users
+of OrbitalSimulator never pay for it.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-import matplotlib.animation as animation
-from scipy.integrate import solve_ivp
-from dataclasses import dataclass
-from typing import List, Tuple, Union
-import math
-import time
+from typing import Iterator, List, Optional
 
-# Physical constants
-G = 6.67430e-11  # Gravitational constant (m^3 kg^-1 s^-2)
-AU = 1.496e11    # Astronomical unit (m)
-EARTH_MASS = 5.972e24  # Earth mass (kg)
-SUN_MASS = 1.989e30    # Sun mass (kg)
+import scenarios
+from instrumentation import timings
+from keyframes import KeyframeStore
+from scene_renderer import SceneRenderer, starfield
+from trajectory_buffer import TrajectoryBuffer
+from orbital_physics import (G, AU, EARTH_MASS, SUN_MASS, CelestialBody, PhysicsEngine,
+                             StateSnapshot, interpolate_states, orbital_energies, total_energy,
+                             compute_accelerations)
 
-@dataclass
-class CelestialBody:
-    """Represents a celestial body with mass, position, and velocity"""
-    name: str
-    mass: float  # kg
-    position: np.ndarray  # [x, y, z] in meters (3D) or [x, y] (2D)
-    velocity: np.ndarray  # [vx, vy, vz] in m/s (3D) or [vx, vy] (2D)
-    radius: float = 0.0  # visual radius for plotting
-    color: str = 'blue'
-    is_3d: bool = True  # Whether this body exists in 3D space
-    
-    def __post_init__(self):
-        """Ensure position and velocity are numpy arrays with correct dimensions"""
-        self.position = np.array(self.position, dtype=float)
-        self.velocity = np.array(self.velocity, dtype=float)
-        
-        # Ensure 3D coordinates
-        if len(self.position) == 2:
-            self.position = np.append(self.position, 0.0)
-            self.is_3d = False
-        elif len(self.position) == 3:
-            self.is_3d = True
-        else:
-            raise ValueError("Position must be 2D [x,y] or 3D [x,y,z]")
-            
-        if len(self.velocity) == 2:
-            self.velocity = np.append(self.velocity, 0.0)
-        elif len(self.velocity) == 3:
-            pass  # Already 3D
-        else:
-            raise ValueError("Velocity must be 2D [vx,vy] or 3D [vx,vy,vz]")
+# The physics names stay importable from here for code that predates orbital_physics
+__all__ = ['OrbitalSimulator', 'G', 'AU', 'EARTH_MASS', 'SUN_MASS', 'CelestialBody', 'PhysicsEngine',
+           'StateSnapshot', 'interpolate_states', 'orbital_energies', 'total_energy',
+           'compute_accelerations']
 
-class PhysicsEngine:
-    """Handles the physics calculations for orbital mechanics"""
-    
-    def __init__(self, bodies: List[CelestialBody]):
-        self.bodies = bodies
-        self.time = 0.0
-        
-    def gravitational_force(self, body1: CelestialBody, body2: CelestialBody) -> np.ndarray:
-        """
-        Calculate gravitational force between two bodies
-        Returns force vector on body1 due to body2
-        """
-        # Vector from body1 to body2
-        r_vec = body2.position - body1.position
-        r = np.linalg.norm(r_vec)
-        
-        # Avoid division by zero for overlapping bodies
-        if r < 1e6:  # 1000 km minimum distance
-            return np.zeros(3)
-        
-        # Gravitational force magnitude
-        force_magnitude = G * body1.mass * body2.mass / (r**2)
-        
-        # Force direction (unit vector from body1 to body2)
-        force_direction = r_vec / r
-        
-        return force_magnitude * force_direction
-    
-    def calculate_forces(self, body: CelestialBody) -> np.ndarray:
-        """
-        Calculate net gravitational force on a body from all other bodies
-        """
-        net_force = np.zeros(3)
-        
-        for other_body in self.bodies:
-            if other_body != body:
-                force = self.gravitational_force(body, other_body)
-                net_force += force
-                
-        return net_force
-    
-    def acceleration(self, body: CelestialBody) -> np.ndarray:
-        """
-        Calculate acceleration of a body due to gravitational forces
-        F = ma, so a = F/m
-        """
-        force = self.calculate_forces(body)
-        return force / body.mass
-    
-    def update_positions_velocities(self, dt: float):
-        """
-        Update positions and velocities using Verlet integration
-        More stable than Euler's method for orbital mechanics
-        """
-        # Store current positions and velocities
-        old_positions = [body.position.copy() for body in self.bodies]
-        old_velocities = [body.velocity.copy() for body in self.bodies]
-        
-        # Calculate accelerations
-        accelerations = [self.acceleration(body) for body in self.bodies]
-        
-        # Update velocities using current acceleration
-        for i, body in enumerate(self.bodies):
-            body.velocity += accelerations[i] * dt
-        
-        # Update positions using new velocities
-        for i, body in enumerate(self.bodies):
-            body.position += body.velocity * dt
-        
-        # Calculate new accelerations with updated positions
-        new_accelerations = [self.acceleration(body) for body in self.bodies]
-        
-        # Correct velocities using average acceleration
-        for i, body in enumerate(self.bodies):
-            avg_acceleration = (accelerations[i] + new_accelerations[i]) / 2
-            body.velocity = old_velocities[i] + avg_acceleration * dt
-        
-        self.time += dt
-    
-    def get_orbital_energy(self, body: CelestialBody) -> float:
-        """
-        Calculate total orbital energy (kinetic + potential) of a body
-        """
-        # Kinetic energy
-        kinetic = 0.5 * body.mass * np.dot(body.velocity, body.velocity)
-        
-        # Potential energy
-        potential = 0.0
-        for other_body in self.bodies:
-            if other_body != body:
-                r = np.linalg.norm(body.position - other_body.position)
-                if r > 1e6:  # Avoid division by zero
-                    potential -= G * body.mass * other_body.mass / r
-        
-        return kinetic + potential
-    
-    def get_angular_momentum(self, body: CelestialBody) -> np.ndarray:
-        """
-        Calculate angular momentum vector of a body
-        """
-        return body.mass * np.cross(body.position, body.velocity)
+
+def _pyplot():
+    """Import pyplot (and register the 3D projection) on first use"""
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 - registers projection='3d'
+    return plt
 
 class OrbitalSimulator:
     """Main simulator class that handles the simulation loop and visualization"""
     
-    def __init__(self, bodies: List[CelestialBody], dt: float = 3600.0):
+    def __init__(self, bodies: List[CelestialBody], dt: float = 3600.0,
+                 record_trajectories: bool = True):
         """
         Initialize the simulator
         
         Args:
             bodies: List of celestial bodies
             dt: Time step in seconds (default: 1 hour)
+            record_trajectories: Append each body's position to its trail every
+                step; long-running headless users should turn this off
         """
         self.physics_engine = PhysicsEngine(bodies)
         self.dt = dt
+        self.record_trajectories = record_trajectories
         self.time = 0.0
-        self.trajectories = {body.name: [] for body in bodies}
+        self.trajectories = TrajectoryBuffer(body.name for body in bodies)
+        self.keyframes: Optional[KeyframeStore] = None
         
     def step(self):
         """Advance the simulation by one time step"""
+        if self.keyframes is not None and self.keyframes.dt != self.dt:
+            self.keyframes.invalidate(self.time, self.dt)
+        
         # Store current positions for trajectory tracking
-        for body in self.physics_engine.bodies:
-            self.trajectories[body.name].append(body.position.copy())
+        if self.record_trajectories:
+            with timings.phase('trajectory'):
+                bodies = self.physics_engine.bodies
+                self.trajectories.append(self.time, [body.position for body in bodies],
+                                         [body.velocity for body in bodies])
         
         # Update physics
         self.physics_engine.update_positions_velocities(self.dt)
         self.time += self.dt
+        
+        if self.keyframes is not None and self.keyframes.due(self.time):
+            self._record_keyframe()
+    
+    def snapshot(self, trajectories: bool = False) -> StateSnapshot:
+        """
+        Capture the current state as an immutable StateSnapshot
+        
+        Args:
+            trajectories: Also attach a frozen view of the trails (no copy)
+        """
+        bodies = self.physics_engine.bodies
+        positions = np.array([body.position for body in bodies], dtype=float).reshape(-1, 3)
+        velocities = np.array([body.velocity for body in bodies], dtype=float).reshape(-1, 3)
+        masses = np.array([body.mass for body in bodies], dtype=float)
+        for array in (positions, velocities, masses):
+            array.flags.writeable = False
+        return StateSnapshot(self.time, tuple(body.name for body in bodies),
+                             positions, velocities, masses,
+                             self.trajectories.frozen() if trajectories else None)
+    
+    def iter_states(self, duration: float, every: int = 1) -> Iterator[StateSnapshot]:
+        """
+        Lazily advance the simulation, yielding state snapshots
+        
+        The current state is yielded first, then one snapshot after every
+        `every` steps. The final state is always yielded, even when the step
+        count is not a multiple of `every`. No work is done until the consumer
+        asks for the next snapshot.
+        
+        Args:
+            duration: Simulation duration in seconds
+            every: Number of physics steps between yielded snapshots
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        
+        total_steps = int(duration / self.dt)
+        yield self.snapshot()
+        
+        for step in range(1, total_steps + 1):
+            self.step()
+            if step % every == 0 or step == total_steps:
+                yield self.snapshot()
     
     def run_simulation(self, duration: float, steps_per_frame: int = 1):
         """
@@ -189,120 +122,99 @@ class OrbitalSimulator:
             steps_per_frame: Number of physics steps per visualization frame
         """
         total_steps = int(duration / self.dt)
+        if total_steps == 0:
+            return
+        
+        # Print progress every 10% of simulation
+        report_every = max(1, total_steps // 10)
+        start_time = self.time
+        for state in self.iter_states(duration, every=report_every):
+            progress = (state.time - start_time) / (total_steps * self.dt) * 100
+            print(f"Simulation progress: {progress:.1f}%")
+    
+    def enable_keyframes(self, interval: float, directory: Optional[str] = None,
+                         max_keyframes: Optional[int] = None) -> KeyframeStore:
+        """
+        Record a full-state keyframe every `interval` seconds while stepping
         
-        for step in range(total_steps):
+        Args:
+            interval: Simulated seconds between keyframes; shorter intervals
+                make seek faster and use more memory
+            directory: Keep keyframes as .npy files here instead of in memory
+            max_keyframes: Halve the keyframe density whenever this many are stored
+        """
+        if self.keyframes is not None:
+            self.keyframes.close()
+        self.keyframes = KeyframeStore(interval, directory, max_keyframes)
+        self._record_keyframe()
+        return self.keyframes
+    
+    def _trail_length(self) -> int:
+        return self.trajectories.n_samples
+    
+    def _record_keyframe(self):
+        bodies = self.physics_engine.bodies
+        self.keyframes.record(self.time, [body.position for body in bodies],
+                              [body.velocity for body in bodies], self._trail_length(), self.dt)
+    
+    def seek(self, t: float):
+        """
+        Move the simulation to time t (seconds), backwards or forwards
+        
+        Restores the latest keyframe at or before t, unless the current
+        state is closer, and steps through the remaining gap. The simulation
+        ends on the last whole step at or before t. Trails are cut back to the
+        restored keyframe; when the keyframe lies ahead of the current trail,
+        the trails restart from it.
+        """
+        if self.keyframes is None:
+            raise RuntimeError("Keyframes are not enabled; call enable_keyframes first")
+        
+        # Keyframes ahead that were reached with another dt are not on this run's path
+        self.keyframes.invalidate(self.time, self.dt)
+        keyframe = self.keyframes.latest_before(t)
+        current_is_closer = keyframe is not None and keyframe.time <= self.time <= t
+        if keyframe is None:
+            if self.time > t:
+                raise ValueError(f"No keyframe at or before t = {t:.0f} s")
+        elif not current_is_closer:
+            for body, position, velocity in zip(self.physics_engine.bodies,
+                                                keyframe.positions, keyframe.velocities):
+                body.position = position.copy()
+                body.velocity = velocity.copy()
+            self.time = self.physics_engine.time = keyframe.time
+            keep = keyframe.trail_length if keyframe.trail_length <= self._trail_length() else 0
+            self.trajectories.truncate(keep)
+            self.keyframes.invalidate(self.time, self.dt)
+        
+        for _ in range(int(np.floor((t - self.time) / self.dt + 1e-9))):
             self.step()
-            
-            # Print progress every 10% of simulation
-            if step % (total_steps // 10) == 0:
-                progress = (step / total_steps) * 100
-                print(f"Simulation progress: {progress:.1f}%")
+    
+    def set_bodies(self, bodies: List[CelestialBody]):
+        """Replace the simulated bodies and clear the trajectories and keyframes"""
+        self.physics_engine.bodies = bodies
+        self.trajectories = TrajectoryBuffer(body.name for body in bodies)
+        if self.keyframes is not None:
+            self.keyframes.clear()
+            self._record_keyframe()
+    
+    def load_scenario(self, name: str, **params):
+        """
+        Replace the bodies with a registered scenario
+        
+        Args:
+            name: Scenario name (see scenarios.SCENARIOS)
+            **params: n_bodies, belt and seed, as for scenarios.load
+        """
+        self.set_bodies(scenarios.load(name, **params).bodies())
     
     def create_solar_system(self):
         """Create a simple solar system with Sun, Earth, and Moon"""
-        # Clear existing bodies
-        self.physics_engine.bodies.clear()
-        self.trajectories.clear()
-        
-        # Sun at center
-        sun = CelestialBody(
-            name="Sun",
-            mass=SUN_MASS,
-            position=[0, 0],
-            velocity=[0, 0],
-            radius=20,
-            color='yellow'
-        )
-        
-        # Earth in circular orbit
-        earth_distance = 1.496e11  # 1 AU
-        earth_speed = np.sqrt(G * SUN_MASS / earth_distance)
-        earth = CelestialBody(
-            name="Earth",
-            mass=EARTH_MASS,
-            position=[earth_distance, 0],
-            velocity=[0, earth_speed],
-            radius=5,
-            color='blue'
-        )
-        
-        # Moon orbiting Earth
-        moon_distance = 3.844e8  # 384,400 km
-        moon_speed = np.sqrt(G * EARTH_MASS / moon_distance) + earth_speed
-        moon = CelestialBody(
-            name="Moon",
-            mass=7.342e22,  # Moon mass
-            position=[earth_distance + moon_distance, 0],
-            velocity=[0, moon_speed],
-            radius=2,
-            color='gray'
-        )
-        
-        # Add bodies to simulation
-        self.physics_engine.bodies = [sun, earth, moon]
-        self.trajectories = {body.name: [] for body in self.physics_engine.bodies}
+        self.load_scenario('solar_system')
     
     def create_3d_solar_system(self):
         """Create a 3D solar system with inclined orbits"""
-        # Clear existing bodies
-        self.physics_engine.bodies.clear()
-        self.trajectories.clear()
-        
-        # Sun at center
-        sun = CelestialBody(
-            name="Sun",
-            mass=SUN_MASS,
-            position=[0, 0, 0],
-            velocity=[0, 0, 0],
-            radius=20,
-            color='yellow',
-            is_3d=True
-        )
-        
-        # Earth in inclined orbit
-        earth_distance = 1.496e11  # 1 AU
-        earth_speed = np.sqrt(G * SUN_MASS / earth_distance)
-        # Add some inclination and 3D motion
-        earth = CelestialBody(
-            name="Earth",
-            mass=EARTH_MASS,
-            position=[earth_distance, 0, 0],
-            velocity=[0, earth_speed, 0],
-            radius=5,
-            color='blue',
-            is_3d=True
-        )
-        
-        # Moon with 3D orbital motion
-        moon_distance = 3.844e8  # 384,400 km
-        moon_speed = np.sqrt(G * EARTH_MASS / moon_distance) + earth_speed
-        # Moon with some Z-component for 3D effect
-        moon = CelestialBody(
-            name="Moon",
-            mass=7.342e22,
-            position=[earth_distance + moon_distance, 0, 0],
-            velocity=[0, moon_speed, 1000],  # Small Z velocity for 3D motion
-            radius=2,
-            color='gray',
-            is_3d=True
-        )
-        
-        # Add a planet with inclined orbit
-        planet_distance = 2.5 * AU
-        planet_speed = np.sqrt(G * SUN_MASS / planet_distance) * 0.8  # Slower for elliptical orbit
-        planet = CelestialBody(
-            name="Mars",
-            mass=EARTH_MASS * 0.1,
-            position=[planet_distance, 0, planet_distance * 0.1],  # Inclined position
-            velocity=[0, planet_speed, planet_speed * 0.1],  # Inclined velocity
-            radius=4,
-            color='red',
-            is_3d=True
-        )
-        
-        # Add bodies to simulation
-        self.physics_engine.bodies = [sun, earth, moon, planet]
-        self.trajectories = {body.name: [] for body in self.physics_engine.bodies}
+        self.load_scenario('3d_solar_system')
     
     def visualize(self, show_trajectories: bool = True, max_trajectory_points: int = 1000, 
                   use_3d: bool = None, realistic_space: bool = True, interactive: bool = True):
@@ -316,6 +228,8 @@ class OrbitalSimulator:
             realistic_space: Whether to use realistic space colors and styling
             interactive: Whether to enable interactive zoom/pan controls
         """
+        plt = _pyplot()
+        
         # Auto-detect 3D if not specified
         if use_3d is None:
             use_3d = any(body.is_3d for body in self.physics_engine.bodies)
@@ -355,17 +269,13 @@ class OrbitalSimulator:
                         ax.plot(trajectory_au[:, 0], trajectory_au[:, 1], 
                                alpha=0.4, linewidth=0.8, color=traj_color)
         
-        # Plot celestial bodies with realistic appearance
-        for body in self.physics_engine.bodies:
-            pos_au = body.position / AU
-            body_color, body_size = self._get_realistic_body_properties(body)
-            
-            if use_3d:
-                # Create realistic 3D sphere effect
-                self._plot_realistic_body_3d(ax, pos_au, body_color, body_size, body.name)
-            else:
-                # Create realistic 2D body with glow effect
-                self._plot_realistic_body_2d(ax, pos_au, body_color, body_size, body.name)
+        # Plot celestial bodies with realistic appearance, all in one collection
+        from body_layers import add_body_layers
+        bodies = self.physics_engine.bodies
+        if bodies:
+            add_body_layers(ax, [body.name for body in bodies],
+                            [self._get_realistic_body_properties(body) for body in bodies],
+                            [body.position / AU for body in bodies], use_3d=use_3d)
         
         # Set realistic space styling
         if realistic_space:
@@ -431,6 +341,7 @@ class OrbitalSimulator:
     def _add_zoom_controls(self, fig, ax):
         """Add custom zoom controls for better touchpad support"""
         # Create zoom control buttons
+        plt = _pyplot()
         from matplotlib.widgets import Button
         
         # Zoom in button
@@ -508,117 +419,179 @@ class OrbitalSimulator:
         
         ax.figure.canvas.draw()
     
+    def draw_scene(self, ax, trajectories=None, max_trajectory_points: int = 1000,
+                   realistic: bool = True, show_labels: bool = False, styled: bool = False,
+                   blit: bool = False, state: Optional[StateSnapshot] = None) -> SceneRenderer:
+        """
+        Draw the bodies and trails into an existing 2D or 3D axis
+        
+        Shared by animate_simulation and the GUIs' update_visualization. It
+        only touches `ax` (the caller sets the title and puts the frame on
+        screen, e.g. with the returned renderer's draw()), so it can also be
+        timed headlessly on an Agg figure. The artists are created on the
+        first call and moved on later ones (see scene_renderer), so `ax`
+        should not be cleared between frames.
+        
+        Args:
+            ax: 2D or 3D axis to draw into
+            trajectories: Trails to draw (None draws no trails)
+            max_trajectory_points: Most recent points drawn per trail
+            realistic: Detailed body appearance instead of plain markers
+            show_labels: Whether to label each body
+            styled: Whether to apply the space styling to ticks and panes
+            blit: On a 2D axis, make the renderer's draw() redraw only the
+                moving artists over a cached background
+            state: Snapshot to draw the bodies from instead of their live
+                positions, e.g. one published by a simulation thread
+        """
+        renderer = SceneRenderer.for_axes(ax, self, realistic, show_labels, styled, blit)
+        if state is not None and state.names != renderer.names:
+            state = None  # taken before the bodies changed
+        renderer.update(trajectories, max_trajectory_points, state)
+        return renderer
+    
+    def create_animation_data(self):
+        """Per-animation trail store and frame clock, seeded with the current state"""
+        animation_data = {
+            'positions': {body.name: [] for body in self.physics_engine.bodies},
+            'current_frame': 0,
+            'bodies': self.physics_engine.bodies.copy(),
+            'trajectories': {body.name: [] for body in self.physics_engine.bodies},
+            'time': self.time,  # simulated time of the last frame drawn
+            'previous': self.snapshot(),  # state before the last physics step
+        }
+        
+        # Store initial positions
+        for body in self.physics_engine.bodies:
+            animation_data['positions'][body.name].append(body.position.copy())
+            animation_data['trajectories'][body.name].append(body.position.copy())
+        return animation_data
+    
+    def next_animation_state(self, animation_data, time_per_frame: float) -> StateSnapshot:
+        """
+        Move the animation clock on by `time_per_frame` simulated seconds
+        and return the state to draw there
+        
+        The physics only steps (with the simulator's dt) when the frame
+        time passes the latest state; frames in between are interpolated
+        from the states on either side (see interpolate_states), so a
+        frame can be much shorter than a step. The frame's positions are
+        added to the trails in `animation_data` (from create_animation_data).
+        """
+        frame_time = animation_data['time'] + time_per_frame
+        previous = animation_data['previous']
+        while frame_time - self.time > 1e-6 * self.dt:
+            previous = self.snapshot()
+            self.step()
+        animation_data['previous'] = previous
+        animation_data['time'] = frame_time
+        
+        state = self.snapshot()
+        if previous.time < frame_time < state.time:
+            state = interpolate_states(previous, state, frame_time)
+        
+        # Store this frame's positions
+        for name, position in zip(state.names, state.positions):
+            animation_data['positions'][name].append(position)
+            animation_data['trajectories'][name].append(position)
+        return state
+    
+    def advance_animation_frame(self, ax, animation_data, time_per_frame: float) -> SceneRenderer:
+        """
+        Move the animation on by `time_per_frame` simulated seconds and
+        redraw one frame (see next_animation_state)
+        
+        Returns the scene's renderer, whose `artists` are the ones that moved.
+        """
+        state = self.next_animation_state(animation_data, time_per_frame)
+        renderer = self.draw_scene(ax, animation_data['trajectories'], max_trajectory_points=1000,
+                                   styled=True, state=state)
+        self._label_animation_frame(ax, renderer, state.time)
+        return renderer
+    
+    def _label_animation_frame(self, ax, renderer, t):
+        """Show the frame's time (2D shows it inside the axes, where it can be blitted)"""
+        current_time = t / 86400  # Convert to days
+        if renderer.use_3d:
+            ax.set_title(f'🌌 Realistic 3D Orbital Animation (t = {current_time:.1f} days)', 
+                        color='white', fontsize=14, pad=20)
+        else:
+            renderer.caption.set_text(f't = {current_time:.1f} days')
+    
     def animate_simulation(self, duration: float, fps: int = 30, save_gif: bool = False, 
-                          filename: str = "orbital_animation.gif"):
+                          filename: str = "orbital_animation.gif", use_3d: bool = None,
+                          time_per_frame: Optional[float] = None):
         """
-        Create a realistic 3D animation of the orbital mechanics simulation
+        Create a realistic animation of the orbital mechanics simulation
+        
+        2D animations are blitted: only the bodies, trails and time label
+        are redrawn each frame. With save_gif the frames are first rendered
+        in parallel to `filename` (see frame_export), then the animation
+        continues on screen from where the saved one ends.
+        
+        Frames between physics steps are interpolated, so the simulator's
+        dt only sets the accuracy: a large dt with a short time_per_frame
+        still moves smoothly, at a fraction of the steps.
         
         Args:
             duration: Animation duration in seconds
             fps: Frames per second for animation
             save_gif: Whether to save animation as GIF
             filename: Output filename for saved animation
+            use_3d: Whether to animate in 3D (auto-detect if None)
+            time_per_frame: Simulated seconds per frame (default fps * dt)
         """
-        print(f"🎬 Creating realistic 3D animation ({duration}s, {fps} FPS)...")
+        if use_3d is None:
+            use_3d = any(body.is_3d for body in self.physics_engine.bodies)
+        view = "3D" if use_3d else "2D"
+        print(f"🎬 Creating realistic {view} animation ({duration}s, {fps} FPS)...")
+        plt = _pyplot()
+        import matplotlib.animation as animation
         
         # Calculate animation parameters
         total_frames = int(duration * fps)
         frame_interval = 1000 / fps  # milliseconds per frame
-        simulation_dt = self.dt / fps  # Smaller time step for smooth animation
+        if time_per_frame is None:
+            time_per_frame = fps * self.dt
+        print(f"   {time_per_frame / 86400:.2f} days per frame, "
+              f"{time_per_frame / self.dt:.2f} physics steps per frame")
         
-        # Create figure and 3D axis
-        fig = plt.figure(figsize=(16, 12), facecolor='black')
-        ax = fig.add_subplot(111, projection='3d')
-        ax.set_facecolor('black')
+        # Save animation if requested
+        if save_gif:
+            from frame_export import export_animation
+            print(f"Saving animation as {filename}...")
+            export_animation(self, filename, total_frames, fps, time_per_frame, use_3d)
+            print(f"Animation saved as {filename}")
         
-        # Add starfield
-        self._add_starfield(ax, True)
+        # Create figure and axis
+        if use_3d:
+            fig = plt.figure(figsize=(16, 12), facecolor='black')
+            ax = fig.add_subplot(111, projection='3d')
+        else:
+            fig, ax = plt.subplots(figsize=(16, 12), facecolor='black')
+        ax.set_facecolor('black')
         
-        # Initialize animation data
-        animation_data = {
-            'positions': {body.name: [] for body in self.physics_engine.bodies},
-            'current_frame': 0,
-            'bodies': self.physics_engine.bodies.copy(),
-            'trajectories': {body.name: [] for body in self.physics_engine.bodies}
-        }
+        animation_data = self.create_animation_data()
         
-        # Store initial positions
-        for body in self.physics_engine.bodies:
-            animation_data['positions'][body.name].append(body.position.copy())
-            animation_data['trajectories'][body.name].append(body.position.copy())
+        def init():
+            """Build the scene before the first frame"""
+            renderer = self.draw_scene(ax, animation_data['trajectories'], styled=True)
+            if not use_3d:
+                ax.set_title('🌌 Realistic 2D Orbital Animation', color='white', fontsize=14, pad=20)
+            return renderer.artists
         
         def animate(frame):
             """Animation function called for each frame"""
-            ax.clear()
-            ax.set_facecolor('black')
-            
-            # Add starfield for each frame
-            self._add_starfield(ax, True)
-            
-            # Update simulation for this frame
-            for _ in range(fps):
-                self.step()
-            
-            # Store current positions
-            for body in self.physics_engine.bodies:
-                animation_data['positions'][body.name].append(body.position.copy())
-                animation_data['trajectories'][body.name].append(body.position.copy())
-            
-            # Plot trajectories (last 1000 points for performance)
-            for body_name, trajectory in animation_data['trajectories'].items():
-                if len(trajectory) > 1:
-                    recent_trajectory = trajectory[-1000:]  # Limit for performance
-                    trajectory_array = np.array(recent_trajectory)
-                    trajectory_au = trajectory_array / AU
-                    
-                    traj_color = self._get_trajectory_color(body_name)
-                    ax.plot(trajectory_au[:, 0], trajectory_au[:, 1], trajectory_au[:, 2],
-                           alpha=0.6, linewidth=1, color=traj_color)
-            
-            # Plot current positions with realistic effects
-            for body in self.physics_engine.bodies:
-                pos_au = body.position / AU
-                body_color, body_size = self._get_realistic_body_properties(body)
-                
-                # Create realistic 3D body with glow
-                self._plot_realistic_body_3d(ax, pos_au, body_color, body_size, body.name)
-            
-            # Set realistic space styling
-            self._style_space_plot(ax, True)
-            
-            # Set axis properties
-            ax.set_xlabel('X Position (AU)', color='white', fontsize=10)
-            ax.set_ylabel('Y Position (AU)', color='white', fontsize=10)
-            ax.set_zlabel('Z Position (AU)', color='white', fontsize=10)
-            
-            # Dynamic title with time
-            current_time = self.time / 86400  # Convert to days
-            ax.set_title(f'🌌 Realistic 3D Orbital Animation (t = {current_time:.1f} days)', 
-                        color='white', fontsize=14, pad=20)
-            
-            # Set reasonable axis limits
-            all_positions = [body.position / AU for body in self.physics_engine.bodies]
-            if all_positions:
-                positions_array = np.array(all_positions)
-                max_coord = np.max(np.abs(positions_array)) * 1.2
-                ax.set_xlim(-max_coord, max_coord)
-                ax.set_ylim(-max_coord, max_coord)
-                ax.set_zlim(-max_coord, max_coord)
-            
+            renderer = self.advance_animation_frame(ax, animation_data, time_per_frame)
             animation_data['current_frame'] = frame
-            
-            return ax,
+            if renderer.limits_changed and not use_3d:
+                fig.canvas.draw()  # new ticks: refresh the background the frames are blitted onto
+            return renderer.artists
         
         # Create animation
         print("Rendering animation frames...")
-        anim = animation.FuncAnimation(fig, animate, frames=total_frames, 
-                                    interval=frame_interval, blit=False, repeat=True)
-        
-        # Save animation if requested
-        if save_gif:
-            print(f"Saving animation as {filename}...")
-            anim.save(filename, writer='pillow', fps=fps)
-            print(f"Animation saved as {filename}")
+        anim = animation.FuncAnimation(fig, animate, frames=total_frames, init_func=init,
+                                    interval=frame_interval, blit=not use_3d, repeat=True)
         
         # Show animation
         plt.show()
@@ -626,157 +599,15 @@ class OrbitalSimulator:
         return anim
     
     def create_realistic_space_scene(self):
-        """Create a more realistic space scene with enhanced effects"""
-        # Create 3D solar system with realistic parameters
-        self.physics_engine.bodies.clear()
-        self.trajectories.clear()
-        
-        # Sun with realistic properties
-        sun = CelestialBody(
-            name="Sun",
-            mass=SUN_MASS,
-            position=[0, 0, 0],
-            velocity=[0, 0, 0],
-            radius=30,  # Larger for visibility
-            color='#FFD700',
-            is_3d=True
-        )
-        
-        # Mercury
-        mercury_distance = 0.39 * AU
-        mercury_speed = np.sqrt(G * SUN_MASS / mercury_distance)
-        mercury = CelestialBody(
-            name="Mercury",
-            mass=EARTH_MASS * 0.055,
-            position=[mercury_distance, 0, 0],
-            velocity=[0, mercury_speed, 0],
-            radius=4,
-            color='#8C7853',
-            is_3d=True
-        )
-        
-        # Venus
-        venus_distance = 0.72 * AU
-        venus_speed = np.sqrt(G * SUN_MASS / venus_distance)
-        venus = CelestialBody(
-            name="Venus",
-            mass=EARTH_MASS * 0.815,
-            position=[venus_distance, 0, 0],
-            velocity=[0, venus_speed, 0],
-            radius=7,
-            color='#FF8C00',
-            is_3d=True
-        )
-        
-        # Earth with realistic orbit
-        earth_distance = 1.0 * AU
-        earth_speed = np.sqrt(G * SUN_MASS / earth_distance)
-        earth = CelestialBody(
-            name="Earth",
-            mass=EARTH_MASS,
-            position=[earth_distance, 0, 0],
-            velocity=[0, earth_speed, 0],
-            radius=8,
-            color='#4169E1',
-            is_3d=True
-        )
-        
-        # Moon with 3D orbital motion
-        moon_distance = 3.844e8
-        moon_speed = np.sqrt(G * EARTH_MASS / moon_distance) + earth_speed
-        moon = CelestialBody(
-            name="Moon",
-            mass=7.342e22,
-            position=[earth_distance + moon_distance, 0, 0],
-            velocity=[0, moon_speed, 2000],  # 3D motion
-            radius=3,
-            color='#C0C0C0',
-            is_3d=True
-        )
-        
-        # Mars with inclined orbit
-        mars_distance = 1.52 * AU
-        mars_speed = np.sqrt(G * SUN_MASS / mars_distance)
-        mars = CelestialBody(
-            name="Mars",
-            mass=EARTH_MASS * 0.107,
-            position=[mars_distance, 0, mars_distance * 0.05],
-            velocity=[0, mars_speed, mars_speed * 0.05],
-            radius=6,
-            color='#CD5C5C',
-            is_3d=True
-        )
-        
-        # Jupiter
-        jupiter_distance = 5.2 * AU
-        jupiter_speed = np.sqrt(G * SUN_MASS / jupiter_distance)
-        jupiter = CelestialBody(
-            name="Jupiter",
-            mass=EARTH_MASS * 317.8,
-            position=[jupiter_distance, 0, 0],
-            velocity=[0, jupiter_speed, 0],
-            radius=20,
-            color='#D2691E',
-            is_3d=True
-        )
-        
-        # Saturn
-        saturn_distance = 9.58 * AU
-        saturn_speed = np.sqrt(G * SUN_MASS / saturn_distance)
-        saturn = CelestialBody(
-            name="Saturn",
-            mass=EARTH_MASS * 95.2,
-            position=[saturn_distance, 0, 0],
-            velocity=[0, saturn_speed, 0],
-            radius=18,
-            color='#F4A460',
-            is_3d=True
-        )
-        
-        # Uranus
-        uranus_distance = 19.2 * AU
-        uranus_speed = np.sqrt(G * SUN_MASS / uranus_distance)
-        uranus = CelestialBody(
-            name="Uranus",
-            mass=EARTH_MASS * 14.5,
-            position=[uranus_distance, 0, 0],
-            velocity=[0, uranus_speed, 0],
-            radius=12,
-            color='#4FD0E7',
-            is_3d=True
-        )
-        
-        # Neptune
-        neptune_distance = 30.1 * AU
-        neptune_speed = np.sqrt(G * SUN_MASS / neptune_distance)
-        neptune = CelestialBody(
-            name="Neptune",
-            mass=EARTH_MASS * 17.1,
-            position=[neptune_distance, 0, 0],
-            velocity=[0, neptune_speed, 0],
-            radius=12,
-            color='#4169E1',
-            is_3d=True
-        )
-        
-        # Add all bodies to simulation
-        self.physics_engine.bodies = [sun, mercury, venus, earth, moon, mars, 
-                                     jupiter, saturn, uranus, neptune]
-        self.trajectories = {body.name: [] for body in self.physics_engine.bodies}
+        """Create a more realistic space scene with the Sun, eight planets and the Moon"""
+        self.load_scenario('realistic_space_scene')
     
     def _add_starfield(self, ax, use_3d):
-        """Add a starfield background effect"""
-        # Generate random star positions
-        n_stars = 200
+        """Add the fixed, seeded starfield background and return its collection"""
+        stars_x, stars_y, stars_z = starfield()
         if use_3d:
-            stars_x = np.random.uniform(-10, 10, n_stars)
-            stars_y = np.random.uniform(-10, 10, n_stars)
-            stars_z = np.random.uniform(-10, 10, n_stars)
-            ax.scatter(stars_x, stars_y, stars_z, c='white', s=0.1, alpha=0.6)
-        else:
-            stars_x = np.random.uniform(-10, 10, n_stars)
-            stars_y = np.random.uniform(-10, 10, n_stars)
-            ax.scatter(stars_x, stars_y, c='white', s=0.1, alpha=0.6)
+            return ax.scatter(stars_x, stars_y, stars_z, c='white', s=0.1, alpha=0.6)
+        return ax.scatter(stars_x, stars_y, c='white', s=0.1, alpha=0.6)
     
     def _get_trajectory_color(self, body_name):
         """Get realistic trajectory color for each body"""
@@ -823,167 +654,6 @@ class OrbitalSimulator:
         
         return color, size
     
-    def _plot_realistic_body_3d(self, ax, pos, color, size, name):
-        """Plot realistic 3D celestial body with realistic surface appearance"""
-        # Create realistic planet surface
-        if name in ['Sun']:
-            # Sun with corona effect
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*2.5)**2, c='#FFD700', alpha=0.1)  # Outer corona
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*2)**2, c='#FFA500', alpha=0.2)     # Middle corona
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*1.5)**2, c='#FFD700', alpha=0.4)  # Inner corona
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#FFFF00', alpha=0.9, edgecolors='#FF4500', linewidth=1)
-        
-        elif name in ['Earth']:
-            # Earth with continents and atmosphere
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*1.3)**2, c='#87CEEB', alpha=0.3)  # Atmosphere
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#4169E1', alpha=0.9, edgecolors='#228B22', linewidth=0.5)
-            # Add some green continents
-            ax.scatter(pos[0] + size*0.1, pos[1] + size*0.1, pos[2], 
-                      s=(size*0.3)**2, c='#228B22', alpha=0.8)
-            ax.scatter(pos[0] - size*0.1, pos[1] - size*0.1, pos[2], 
-                      s=(size*0.2)**2, c='#32CD32', alpha=0.7)
-        
-        elif name in ['Mars']:
-            # Mars with realistic red surface and polar caps
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#CD5C5C', alpha=0.9, edgecolors='#8B0000', linewidth=0.5)
-            # Polar ice caps
-            ax.scatter(pos[0], pos[1] + size*0.3, pos[2], 
-                      s=(size*0.4)**2, c='#F0F8FF', alpha=0.8)
-            ax.scatter(pos[0], pos[1] - size*0.3, pos[2], 
-                      s=(size*0.4)**2, c='#F0F8FF', alpha=0.8)
-            # Surface features
-            ax.scatter(pos[0] + size*0.2, pos[1], pos[2], 
-                      s=(size*0.1)**2, c='#8B0000', alpha=0.6)
-        
-        elif name in ['Moon']:
-            # Moon with realistic gray surface and craters
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#C0C0C0', alpha=0.9, edgecolors='#A9A9A9', linewidth=0.5)
-            # Craters
-            ax.scatter(pos[0] + size*0.2, pos[1] + size*0.1, pos[2], 
-                      s=(size*0.2)**2, c='#A9A9A9', alpha=0.7)
-            ax.scatter(pos[0] - size*0.15, pos[1] - size*0.2, pos[2], 
-                      s=(size*0.15)**2, c='#A9A9A9', alpha=0.6)
-        
-        elif name in ['Mercury']:
-            # Mercury with rocky surface
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#8C7853', alpha=0.9, edgecolors='#696969', linewidth=0.5)
-            # Surface features
-            ax.scatter(pos[0] + size*0.1, pos[1], pos[2], 
-                      s=(size*0.1)**2, c='#696969', alpha=0.7)
-        
-        elif name in ['Venus']:
-            # Venus with thick atmosphere
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*1.2)**2, c='#FFA500', alpha=0.3)  # Atmosphere
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#FF8C00', alpha=0.9, edgecolors='#FF4500', linewidth=0.5)
-        
-        elif name in ['Jupiter']:
-            # Jupiter with bands and Great Red Spot
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#D2691E', alpha=0.9, edgecolors='#8B4513', linewidth=0.5)
-            # Atmospheric bands
-            ax.scatter(pos[0], pos[1] + size*0.2, pos[2], 
-                      s=(size*0.8)**2, c='#CD853F', alpha=0.7)
-            ax.scatter(pos[0], pos[1] - size*0.2, pos[2], 
-                      s=(size*0.8)**2, c='#A0522D', alpha=0.7)
-            # Great Red Spot
-            ax.scatter(pos[0] + size*0.3, pos[1], pos[2], 
-                      s=(size*0.3)**2, c='#DC143C', alpha=0.8)
-        
-        elif name in ['Saturn']:
-            # Saturn with rings
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#F4A460', alpha=0.9, edgecolors='#D2691E', linewidth=0.5)
-            # Rings
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*1.8)**2, c='#DEB887', alpha=0.3)
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*2.2)**2, c='#F5DEB3', alpha=0.2)
-        
-        elif name in ['Uranus']:
-            # Uranus with blue-green color
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#4FD0E7', alpha=0.9, edgecolors='#20B2AA', linewidth=0.5)
-        
-        elif name in ['Neptune']:
-            # Neptune with deep blue color
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#4169E1', alpha=0.9, edgecolors='#0000CD', linewidth=0.5)
-        
-        elif name in ['Mercury']:
-            # Mercury with rocky surface
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#8C7853', alpha=0.9, edgecolors='#696969', linewidth=0.5)
-            # Surface features
-            ax.scatter(pos[0] + size*0.1, pos[1], pos[2], 
-                      s=(size*0.1)**2, c='#696969', alpha=0.7)
-        
-        elif name in ['Venus']:
-            # Venus with thick atmosphere
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*1.2)**2, c='#FFA500', alpha=0.3)  # Atmosphere
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#FF8C00', alpha=0.9, edgecolors='#FF4500', linewidth=0.5)
-        
-        elif name in ['Jupiter']:
-            # Jupiter with bands and Great Red Spot
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#D2691E', alpha=0.9, edgecolors='#8B4513', linewidth=0.5)
-            # Atmospheric bands
-            ax.scatter(pos[0], pos[1] + size*0.2, pos[2], 
-                      s=(size*0.8)**2, c='#CD853F', alpha=0.7)
-            ax.scatter(pos[0], pos[1] - size*0.2, pos[2], 
-                      s=(size*0.8)**2, c='#A0522D', alpha=0.7)
-            # Great Red Spot
-            ax.scatter(pos[0] + size*0.3, pos[1], pos[2], 
-                      s=(size*0.3)**2, c='#DC143C', alpha=0.8)
-        
-        elif name in ['Saturn']:
-            # Saturn with rings
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#F4A460', alpha=0.9, edgecolors='#D2691E', linewidth=0.5)
-            # Rings
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*1.8)**2, c='#DEB887', alpha=0.3)
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=(size*2.2)**2, c='#F5DEB3', alpha=0.2)
-        
-        elif name in ['Uranus']:
-            # Uranus with blue-green color
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#4FD0E7', alpha=0.9, edgecolors='#20B2AA', linewidth=0.5)
-        
-        elif name in ['Neptune']:
-            # Neptune with deep blue color
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c='#4169E1', alpha=0.9, edgecolors='#0000CD', linewidth=0.5)
-        
-        else:
-            # Default appearance for other bodies
-            ax.scatter(pos[0], pos[1], pos[2], 
-                      s=size**2, c=color, alpha=0.9, edgecolors='white', linewidth=0.5)
-    
-    def _plot_realistic_body_2d(self, ax, pos, color, size, name):
-        """Plot realistic 2D celestial body with glow effect"""
-        # Main body
-        ax.scatter(pos[0], pos[1], s=size**2, c=color, alpha=0.9, 
-                  edgecolors='white', linewidth=0.5)
-        
-        # Add glow effect for larger bodies
-        if size > 10:  # Sun and large stars
-            ax.scatter(pos[0], pos[1], s=(size*1.5)**2, c=color, alpha=0.3)
-            ax.scatter(pos[0], pos[1], s=(size*2)**2, c=color, alpha=0.1)
-    
     def _style_space_plot(self, ax, use_3d):
         """Apply realistic space styling to the plot"""
         # Set dark theme
@@ -1011,6 +681,7 @@ def main():
     """Main function to run the orbital mechanics simulator"""
     print("Orbital Mechanics Simulator - 3D Edition")
     print("=" * 50)
+    plt = _pyplot()
     
     # Create simulator
     simulator = OrbitalSimulator([], dt=3600.0)  # 1 hour time step
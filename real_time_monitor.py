@@ -3,11 +3,13 @@ Real-Time Planet Data Monitor
 Live monitoring of planet data during simulation
 """
 
-from orbital_simulator import OrbitalSimulator, CelestialBody, SUN_MASS, EARTH_MASS, AU, G
+from orbital_simulator import (OrbitalSimulator, CelestialBody, SUN_MASS, EARTH_MASS, AU, G,
+                               orbital_energies)
 import numpy as np
 import matplotlib.pyplot as plt
 import time
 from datetime import datetime
+from data_export import Table, export_table
 
 class RealTimeMonitor:
     def __init__(self):
@@ -50,21 +52,7 @@ class RealTimeMonitor:
         try:
             while self.monitoring and (time.time() - start_time) < duration_hours * 3600:
                 # Record current data
-                current_time = self.simulator.time
-                self.data_history['time'].append(current_time)
-                
-                for body in self.simulator.physics_engine.bodies:
-                    # Position (in AU)
-                    pos_au = body.position / AU
-                    self.data_history['positions'][body.name].append(pos_au.copy())
-                    
-                    # Velocity (in km/s)
-                    vel_kms = body.velocity / 1000
-                    self.data_history['velocities'][body.name].append(vel_kms.copy())
-                    
-                    # Energy
-                    energy = self.simulator.physics_engine.get_orbital_energy(body)
-                    self.data_history['energies'][body.name].append(energy)
+                self.record_snapshot(self.simulator.snapshot())
                 
                 # Step simulation
                 self.simulator.step()
@@ -107,6 +95,33 @@ class RealTimeMonitor:
             print(f"  Speed: {speed:.1f} km/s")
             print(f"  Position: [{pos_au[0]:.3f}, {pos_au[1]:.3f}, {pos_au[2]:.3f}] AU")
     
+    def record_snapshot(self, snapshot):
+        """Record one StateSnapshot into the data history"""
+        self.data_history['time'].append(snapshot.time)
+        
+        if snapshot.masses is None:
+            raise ValueError("Snapshot carries no masses; take it with OrbitalSimulator.snapshot()")
+        energies = orbital_energies(snapshot.masses, snapshot.positions, snapshot.velocities)
+        
+        for i, name in enumerate(snapshot.names):
+            # Position (in AU), velocity (in km/s) and energy
+            self.data_history['positions'].setdefault(name, []).append(snapshot.positions[i] / AU)
+            self.data_history['velocities'].setdefault(name, []).append(snapshot.velocities[i] / 1000)
+            self.data_history['energies'].setdefault(name, []).append(energies[i])
+    
+    async def consume(self, subscriber):
+        """
+        Record frames from an AsyncSimulationRunner subscriber until it closes
+        
+        Frames carry their own masses, so the runner may drive any simulator.
+        """
+        self.monitoring = True
+        async for snapshot in subscriber:
+            if not self.monitoring:
+                break
+            self.record_snapshot(snapshot)
+        self.monitoring = False
+    
     def plot_monitoring_data(self):
         """Plot the monitoring data"""
         if not self.data_history['time']:
@@ -192,43 +207,42 @@ class RealTimeMonitor:
         plt.tight_layout()
         plt.show()
     
-    def export_monitoring_data(self, filename="monitoring_data"):
-        """Export monitoring data"""
-        print(f"\n💾 Exporting monitoring data to {filename}...")
-        
-        # Prepare data for export
-        export_data = {
-            'monitoring_info': {
-                'start_time': datetime.now().isoformat(),
-                'duration_days': self.simulator.time / 86400,
-                'data_points': len(self.data_history['time']),
-                'time_step': self.simulator.dt
-            },
-            'time_series': {
-                'times_days': [t / 86400 for t in self.data_history['time']],
-                'planets': {}
-            }
+    def export_monitoring_data(self, filename="monitoring_data", fmt="npz"):
+        """
+        Export monitoring data as a long-format table, one row per planet per sample
+        
+        Args:
+            filename: Output path without extension
+            fmt: 'npz', 'csv', 'arrow' or 'parquet' (the last two need pyarrow)
+        """
+        path = f"{filename}.{fmt}"
+        print(f"\n💾 Exporting monitoring data to {path}...")
+        
+        info = {
+            'start_time': datetime.now().isoformat(),
+            'duration_days': self.simulator.time / 86400,
+            'data_points': len(self.data_history['time']),
+            'time_step': self.simulator.dt
         }
         
-        # Add planet data
-        for body_name in self.data_history['positions'].keys():
-            if body_name == "Sun":
-                continue
-                
-            planet_data = {
-                'positions_au': self.data_history['positions'][body_name],
-                'velocities_kms': self.data_history['velocities'][body_name],
-                'energies_j': self.data_history['energies'][body_name]
-            }
-            export_data['time_series']['planets'][body_name] = planet_data
-        
-        # Save to JSON
-        import json
-        with open(f"{filename}.json", 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
-        
-        print(f"✅ Monitoring data exported to {filename}.json")
-        return export_data
+        names = [name for name in self.data_history['positions'] if name != "Sun"]
+        shape = (len(names), len(self.data_history['time']))
+        positions = np.array([self.data_history['positions'][name] for name in names]).reshape(*shape, 3)
+        velocities = np.array([self.data_history['velocities'][name] for name in names]).reshape(*shape, 3)
+        energies = np.array([self.data_history['energies'][name] for name in names]).reshape(shape)
+        
+        columns = {}
+        for axis, label in enumerate('xyz'):
+            columns[f'{label}_au'] = positions[:, :, axis].T
+        for axis, label in enumerate('xyz'):
+            columns[f'v{label}_kms'] = velocities[:, :, axis].T
+        columns['energy_j'] = energies.T
+        table = Table(names, np.array(self.data_history['time']) / 86400, columns,
+                      time_column='time_days')
+        rows = export_table(path, table, fmt, metadata=info)
+        
+        print(f"✅ Exported {rows} rows to {path}")
+        return info
     
     def quick_data_check(self):
         """Quick check of current planet data"""
@@ -39,40 +39,9 @@ def binary_star_animation():
     print("\n🌟 Binary Star System Animation")
     print("=" * 35)
     
-    # Create binary star system
-    star1 = CelestialBody(
-        name="Yellow Dwarf",
-        mass=SUN_MASS,
-        position=[-0.2 * AU, 0, 0],
-        velocity=[0, 25000, 0],
-        radius=20,
-        color='#FFD700',
-        is_3d=True
-    )
-    
-    star2 = CelestialBody(
-        name="Red Giant",
-        mass=SUN_MASS * 1.5,
-        position=[0.2 * AU, 0, 0],
-        velocity=[0, -25000, 0],
-        radius=25,
-        color='#FF4500',
-        is_3d=True
-    )
-    
-    # Planet orbiting the binary
-    planet = CelestialBody(
-        name="Exoplanet",
-        mass=EARTH_MASS,
-        position=[1.5 * AU, 0, 0.3 * AU],
-        velocity=[0, 18000, 3000],
-        radius=7,
-        color='#87CEEB',
-        is_3d=True
-    )
-    
-    # Create simulator
-    simulator = OrbitalSimulator([star1, star2, planet], dt=900.0)  # 15 min time step
+    # Close binary with a circumbinary exoplanet
+    simulator = OrbitalSimulator([], dt=900.0)  # 15 min time step
+    simulator.load_scenario('binary_star_demo')
     
     print("Creating binary star animation...")
     anim = simulator.animate_simulation(duration=20, fps=20, save_gif=False)
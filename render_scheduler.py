@@ -0,0 +1,115 @@
+"""
+Render Scheduler
+Paces the redraws of a Tk-embedded figure: any number of redraw requests,
+from any thread, become at most one pending frame drawn on the Tk thread
+
+Usage:
+    scheduler = RenderScheduler(root, app.update_visualization, max_fps=30)
+    scheduler.start()
+    scheduler.request()                  # e.g. after every physics step
+    scheduler.fps, scheduler.frame_time  # frames shown per second, seconds per frame
+    scheduler.stop()
+
+request() only sets a flag, so it is safe to call from a simulation thread
+and costs nothing when frames are already pending. The Tk thread checks the
+flag from a single `after` callback, runs the draw callback (which should
+finish with canvas.draw_idle(), or a blit) and measures the frame once Tk's
+idle queue, where the deferred draw runs, has been processed. The next frame
+is not started until max_fps allows it and a share of the measured frame
+time has been left to mouse and keyboard events, so slow draws lower the
+frame rate instead of queueing work behind the UI.
+"""
+
+import time
+from collections import deque
+
+
+class RenderScheduler:
+    """Coalesces redraw requests into frames paced by the measured draw time"""
+
+    def __init__(self, root, draw, max_fps: float = 30.0, headroom: float = 0.5,
+                 clock=time.perf_counter):
+        """
+        Args:
+            root: Tk widget whose event loop runs the frames
+            draw: Callback that brings the figure up to date
+            max_fps: Upper bound on frames per second
+            headroom: Idle time kept between frames, as a fraction of the
+                average frame time
+            clock: Monotonic clock in seconds
+        """
+        if max_fps <= 0:
+            raise ValueError("max_fps must be positive")
+        self.root = root
+        self.draw = draw
+        self.min_interval = 1.0 / max_fps
+        self.headroom = headroom
+        self.clock = clock
+        self.frames = 0
+        self.frame_time = 0.0  # moving average, seconds
+        self.running = False
+        self._requested = False
+        self._after_id = None
+        self._frame_start = None
+        self._shown = deque()  # completion times of the last second's frames
+
+    def start(self):
+        """Begin checking for requests on the Tk event loop"""
+        if not self.running:
+            self.running = True
+            if self._frame_start is None:  # otherwise the frame in flight schedules the next
+                self._schedule(0.0)
+
+    def stop(self):
+        """Stop drawing; requests are kept for the next start()"""
+        self.running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def request(self):
+        """Ask for a frame; thread-safe, and repeated requests share one frame"""
+        self._requested = True
+
+    @property
+    def fps(self) -> float:
+        """Frames completed per second over the last second"""
+        self._forget_before(self.clock() - 1.0)
+        if len(self._shown) < 2:
+            return float(len(self._shown))
+        return (len(self._shown) - 1) / max(self._shown[-1] - self._shown[0], 1e-9)
+
+    def _schedule(self, delay: float):
+        self._after_id = self.root.after(max(int(delay * 1000), 1), self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        if not self.running:  # stopped after this callback was queued
+            return
+        if not self._requested:
+            self._schedule(self.min_interval)
+            return
+        self._requested = False
+        self._frame_start = self.clock()
+        try:
+            self.draw()
+        finally:
+            # Idle callbacks run in order, so this follows the draw_idle() above
+            self.root.after_idle(self._frame_done)
+
+    def _frame_done(self):
+        if self._frame_start is None:
+            return
+        now = self.clock()
+        elapsed = now - self._frame_start
+        self._frame_start = None
+        self.frame_time = elapsed if self.frames == 0 else 0.8 * self.frame_time + 0.2 * elapsed
+        self.frames += 1
+        self._shown.append(now)
+        self._forget_before(now - 1.0)
+        if self.running:
+            self._schedule(max(self.min_interval - elapsed, self.headroom * self.frame_time))
+
+    def _forget_before(self, cutoff: float):
+        while self._shown and self._shown[0] < cutoff:
+            self._shown.popleft()
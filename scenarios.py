@@ -0,0 +1,319 @@
+"""
+Scenario Registry
+Initial states for every built-in system, stored as compact arrays
+
+Usage:
+    import scenarios
+    state = scenarios.load('inner_planets', belt=200, seed=1)
+    simulator = OrbitalSimulator(state.bodies())
+    # or: simulator.load_scenario('inner_planets', belt=200, seed=1)
+
+Each scenario is built once per parameter set and cached; the arrays are
+read-only so every caller shares the same copy. Parameters:
+    n_bodies  keep only the first n bodies (for 'random': how many to make)
+    belt      add this many asteroids on circular orbits around the first body
+    seed      random seed for the belt (and for 'random')
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from orbital_physics import G, AU, EARTH_MASS, SUN_MASS, CelestialBody
+
+MOON_MASS = 7.342e22
+MOON_DISTANCE = 3.844e8  # m
+
+BELT_INNER = 2.2 * AU
+BELT_OUTER = 3.2 * AU
+
+
+@dataclass(frozen=True)
+class ScenarioState:
+    """Initial state of a scenario as structure-of-arrays"""
+    names: Tuple[str, ...]
+    masses: np.ndarray  # (N,) kg
+    positions: np.ndarray  # (N, 3) m
+    velocities: np.ndarray  # (N, 3) m/s
+    radii: np.ndarray  # (N,) visual radius
+    colors: Tuple[str, ...]
+    is_3d: bool = True
+
+    def __len__(self):
+        return len(self.names)
+
+    def bodies(self) -> List[CelestialBody]:
+        """Fresh CelestialBody objects (2D scenarios get 2D bodies)"""
+        dims = 3 if self.is_3d else 2
+        return [CelestialBody(name, mass, position[:dims], velocity[:dims], radius, color)
+                for name, mass, position, velocity, radius, color
+                in zip(self.names, self.masses, self.positions, self.velocities,
+                       self.radii, self.colors)]
+
+
+# name -> (builder, description, whether the builder takes n_bodies and seed)
+SCENARIOS: Dict[str, Tuple[Callable[..., ScenarioState], str, bool]] = {}
+
+# Scenario labels used by the GUIs' scenario pickers
+GUI_SCENARIOS = {
+    "Complete Solar System": 'realistic_space_scene',
+    "Inner Planets Only": 'inner_planets',
+    "Gas Giants Only": 'gas_giants',
+    "Earth-Moon System": 'earth_moon',
+    "Binary Star System": 'binary_star',
+}
+
+
+def register(name: str, description: str, sized: bool = False):
+    """Decorator adding a builder to the registry"""
+    def decorator(builder):
+        SCENARIOS[name] = (builder, description, sized)
+        return builder
+    return decorator
+
+
+def _from_rows(rows, is_3d: bool = True) -> ScenarioState:
+    """Build a ScenarioState from (name, mass, position, velocity, radius, color) rows"""
+    names, masses, positions, velocities, radii, colors = zip(*rows)
+    return _freeze(ScenarioState(
+        names=tuple(names),
+        masses=np.array(masses, dtype=float),
+        positions=np.array([np.pad(np.asarray(p, dtype=float), (0, 3 - len(p))) for p in positions]),
+        velocities=np.array([np.pad(np.asarray(v, dtype=float), (0, 3 - len(v))) for v in velocities]),
+        radii=np.array(radii, dtype=float),
+        colors=tuple(colors),
+        is_3d=is_3d,
+    ))
+
+
+def _freeze(state: ScenarioState) -> ScenarioState:
+    for array in (state.masses, state.positions, state.velocities, state.radii):
+        array.flags.writeable = False
+    return state
+
+
+def _circular_speed(distance, central_mass=SUN_MASS):
+    return np.sqrt(G * central_mass / distance)
+
+
+def load(name: str, n_bodies: Optional[int] = None, belt: int = 0, seed: int = 0) -> ScenarioState:
+    """Initial state of a registered scenario (cached per parameter set)"""
+    if name not in SCENARIOS:
+        raise ValueError(f"Unknown scenario '{name}'. Choose from: {', '.join(SCENARIOS)}")
+    return _load(name, n_bodies, belt, seed)
+
+
+@lru_cache(maxsize=64)
+def _load(name, n_bodies, belt, seed):
+    builder, _, sized = SCENARIOS[name]
+    if sized:
+        state = builder(n_bodies=n_bodies, seed=seed)
+    else:
+        state = builder()
+        if n_bodies is not None:
+            state = _truncate(state, n_bodies)
+    if belt:
+        state = _add_belt(state, belt, seed)
+    return state
+
+
+def _truncate(state: ScenarioState, n_bodies: int) -> ScenarioState:
+    if n_bodies < 1:
+        raise ValueError("n_bodies must be at least 1")
+    return _freeze(ScenarioState(
+        state.names[:n_bodies], state.masses[:n_bodies].copy(),
+        state.positions[:n_bodies].copy(), state.velocities[:n_bodies].copy(),
+        state.radii[:n_bodies].copy(), state.colors[:n_bodies], state.is_3d))
+
+
+def _add_belt(state: ScenarioState, count: int, seed: int) -> ScenarioState:
+    """Append `count` asteroids on circular orbits around the first body"""
+    rng = np.random.default_rng(seed)
+    distances = rng.uniform(BELT_INNER, BELT_OUTER, count)
+    angles = rng.uniform(0, 2 * np.pi, count)
+    tilt = rng.normal(0, 0.03, count) if state.is_3d else np.zeros(count)
+    speeds = _circular_speed(distances, state.masses[0])
+
+    c, s = np.cos(angles), np.sin(angles)
+    positions = state.positions[0] + distances[:, None] * np.column_stack([c, s, tilt])
+    velocities = state.velocities[0] + speeds[:, None] * np.column_stack([-s, c, np.zeros(count)])
+
+    return _freeze(ScenarioState(
+        names=state.names + tuple(f"Asteroid {i + 1}" for i in range(count)),
+        masses=np.concatenate([state.masses, 10 ** rng.uniform(15, 20, count)]),
+        positions=np.vstack([state.positions, positions]),
+        velocities=np.vstack([state.velocities, velocities]),
+        radii=np.concatenate([state.radii, np.ones(count)]),
+        colors=state.colors + ('#A9A9A9',) * count,
+        is_3d=state.is_3d,
+    ))
+
+
+@register('solar_system', "2D Sun, Earth and Moon")
+def solar_system():
+    earth_speed = _circular_speed(AU)
+    moon_speed = _circular_speed(MOON_DISTANCE, EARTH_MASS) + earth_speed
+    return _from_rows([
+        ("Sun", SUN_MASS, [0, 0], [0, 0], 20, 'yellow'),
+        ("Earth", EARTH_MASS, [AU, 0], [0, earth_speed], 5, 'blue'),
+        ("Moon", MOON_MASS, [AU + MOON_DISTANCE, 0], [0, moon_speed], 2, 'gray'),
+    ], is_3d=False)
+
+
+@register('3d_solar_system', "Sun, Earth, Moon and an inclined Mars")
+def solar_system_3d():
+    earth_speed = _circular_speed(AU)
+    moon_speed = _circular_speed(MOON_DISTANCE, EARTH_MASS) + earth_speed
+    mars_distance = 2.5 * AU
+    mars_speed = _circular_speed(mars_distance) * 0.8  # Slower for an elliptical orbit
+    return _from_rows([
+        ("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 20, 'yellow'),
+        ("Earth", EARTH_MASS, [AU, 0, 0], [0, earth_speed, 0], 5, 'blue'),
+        ("Moon", MOON_MASS, [AU + MOON_DISTANCE, 0, 0], [0, moon_speed, 1000], 2, 'gray'),
+        ("Mars", EARTH_MASS * 0.1, [mars_distance, 0, mars_distance * 0.1],
+         [0, mars_speed, mars_speed * 0.1], 4, 'red'),
+    ])
+
+
+# Planets of the realistic scene: (name, mass in Earth masses, distance in AU, radius, color)
+PLANETS = [
+    ("Mercury", 0.055, 0.39, 4, '#8C7853'),
+    ("Venus", 0.815, 0.72, 7, '#FF8C00'),
+    ("Earth", 1.0, 1.0, 8, '#4169E1'),
+    ("Mars", 0.107, 1.52, 6, '#CD5C5C'),
+    ("Jupiter", 317.8, 5.2, 20, '#D2691E'),
+    ("Saturn", 95.2, 9.58, 18, '#F4A460'),
+    ("Uranus", 14.5, 19.2, 12, '#4FD0E7'),
+    ("Neptune", 17.1, 30.1, 12, '#4169E1'),
+]
+
+
+@register('realistic_space_scene', "Sun, eight planets and the Moon in circular orbits")
+def realistic_space_scene():
+    rows = [("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 30, '#FFD700')]
+    for name, mass, distance_au, radius, color in PLANETS:
+        distance = distance_au * AU
+        speed = _circular_speed(distance)
+        if name == "Mars":  # Slightly inclined orbit
+            rows.append((name, EARTH_MASS * mass, [distance, 0, distance * 0.05],
+                         [0, speed, speed * 0.05], radius, color))
+        else:
+            rows.append((name, EARTH_MASS * mass, [distance, 0, 0], [0, speed, 0], radius, color))
+        if name == "Earth":
+            moon_speed = _circular_speed(MOON_DISTANCE, EARTH_MASS) + speed
+            rows.append(("Moon", MOON_MASS, [distance + MOON_DISTANCE, 0, 0],
+                         [0, moon_speed, 2000], 3, '#C0C0C0'))
+    return _from_rows(rows)
+
+
+@register('inner_planets', "Sun and the four rocky planets")
+def inner_planets():
+    return _from_rows([
+        ("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 25, '#FFD700'),
+        ("Mercury", EARTH_MASS * 0.055, [0.39 * AU, 0, 0], [0, 47870, 0], 4, '#8C7853'),
+        ("Venus", EARTH_MASS * 0.815, [0.72 * AU, 0, 0], [0, 35020, 0], 7, '#FF8C00'),
+        ("Earth", EARTH_MASS, [1.0 * AU, 0, 0], [0, 29780, 0], 8, '#4169E1'),
+        ("Mars", EARTH_MASS * 0.107, [1.52 * AU, 0, 0], [0, 24077, 0], 6, '#CD5C5C'),
+    ])
+
+
+@register('gas_giants', "Sun and the four giant planets")
+def gas_giants():
+    return _from_rows([
+        ("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 30, '#FFD700'),
+        ("Jupiter", EARTH_MASS * 317.8, [5.2 * AU, 0, 0], [0, 13070, 0], 25, '#D2691E'),
+        ("Saturn", EARTH_MASS * 95.2, [9.58 * AU, 0, 0], [0, 9680, 0], 22, '#F4A460'),
+        ("Uranus", EARTH_MASS * 14.5, [19.2 * AU, 0, 0], [0, 6800, 0], 15, '#4FD0E7'),
+        ("Neptune", EARTH_MASS * 17.1, [30.1 * AU, 0, 0], [0, 5430, 0], 15, '#4169E1'),
+    ])
+
+
+@register('earth_moon', "Earth and Moon")
+def earth_moon():
+    return _from_rows([
+        ("Earth", EARTH_MASS, [0, 0, 0], [0, 0, 0], 10, '#4169E1'),
+        ("Moon", MOON_MASS, [MOON_DISTANCE, 0, 0], [0, 1022, 0], 3, '#C0C0C0'),
+    ])
+
+
+@register('binary_star', "Two stars with a circumbinary planet")
+def binary_star():
+    return _from_rows([
+        ("Star 1", SUN_MASS, [-0.5 * AU, 0, 0], [0, 15000, 0], 20, '#FFD700'),
+        ("Star 2", SUN_MASS * 0.8, [0.5 * AU, 0, 0], [0, -15000, 0], 18, '#FFA500'),
+        ("Planet", EARTH_MASS, [2 * AU, 0, 0.3 * AU], [0, 12000, 2000], 6, '#87CEEB'),
+    ])
+
+
+@register('binary_star_demo', "Close yellow dwarf and red giant pair with an exoplanet")
+def binary_star_demo():
+    return _from_rows([
+        ("Yellow Dwarf", SUN_MASS, [-0.2 * AU, 0, 0], [0, 25000, 0], 20, '#FFD700'),
+        ("Red Giant", SUN_MASS * 1.5, [0.2 * AU, 0, 0], [0, -25000, 0], 25, '#FF4500'),
+        ("Exoplanet", EARTH_MASS, [1.5 * AU, 0, 0.3 * AU], [0, 18000, 3000], 7, '#87CEEB'),
+    ])
+
+
+@register('keplers_laws', "One planet on an elliptical orbit")
+def keplers_laws():
+    return _from_rows([
+        ("Sun", SUN_MASS, [0, 0, 0], [0, 0, 0], 20, '#FFD700'),
+        ("Planet", EARTH_MASS, [2 * AU, 0, 0], [0, 20000, 0], 6, '#4169E1'),
+    ])
+
+
+@register('orbit_types', "Circular, elliptical and inclined orbits side by side")
+def orbit_types():
+    return _from_rows([
+        ("Star", SUN_MASS, [0, 0, 0], [0, 0, 0], 15, '#FFD700'),
+        ("Circular Orbit", EARTH_MASS, [AU, 0, 0], [0, 29780, 0], 4, '#4169E1'),
+        ("Elliptical Orbit", EARTH_MASS, [1.5 * AU, 0, 0], [0, 20000, 0], 4, '#CD5C5C'),
+        ("Inclined Orbit", EARTH_MASS, [2 * AU, 0, 0.5 * AU], [0, 15000, 5000], 4, '#32CD32'),
+    ])
+
+
+@register('binary_gravity', "Two stars released from rest")
+def binary_gravity():
+    return _from_rows([
+        ("Body 1", SUN_MASS, [-0.5 * AU, 0, 0], [0, 0, 0], 10, '#FFD700'),
+        ("Body 2", SUN_MASS * 0.5, [0.5 * AU, 0, 0], [0, 0, 0], 8, '#4169E1'),
+    ])
+
+
+@register('random', "A Sun plus random planets on circular, slightly inclined orbits", sized=True)
+def random_system(n_bodies: Optional[int] = None, seed: int = 0):
+    n_bodies = 100 if n_bodies is None else n_bodies
+    rng = np.random.default_rng(seed)
+
+    n_planets = n_bodies - 1
+    distances = rng.uniform(0.3, 30.0, n_planets) * AU
+    angles = rng.uniform(0, 2 * np.pi, n_planets)
+    inclinations = rng.normal(0, 0.02, n_planets)
+    speeds = _circular_speed(distances)
+    masses = EARTH_MASS * rng.uniform(0.05, 300, n_planets)
+
+    c, s = np.cos(angles), np.sin(angles)
+    positions = distances[:, None] * np.column_stack([c, s, inclinations])
+    velocities = speeds[:, None] * np.column_stack([-s, c, np.zeros(n_planets)])
+
+    return _freeze(ScenarioState(
+        names=("Sun",) + tuple(f"Body {i + 1}" for i in range(n_planets)),
+        masses=np.concatenate([[SUN_MASS], masses]),
+        positions=np.vstack([np.zeros(3), positions]),
+        velocities=np.vstack([np.zeros(3), velocities]),
+        radii=np.concatenate([[20.0], np.full(n_planets, 4.0)]),
+        colors=('#FFD700',) + ('blue',) * n_planets,
+    ))
+
+
+def main():
+    """List the registered scenarios"""
+    print("🪐 Registered Scenarios")
+    print("=" * 25)
+    for name, (_, description, _) in SCENARIOS.items():
+        print(f"  {name:<22} {len(load(name)):>4} bodies  {description}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Scene Renderer
+Persistent artists for a simulator's bodies, trails and labels, in a 2D or
+3D axis
+
+Usage:
+    renderer = SceneRenderer.for_axes(ax, simulator, realistic=True)
+    renderer.update(simulator.trajectories, max_trajectory_points=500)
+    renderer.draw()                      # full redraw, or blit (2D)
+    renderer.draw(idle=True)             # full redraws deferred with draw_idle()
+
+    # 2D fast path: only the moving artists are redrawn each frame
+    renderer = SceneRenderer.for_axes(ax_2d, simulator, blit=True)
+
+The first call builds every artist; later frames only move them
+(`set_data_3d`, `_offsets3d`, `set_position_3d`) instead of clearing the
+axis and creating them again. All bodies share one collection (see
+body_layers). OrbitalSimulator.draw_scene goes through here, so the
+animation and both GUIs reuse their artists automatically. The artists
+are rebuilt when the bodies, the options or the simulator drawing into
+the axis change, or when something else clears the axis.
+
+With blit=True on a 2D axis the trails, bodies, labels and title are
+marked animated. A Blitter keeps an image of everything else (stars,
+axes, ticks) from the last full draw and each frame only restores it and
+draws the moving artists on top. 2D limits change in steps, and only
+then is the background redrawn. 3D views always redraw fully, since the
+background changes whenever the view rotates.
+
+Matplotlib is only imported (through body_layers) once a scene is built.
+"""
+
+import functools
+import weakref
+from typing import List
+
+import numpy as np
+
+from orbital_physics import AU
+
+STARFIELD_SEED = 1977
+STARFIELD_SIZE = 200
+STARFIELD_EXTENT = 10.0  # AU; stars fill a cube of +- this
+
+# One renderer per axis; entries disappear with their axis
+_renderers = weakref.WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=8)
+def starfield(n_stars: int = STARFIELD_SIZE, seed: int = STARFIELD_SEED) -> np.ndarray:
+    """
+    Read-only (3, n_stars) star coordinates in AU
+
+    Generated once per (n_stars, seed) from a private generator, so every
+    view shows the same sky and drawing never disturbs np.random.
+    """
+    stars = np.random.default_rng(seed).uniform(-STARFIELD_EXTENT, STARFIELD_EXTENT, (3, n_stars))
+    stars.flags.writeable = False
+    return stars
+
+
+class Blitter:
+    """
+    Redraw a few animated artists over a cached image of the rest of a figure
+
+    The background is captured on every full draw (the first frame, resizes,
+    toolbar zooms, invalidate()), so it never goes stale.
+    """
+
+    def __init__(self, ax, artists):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.artists = sorted(artists, key=lambda artist: artist.get_zorder())
+        for artist in self.artists:
+            artist.set_animated(True)
+        self._background = None
+        self._callback = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        if self.ax not in self.canvas.figure.axes:  # the axis was replaced
+            self.disconnect()
+            return
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        figure = self.canvas.figure
+        for artist in self.artists:
+            figure.draw_artist(artist)
+
+    def invalidate(self):
+        """Redraw the background on the next update"""
+        self._background = None
+
+    def update(self, idle: bool = False):
+        """Show the current state of the animated artists"""
+        if self._background is None:  # a full draw captures it through _on_draw
+            if idle:
+                self.canvas.draw_idle()
+            else:
+                self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_artists()
+            self.canvas.blit(self.canvas.figure.bbox)
+
+    def disconnect(self):
+        if self._callback is not None:
+            self.canvas.mpl_disconnect(self._callback)
+            self._callback = None
+        for artist in self.artists:
+            artist.set_animated(False)
+
+
+class SceneRenderer:
+    """Bodies, trails and labels of one simulator in one axis"""
+
+    def __init__(self, ax, simulator, realistic: bool = True, show_labels: bool = False,
+                 styled: bool = False, blit: bool = False):
+        """
+        Clear `ax` and create the scene's artists
+
+        Args:
+            ax: 2D or 3D axis to draw into
+            simulator: OrbitalSimulator whose bodies are drawn
+            realistic: Detailed body appearance instead of plain markers
+            show_labels: Whether to label each body
+            styled: Whether to apply the space styling to ticks and panes
+            blit: Redraw only the moving artists in draw() (2D axes only)
+        """
+        self.ax = ax
+        self.simulator = simulator
+        self.use_3d = getattr(ax, 'name', None) == '3d'
+        self.options = (realistic, show_labels, styled, blit)
+        self.names = tuple(body.name for body in simulator.physics_engine.bodies)
+        self.limits_changed = True
+        self._blitter = None
+        self._build()
+
+    @classmethod
+    def for_axes(cls, ax, simulator, realistic: bool = True, show_labels: bool = False,
+                 styled: bool = False, blit: bool = False) -> 'SceneRenderer':
+        """The renderer already drawing into `ax`, or a new one if it no longer fits"""
+        renderer = _renderers.get(ax)
+        if renderer is None or not renderer.matches(simulator, realistic, show_labels, styled, blit):
+            if renderer is not None:
+                renderer.close()
+            renderer = _renderers[ax] = cls(ax, simulator, realistic, show_labels, styled, blit)
+        return renderer
+
+    def matches(self, simulator, realistic: bool, show_labels: bool, styled: bool,
+                blit: bool = False) -> bool:
+        """Whether the existing artists can draw this simulator with these options"""
+        return (simulator is self.simulator
+                and self.options == (realistic, show_labels, styled, blit)
+                and self.names == tuple(body.name for body in simulator.physics_engine.bodies)
+                and self._starfield.axes is self.ax)  # ax.clear() detaches every artist
+
+    @property
+    def artists(self) -> List:
+        """The artists that move between frames"""
+        artists = list(self._trails.values())
+        if self._layers is not None:
+            artists.append(self._layers)
+        artists += self._labels
+        if self.caption is not None:
+            artists.append(self.caption)
+        return artists
+
+    def _build(self):
+        ax, simulator = self.ax, self.simulator
+        realistic, show_labels, styled, blit = self.options
+        bodies = simulator.physics_engine.bodies
+
+        ax.clear()
+        ax.set_facecolor('black')
+        self._starfield = simulator._add_starfield(ax, self.use_3d)
+
+        self._trails = {}
+        for body in bodies:
+            empty = ([], [], []) if self.use_3d else ([], [])
+            line, = ax.plot(*empty, alpha=0.6, linewidth=1,
+                            color=simulator._get_trajectory_color(body.name))
+            self._trails[body.name] = line
+
+        # Every body and its decorations in one collection
+        from body_layers import add_body_layers
+        positions = self._positions()
+        self._layers = None
+        if bodies:
+            self._layers = add_body_layers(
+                ax, self.names, [simulator._get_realistic_body_properties(body) for body in bodies],
+                positions, realistic, self.use_3d)
+        self._labels = []
+        if show_labels:
+            for name, pos_au in zip(self.names, positions):
+                xyz = pos_au if self.use_3d else pos_au[:2]
+                self._labels.append(ax.text(*xyz, name, color='white', fontsize=8))
+
+        # 2D: a line of text inside the axes that can be blitted, unlike the title
+        self.caption = None
+        if not self.use_3d:
+            self.caption = ax.text(0.02, 0.98, '', transform=ax.transAxes, color='white',
+                                   fontsize=12, va='top')
+
+        if styled:
+            simulator._style_space_plot(ax, self.use_3d)
+
+        ax.set_xlabel('X Position (AU)', color='white', fontsize=10)
+        ax.set_ylabel('Y Position (AU)', color='white', fontsize=10)
+        if self.use_3d:
+            ax.set_zlabel('Z Position (AU)', color='white', fontsize=10)
+        else:
+            ax.set_aspect('equal')
+        self._limit = None
+
+        if blit and not self.use_3d:
+            self._blitter = Blitter(ax, self.artists + [ax.title])
+
+    def update(self, trajectories=None, max_trajectory_points: int = 1000, state=None) -> bool:
+        """
+        Move the artists to the simulator's current state
+
+        Args:
+            trajectories: Mapping of body name to (T, 3) positions in meters
+                (None hides the trails)
+            max_trajectory_points: Most recent points drawn per trail
+            state: StateSnapshot of the same bodies to draw instead of the
+                simulator's live positions
+
+        Returns whether the axis limits changed, i.e. whether the static
+        background needs a full redraw (also kept as `limits_changed`).
+        """
+        for name, line in self._trails.items():
+            trajectory = trajectories.get(name) if trajectories is not None else None
+            if trajectory is not None and len(trajectory) > 1:
+                trajectory_au = np.asarray(trajectory[-max_trajectory_points:]) / AU
+                if self.use_3d:
+                    line.set_data_3d(trajectory_au[:, 0], trajectory_au[:, 1], trajectory_au[:, 2])
+                else:
+                    line.set_data(trajectory_au[:, 0], trajectory_au[:, 1])
+            elif self.use_3d and len(line.get_data_3d()[0]):
+                line.set_data_3d([], [], [])
+            elif not self.use_3d and len(line.get_xdata()):
+                line.set_data([], [])
+
+        positions = self._positions(state)
+        if self._layers is not None:
+            from body_layers import move_body_layers
+            move_body_layers(self._layers, positions)
+        for pos_au, label in zip(positions, self._labels):
+            if self.use_3d:
+                label.set_position_3d(pos_au)
+            else:
+                label.set_position(pos_au[:2])
+
+        self.limits_changed = len(positions) > 0 and self._set_limit(np.max(np.abs(positions)) * 1.2)
+        if self.limits_changed and self._blitter is not None:
+            self._blitter.invalidate()
+        return self.limits_changed
+
+    def draw(self, idle: bool = False):
+        """
+        Put the current frame on the canvas
+
+        With idle=True full redraws go through canvas.draw_idle(), which the
+        GUI backends run once their pending events are handled; blits are
+        always immediate.
+        """
+        if self._blitter is not None:
+            self._blitter.update(idle)
+        elif idle:
+            self.ax.figure.canvas.draw_idle()
+        else:
+            self.ax.figure.canvas.draw()
+
+    def close(self):
+        """Stop blitting; the artists stay on the axis"""
+        if self._blitter is not None:
+            self._blitter.disconnect()
+            self._blitter = None
+
+    def _positions(self, state=None) -> np.ndarray:
+        if state is not None:
+            return state.positions / AU
+        bodies = self.simulator.physics_engine.bodies
+        return np.array([body.position for body in bodies], dtype=float).reshape(-1, 3) / AU
+
+    def _set_limit(self, max_coord: float) -> bool:
+        if self.use_3d:
+            if max_coord == self._limit:
+                return False
+            self._limit = max_coord
+            self.ax.set_zlim(-max_coord, max_coord)
+        else:
+            # Step the limits so the cached background stays valid between steps
+            if self._limit is not None and self._limit / 2 <= max_coord <= self._limit:
+                return False
+            self._limit = max_coord * 1.25
+        self.ax.set_xlim(-self._limit, self._limit)
+        self.ax.set_ylim(-self._limit, self._limit)
+        return True
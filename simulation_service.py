@@ -0,0 +1,327 @@
+"""
+Asyncio Simulation Service
+Runs one OrbitalSimulator on the event loop and fans state frames out to
+any number of async subscribers (monitors, exporters, sockets)
+
+The Tk GUIs use the threaded counterparts: a SteppingController paces the
+simulation thread in batches at a simulated-time rate, and after each
+batch the thread publishes a snapshot to a LatestState that the Tk thread
+reads.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Callable, List, Optional
+
+from orbital_simulator import OrbitalSimulator, StateSnapshot, AU
+
+_CLOSED = object()  # Sentinel queued when a subscriber is closed
+
+
+class FrameSubscriber:
+    """
+    Bounded frame queue for a single consumer
+
+    When the queue is full the oldest frame is discarded, so a slow consumer
+    always sees the most recent state and never holds back the runner.
+    """
+
+    def __init__(self, maxsize: int = 8, name: str = ""):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.name = name
+        self.queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+        self.closed = False
+
+    def put(self, frame):
+        """Queue a frame without blocking, dropping the oldest one if full"""
+        if self.closed:
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(frame)
+
+    def close(self):
+        """Signal the consumer that no more frames will arrive"""
+        if self.closed:
+            return
+        self.put(_CLOSED)
+        self.closed = True
+
+    async def get(self) -> Optional[StateSnapshot]:
+        """Wait for the next frame; returns None once the subscriber is closed"""
+        frame = await self.queue.get()
+        if frame is _CLOSED:
+            # Leave the sentinel in place for any later get() calls
+            self.queue.put_nowait(_CLOSED)
+            return None
+        return frame
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> StateSnapshot:
+        frame = await self.get()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
+
+
+class LatestState:
+    """
+    Hands the newest StateSnapshot from a simulation thread to readers
+
+    The simulation steps its own bodies (the back buffer) and publishes a
+    read-only snapshot after each batch; readers only ever see published
+    snapshots (the front buffer). Publishing rebinds a single reference,
+    which is atomic, so there is no lock: neither side waits for the other,
+    a reader always gets one complete state, and snapshots nobody read in
+    time are simply replaced.
+    """
+
+    def __init__(self, snapshot: Optional[StateSnapshot] = None):
+        self._snapshot = snapshot
+        self.published = 0
+
+    def publish(self, snapshot: StateSnapshot):
+        """Make `snapshot` the latest state"""
+        self._snapshot = snapshot
+        self.published += 1
+
+    def get(self) -> Optional[StateSnapshot]:
+        """The most recently published snapshot, or None before the first"""
+        return self._snapshot
+
+
+class SteppingController:
+    """
+    Steps a simulator at a target rate of simulated seconds per wall second
+
+    Each tick() takes every step the wall time since the last tick calls
+    for, in one batch, so fast rates use the CPU instead of sleeping between
+    single steps. A batch stops after `max_batch_time` seconds so that the
+    caller can publish a frame; if steps were still due by then, the
+    simulation cannot keep up: `behind` is set and the backlog is dropped
+    rather than carried into ever longer batches.
+    """
+
+    def __init__(self, simulator: OrbitalSimulator, rate: float, max_batch_time: float = 0.05,
+                 tick_interval: float = 0.01, clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            simulator: Simulator to step (its dt may change between ticks)
+            rate: Simulated seconds per wall-clock second
+            max_batch_time: Longest wall time spent stepping in one tick
+            tick_interval: Shortest wait between ticks; steps that fall due
+                in between are taken together
+            clock: Monotonic clock in seconds
+        """
+        self.simulator = simulator
+        self.rate = rate
+        self.max_batch_time = max_batch_time
+        self.tick_interval = tick_interval
+        self.clock = clock
+        self.behind = False
+        self._due = 0.0  # simulated seconds owed but not yet stepped
+        self._last_tick = None
+        self._history = deque()  # (wall time, simulated seconds stepped) over the last second
+        self._stepped = 0.0
+
+    def reset(self):
+        """Start timing afresh, e.g. after a pause; nothing is owed for the gap"""
+        self._due = 0.0
+        self._last_tick = None
+        self._history.clear()
+        self.behind = False
+
+    def tick(self, step: Optional[Callable[[], None]] = None) -> int:
+        """
+        Take the steps that are due; returns how many were taken
+
+        Args:
+            step: Advances the simulation one step (default simulator.step)
+        """
+        step = step or self.simulator.step
+        dt = self.simulator.dt
+        now = self.clock()
+        if self._last_tick is not None:
+            self._due += (now - self._last_tick) * self.rate
+        self._last_tick = now
+
+        due_steps = int(self._due / dt + 1e-9)
+        deadline = now + self.max_batch_time
+        taken = 0
+        while taken < due_steps:
+            step()
+            taken += 1
+            if self.clock() >= deadline:
+                break
+        self._due -= taken * dt
+        self.behind = taken < due_steps
+        if self.behind:
+            self._due = 0.0  # start the next batch from now, not from the backlog
+
+        self._stepped += taken * dt
+        end = self.clock()
+        self._history.append((end, self._stepped))
+        while end - self._history[0][0] > 1.0:
+            self._history.popleft()
+        return taken
+
+    @property
+    def achieved_rate(self) -> float:
+        """Simulated seconds per wall second over about the last second"""
+        if len(self._history) < 2:
+            return 0.0
+        (start, stepped_then), (end, stepped_now) = self._history[0], self._history[-1]
+        return (stepped_now - stepped_then) / (end - start) if end > start else 0.0
+
+    def wait_time(self) -> float:
+        """Wall seconds to wait before the next tick"""
+        if self.rate <= 0:
+            return float('inf')
+        return max(self.tick_interval, (self.simulator.dt - self._due) / self.rate)
+
+
+class AsyncSimulationRunner:
+    """Coroutine-driven runner that advances a simulator in step batches"""
+
+    def __init__(self, simulator: OrbitalSimulator, steps_per_batch: int = 10,
+                 frame_interval: float = 0.0):
+        """
+        Initialize the runner
+
+        Args:
+            simulator: Simulator to advance; only this runner should step it
+            steps_per_batch: Physics steps taken between published frames
+            frame_interval: Target wall-clock seconds between published frames
+                            (0 runs flat out, yielding between batches)
+        """
+        if steps_per_batch < 1:
+            raise ValueError("steps_per_batch must be at least 1")
+        self.simulator = simulator
+        self.steps_per_batch = steps_per_batch
+        self.frame_interval = frame_interval
+        self.subscribers: List[FrameSubscriber] = []
+        self.paused = False
+        self.running = False
+        self.frames_published = 0
+        self._stop_requested = False
+
+    def subscribe(self, maxsize: int = 8, name: str = "") -> FrameSubscriber:
+        """Register a new subscriber; it receives every frame published from now on"""
+        subscriber = FrameSubscriber(maxsize, name)
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: FrameSubscriber):
+        """Remove a subscriber and close its queue"""
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+        subscriber.close()
+
+    def publish(self, frame: StateSnapshot):
+        """Fan a frame out to every subscriber"""
+        for subscriber in self.subscribers:
+            subscriber.put(frame)
+        self.frames_published += 1
+
+    def pause(self):
+        """Stop stepping; subscribers stay connected"""
+        self.paused = True
+
+    def resume(self):
+        """Continue stepping after pause()"""
+        self.paused = False
+
+    def stop(self):
+        """Ask run() to finish after the current batch"""
+        self._stop_requested = True
+
+    async def run(self, duration: Optional[float] = None):
+        """
+        Advance the simulation until stopped or `duration` seconds of
+        simulated time have passed, then close all subscribers
+
+        Args:
+            duration: Simulated seconds to run for (None runs until stop())
+        """
+        self.running = True
+        self._stop_requested = False
+        end_time = None if duration is None else self.simulator.time + duration
+        loop = asyncio.get_running_loop()
+        next_frame = loop.time()
+
+        try:
+            self.publish(self.simulator.snapshot())
+            while not self._stop_requested:
+                if self.paused:
+                    await asyncio.sleep(0.05)
+                    next_frame = loop.time()
+                    continue
+
+                for _ in range(self.steps_per_batch):
+                    if end_time is not None and self.simulator.time >= end_time:
+                        break
+                    self.simulator.step()
+                self.publish(self.simulator.snapshot())
+
+                if end_time is not None and self.simulator.time >= end_time:
+                    break
+
+                # Pace frames on a fixed schedule; if a batch overran, start a
+                # fresh schedule rather than bursting to catch up. A zero
+                # delay still yields so subscribers can drain their queues.
+                next_frame += self.frame_interval
+                delay = next_frame - loop.time()
+                if delay < 0:
+                    next_frame = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
+        finally:
+            self.running = False
+            for subscriber in list(self.subscribers):
+                subscriber.close()
+
+
+async def _print_frames(subscriber: FrameSubscriber):
+    """Example subscriber that prints Earth's distance from the Sun"""
+    async for frame in subscriber:
+        if "Earth" in frame.names:
+            distance = ((frame.position_of("Earth") ** 2).sum() ** 0.5) / AU
+            print(f"  t = {frame.time/86400:6.1f} days  Earth at {distance:.4f} AU")
+
+
+async def _demo():
+    from real_time_monitor import RealTimeMonitor
+
+    monitor = RealTimeMonitor()
+    simulator = monitor.create_solar_system()
+    runner = AsyncSimulationRunner(simulator, steps_per_batch=24)
+
+    printer = runner.subscribe(maxsize=2, name="printer")
+    recorder = runner.subscribe(maxsize=64, name="monitor")
+
+    await asyncio.gather(
+        runner.run(duration=30 * 86400),
+        _print_frames(printer),
+        monitor.consume(recorder),
+    )
+
+    print(f"\n✅ Published {runner.frames_published} frames")
+    for subscriber in (printer, recorder):
+        print(f"   - {subscriber.name}: {subscriber.dropped} frames dropped")
+    print(f"   - Monitor recorded {len(monitor.data_history['time'])} data points")
+
+
+def main():
+    """Run a 30-day simulation shared by a printer and the real-time monitor"""
+    print("🛰️ Async Simulation Service Demo")
+    print("=" * 35)
+    asyncio.run(_demo())
+
+if __name__ == "__main__":
+    main()
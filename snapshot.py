@@ -0,0 +1,178 @@
+"""
+Binary Simulation Snapshots
+Saves and restores a complete OrbitalSimulator as a versioned NumPy .npz
+
+Usage:
+    from snapshot import save_snapshot, load_snapshot
+    save_snapshot('run.npz', simulator)                  # uncompressed, mappable
+    save_snapshot('run.npz', simulator, compress=True)   # smaller, read eagerly
+    simulator = load_snapshot('run.npz')
+
+    python snapshot.py --bodies 100000 --samples 200     # timing demo
+
+Layout (one .npy member per array, structure of arrays):
+    version, time, dt, integrator_time
+    names, masses, radii, colors, is_3d, positions, velocities   per body
+    trajectory_times (T,), trajectory_positions and trajectory_velocities (T, N, 3)
+
+Saves go to a temporary file in the target directory that is renamed over
+the destination, so a crash never leaves a half-written snapshot. Loading
+maps uncompressed members straight from the file, so the trajectory
+history is only read from disk when it is touched.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+
+from orbital_simulator import OrbitalSimulator, CelestialBody
+from trajectory_buffer import TrajectoryBuffer
+
+FORMAT_VERSION = 1
+_LOCAL_HEADER_SIZE = 30  # fixed part of a zip local file header
+
+
+def simulator_arrays(simulator: OrbitalSimulator) -> dict:
+    """All snapshot members of a simulator as arrays"""
+    bodies = simulator.physics_engine.bodies
+    trail = simulator.trajectories
+    return {
+        'version': np.array(FORMAT_VERSION),
+        'time': np.array(simulator.time),
+        'dt': np.array(simulator.dt),
+        # Velocity Verlet carries no state besides positions and velocities
+        'integrator_time': np.array(simulator.physics_engine.time),
+        'names': np.array([body.name for body in bodies], dtype=str),
+        'masses': np.array([body.mass for body in bodies], dtype=float),
+        'radii': np.array([body.radius for body in bodies], dtype=float),
+        'colors': np.array([body.color for body in bodies], dtype=str),
+        'is_3d': np.array([body.is_3d for body in bodies], dtype=bool),
+        'positions': np.array([body.position for body in bodies], dtype=float).reshape(-1, 3),
+        'velocities': np.array([body.velocity for body in bodies], dtype=float).reshape(-1, 3),
+        'trajectory_times': trail.times,
+        'trajectory_positions': trail.positions,
+        'trajectory_velocities': trail.velocities,
+    }
+
+
+def save_snapshot(path: str, simulator: OrbitalSimulator, compress: bool = False):
+    """Atomically write a simulator snapshot to `path`"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix='.snapshot-', suffix='.npz', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            (np.savez_compressed if compress else np.savez)(f, **simulator_arrays(simulator))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, 0o644)  # mkstemp creates the file private to the owner
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _mapped_member(path: str, archive: zipfile.ZipFile, info: zipfile.ZipInfo, f):
+    """Memory-map one stored (uncompressed) .npy member of an .npz"""
+    f.seek(info.header_offset)
+    local_header = f.read(_LOCAL_HEADER_SIZE)
+    name_length = int.from_bytes(local_header[26:28], 'little')
+    extra_length = int.from_bytes(local_header[28:30], 'little')
+    f.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+
+    version = np.lib.format.read_magic(f)
+    read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                   else np.lib.format.read_array_header_2_0)
+    shape, fortran_order, dtype = read_header(f)
+    if dtype.hasobject or not shape or 0 in shape:
+        return None  # nothing worth mapping; read it normally
+    return np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def read_snapshot(path: str, mmap: bool = True) -> dict:
+    """
+    Read every member of a snapshot
+
+    With mmap=True, uncompressed members are returned as read-only memory
+    maps; compressed members are always decompressed into memory.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')]
+            array = None
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                array = _mapped_member(path, archive, info, f)
+            if array is None:
+                with archive.open(info) as member:
+                    array = np.lib.format.read_array(member, allow_pickle=False)
+            arrays[name] = array
+
+    version = int(arrays['version'])
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    return arrays
+
+
+def load_snapshot(path: str, mmap: bool = True) -> OrbitalSimulator:
+    """Rebuild a simulator, its integrator state and trajectories from a snapshot"""
+    data = read_snapshot(path, mmap)
+    bodies = [CelestialBody(str(name), float(mass), position, velocity, float(radius), str(color))
+              for name, mass, position, velocity, radius, color
+              in zip(data['names'], data['masses'], data['positions'], data['velocities'],
+                     data['radii'], data['colors'])]
+    for body, is_3d in zip(bodies, data['is_3d']):
+        body.is_3d = bool(is_3d)
+
+    simulator = OrbitalSimulator(bodies, dt=float(data['dt']))
+    simulator.time = float(data['time'])
+    simulator.physics_engine.time = float(data['integrator_time'])
+    simulator.trajectories = TrajectoryBuffer.from_arrays(
+        simulator.trajectories.names, data['trajectory_times'],
+        data['trajectory_positions'], data['trajectory_velocities'])
+    return simulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time snapshot saves and loads")
+    parser.add_argument('--bodies', type=int, default=100_000)
+    parser.add_argument('--samples', type=int, default=100, help="trajectory samples per body")
+    parser.add_argument('--compress', action='store_true')
+    parser.add_argument('--output', default='snapshot_demo.npz')
+    args = parser.parse_args()
+
+    print("💾 Snapshot Save/Load Demo")
+    print("=" * 30)
+    simulator = OrbitalSimulator([], dt=3600.0)
+    simulator.load_scenario('random', n_bodies=args.bodies)
+    state = simulator.snapshot()
+    rng = np.random.default_rng(0)
+    history = state.positions + rng.normal(0, 1e9, (args.samples, len(state.names), 3))
+    simulator.trajectories.extend(np.arange(args.samples) * simulator.dt, history,
+                                  np.broadcast_to(state.velocities, history.shape))
+
+    start = time.perf_counter()
+    save_snapshot(args.output, simulator, compress=args.compress)
+    saved = time.perf_counter() - start
+    size = os.path.getsize(args.output) / 2**20
+    print(f"Saved {args.bodies:,} bodies x {args.samples} samples ({size:.0f} MiB) "
+          f"in {saved * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    data = read_snapshot(args.output)
+    print(f"Mapped all arrays in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    restored = load_snapshot(args.output)
+    elapsed = time.perf_counter() - start
+    print(f"Rebuilt the simulator in {elapsed * 1000:.0f} ms "
+          f"({restored.trajectories.n_samples} samples restored)")
+    assert np.array_equal(data['trajectory_positions'], simulator.trajectories.positions)
+    os.remove(args.output)
+
+if __name__ == "__main__":
+    main()
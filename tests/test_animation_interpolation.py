@@ -0,0 +1,66 @@
+"""Animation frames interpolated between coarse physics steps"""
+
+import warnings
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from orbital_simulator import AU, OrbitalSimulator, StateSnapshot, interpolate_states
+
+warnings.filterwarnings('ignore', message='Glyph .* missing from font')
+
+YEAR = 365.25 * 86400
+
+
+def circular_state(t):
+    omega = 2 * np.pi / YEAR
+    angle = omega * t
+    positions = AU * np.array([[np.cos(angle), np.sin(angle), 0.0]])
+    velocities = AU * omega * np.array([[-np.sin(angle), np.cos(angle), 0.0]])
+    return StateSnapshot(t, ('Earth',), positions, velocities)
+
+
+def test_hermite_matches_the_ends_and_tracks_an_orbit():
+    h = 10 * 86400
+    before, after = circular_state(0.0), circular_state(h)
+    np.testing.assert_allclose(interpolate_states(before, after, 0.0).positions, before.positions)
+    np.testing.assert_allclose(interpolate_states(before, after, h).velocities, after.velocities)
+
+    middle = interpolate_states(before, after, h / 2)
+    exact = circular_state(h / 2)
+    error = np.linalg.norm(middle.positions - exact.positions)
+    linear_error = np.linalg.norm((before.positions + after.positions) / 2 - exact.positions)
+    assert error < 1e-5 * AU
+    assert error < linear_error / 100
+    np.testing.assert_allclose(middle.velocities, exact.velocities, rtol=1e-3)
+
+
+def test_frames_shorter_than_a_step_are_interpolated():
+    simulator = OrbitalSimulator([], dt=86400.0)
+    simulator.load_scenario('inner_planets')
+    reference = OrbitalSimulator([], dt=86400.0)
+    reference.load_scenario('inner_planets')
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection='3d')
+    animation_data = simulator.create_animation_data()
+    for frame in range(8):
+        simulator.advance_animation_frame(ax, animation_data, 6 * 3600.0)
+    assert simulator.time == pytest.approx(2 * 86400)  # two steps for eight frames
+
+    # Frames on a step are the stepped state; the others lie between their neighbours
+    trail = np.array(animation_data['trajectories']['Earth'])
+    assert len(trail) == 9
+    reference.step()
+    reference.step()
+    earth = [body.name for body in reference.physics_engine.bodies].index('Earth')
+    np.testing.assert_allclose(trail[-1], reference.physics_engine.bodies[earth].position)
+    steps = np.diff(trail, axis=0)
+    assert np.all(np.linalg.norm(steps, axis=1) > 0)
+    np.testing.assert_allclose(np.linalg.norm(steps, axis=1), np.linalg.norm(steps[0]), rtol=0.05)
@@ -0,0 +1,102 @@
+"""AsyncSimulationRunner and FrameSubscriber: batches, drop-oldest queues, shutdown"""
+
+import asyncio
+
+import pytest
+
+from orbital_simulator import OrbitalSimulator
+from simulation_service import AsyncSimulationRunner, FrameSubscriber
+
+DT = 3600.0
+
+
+def new_simulator():
+    simulator = OrbitalSimulator([], dt=DT)
+    simulator.load_scenario('inner_planets')
+    return simulator
+
+
+def test_runner_publishes_one_frame_per_batch_until_duration():
+    runner = AsyncSimulationRunner(new_simulator(), steps_per_batch=4)
+    subscriber = runner.subscribe(maxsize=100)
+
+    async def run():
+        await runner.run(duration=10 * DT)
+        return [frame.time async for frame in subscriber]
+
+    times = asyncio.run(run())
+    # The initial state, then every 4 steps; the last batch stops at the duration
+    assert times == [0.0, 4 * DT, 8 * DT, 10 * DT]
+    assert runner.frames_published == 4 and not runner.running
+    assert subscriber.dropped == 0
+
+
+def test_slow_subscriber_only_sees_the_newest_frames():
+    runner = AsyncSimulationRunner(new_simulator(), steps_per_batch=1)
+    slow = runner.subscribe(maxsize=2)
+    seen = []
+
+    async def consume():
+        async for frame in slow:
+            seen.append(frame.time)
+            await asyncio.sleep(0.01)  # far slower than the runner
+
+    async def run():
+        await asyncio.gather(runner.run(duration=50 * DT), consume())
+
+    asyncio.run(run())
+    assert seen == sorted(seen) and len(set(seen)) == len(seen)
+    assert seen[-1] == 50 * DT  # the final state is never dropped
+    assert len(seen) < runner.frames_published
+    assert slow.dropped == runner.frames_published - len(seen)
+
+
+def test_unread_frames_are_replaced_by_newer_ones():
+    async def run():
+        subscriber = FrameSubscriber(maxsize=3)
+        for frame in range(10):
+            subscriber.put(frame)
+        subscriber.close()
+        return [frame async for frame in subscriber], subscriber
+
+    frames, subscriber = asyncio.run(run())
+    assert frames == [8, 9]  # the close sentinel takes the third slot
+    assert subscriber.dropped == 8
+
+
+def test_close_ends_iteration():
+    async def run():
+        subscriber = FrameSubscriber(maxsize=4)
+        subscriber.put('frame')
+        subscriber.close()
+        subscriber.put('ignored')  # nothing is queued after close
+        frames = [frame async for frame in subscriber]
+        return frames, await subscriber.get(), await subscriber.get()
+
+    frames, *after = asyncio.run(run())
+    assert frames == ['frame']
+    assert after == [None, None]  # every later get() still sees the end
+
+
+def test_stop_closes_every_subscriber():
+    runner = AsyncSimulationRunner(new_simulator(), steps_per_batch=1)
+    subscribers = [runner.subscribe(maxsize=1) for _ in range(2)]
+
+    async def run():
+        task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0.05)
+        runner.stop()
+        await asyncio.wait_for(task, timeout=5)
+        return [[frame async for frame in subscriber] for subscriber in subscribers]
+
+    for frames in asyncio.run(run()):
+        assert frames == []  # with maxsize=1 only the close sentinel is left
+    assert all(subscriber.closed for subscriber in subscribers)
+
+
+def test_maxsize_must_be_positive():
+    async def run():
+        FrameSubscriber(maxsize=0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
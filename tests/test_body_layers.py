@@ -0,0 +1,63 @@
+"""One collection for every body layer: draw order in 3D, and the fallback"""
+
+import warnings
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+from matplotlib import colors as mcolors
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from body_layers import BodyLayerCollection, add_body_layers, layers_for
+
+NAMES = ('Sun', 'Earth', 'Mars')
+PROPERTIES = [('#FFD700', 20.0), ('#4169E1', 10.0), ('#CD5C5C', 8.0)]
+POSITIONS = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [-1.0, 0.0, 0.0]])  # AU, along x
+
+
+def drawn_layers(azim):
+    """Face colors and sizes of the scene's points, in the order they were drawn"""
+    fig = Figure(figsize=(3, 3))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection='3d')
+    ax.view_init(elev=0, azim=azim)  # azim=0 looks along -x: larger x is nearer
+    ax.set_xlim(-2, 2)
+    ax.set_ylim(-2, 2)
+    ax.set_zlim(-2, 2)
+    layers = add_body_layers(ax, NAMES, PROPERTIES, POSITIONS)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)  # no fallback on this matplotlib
+        fig.canvas.draw()
+    return layers.get_facecolor(), layers.get_sizes()
+
+
+def expected_layers(order):
+    """Each body's layers in table order, bodies in `order`"""
+    faces, sizes = [], []
+    for i in order:
+        color, size = PROPERTIES[i]
+        for layer in layers_for(NAMES[i], size):
+            faces.append(mcolors.to_rgba(layer.color or color, layer.alpha))
+            sizes.append((size * layer.scale) ** 2)
+    return np.array(faces), np.array(sizes)
+
+
+@pytest.mark.parametrize('azim, far_to_near', [(0, [2, 0, 1]), (180, [1, 0, 2])])
+def test_bodies_are_drawn_back_to_front_with_layers_in_table_order(azim, far_to_near):
+    faces, sizes = drawn_layers(azim)
+    expected_faces, expected_sizes = expected_layers(far_to_near)
+    np.testing.assert_allclose(faces, expected_faces)
+    np.testing.assert_allclose(sizes, expected_sizes)
+
+
+def test_missing_internals_fall_back_to_the_default_order(monkeypatch):
+    monkeypatch.setattr(BodyLayerCollection, '_INTERNALS', ('_renamed_in_a_new_release',))
+    fig = Figure(figsize=(3, 3))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection='3d')
+    add_body_layers(ax, NAMES, PROPERTIES, POSITIONS)
+    with pytest.warns(RuntimeWarning, match='default order'):
+        fig.canvas.draw()
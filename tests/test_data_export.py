@@ -0,0 +1,66 @@
+"""Columnar export of trajectory buffers"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from data_export import export_trajectories
+from orbital_simulator import OrbitalSimulator
+
+
+@pytest.fixture
+def trajectories():
+    simulator = OrbitalSimulator([], dt=7200.0)
+    simulator.load_scenario('inner_planets')
+    for _ in range(25):
+        simulator.step()
+    return simulator.trajectories
+
+
+def expected_rows(trajectories, body):
+    return np.column_stack([trajectories.times, trajectories.positions[:, body],
+                            trajectories.velocities[:, body]])
+
+
+def test_npz_columns_hold_every_sample(tmp_path, trajectories):
+    path = str(tmp_path / 'run.npz')
+    rows = export_trajectories(path, trajectories, chunk_rows=7)
+    assert rows == 25 * len(trajectories.names)
+
+    with np.load(path) as data:
+        assert list(data['body_names']) == list(trajectories.names)
+        for body in range(len(trajectories.names)):
+            selected = data['body'] == body
+            table = np.column_stack([data[name][selected]
+                                     for name in ('time', 'x', 'y', 'z', 'vx', 'vy', 'vz')])
+            np.testing.assert_array_equal(table, expected_rows(trajectories, body))
+
+
+def test_csv_has_per_sample_velocities_and_exact_values(tmp_path, trajectories):
+    path = str(tmp_path / 'run.csv')
+    export_trajectories(path, trajectories, chunk_rows=10)
+
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        assert next(reader) == ['body', 'time', 'x', 'y', 'z', 'vx', 'vy', 'vz']
+        rows = list(reader)
+    earth = trajectories.names.index('Earth')
+    earth_rows = np.array([[float(v) for v in row[1:]] for row in rows if row[0] == 'Earth'])
+    np.testing.assert_array_equal(earth_rows, expected_rows(trajectories, earth))
+    assert len(np.unique(earth_rows[:, 4:], axis=0)) > 1  # velocity changes over time
+
+
+def test_arrow_round_trip(tmp_path, trajectories):
+    pa = pytest.importorskip('pyarrow')
+    path = str(tmp_path / 'run.arrow')
+    export_trajectories(path, trajectories, chunk_rows=10)
+    table = pa.ipc.open_file(path).read_all()
+    assert table.num_rows == 25 * len(trajectories.names)
+    np.testing.assert_array_equal(np.asarray(table['vx']).reshape(len(trajectories.names), -1).T,
+                                  trajectories.velocities[:, :, 0])
+
+
+def test_unknown_extension_is_rejected(tmp_path, trajectories):
+    with pytest.raises(ValueError):
+        export_trajectories(str(tmp_path / 'run.xlsx'), trajectories)
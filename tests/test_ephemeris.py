@@ -0,0 +1,75 @@
+"""Chebyshev ephemeris: positions against a direct integration, save and load"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip('scipy')
+from scipy.integrate import solve_ivp
+
+import scenarios
+from ephemeris import DAY, Ephemeris, build_ephemeris, fit_error
+from orbital_physics import compute_accelerations
+
+SPAN = 120 * DAY
+TOLERANCE = 1000.0  # m; the fits are good to a fraction of a kilometre
+
+
+@pytest.fixture(scope='module')
+def state():
+    return scenarios.load('solar_system')
+
+
+@pytest.fixture(scope='module')
+def ephemeris(state):
+    return build_ephemeris(state, SPAN, scenario='solar_system')
+
+
+def direct_positions(state, t):
+    """Positions at times t from an integration in SI units, independent of the fit's"""
+    n_bodies = len(state)
+
+    def rhs(_, y):
+        accelerations = compute_accelerations(state.masses, y[:3 * n_bodies].reshape(n_bodies, 3))
+        return np.concatenate([y[3 * n_bodies:], accelerations.ravel()])
+
+    y0 = np.concatenate([state.positions.ravel(), state.velocities.ravel()])
+    solution = solve_ivp(rhs, (0.0, t[-1]), y0, method='DOP853', rtol=1e-12, atol=1e-6, t_eval=t)
+    return solution.y[:3 * n_bodies].T.reshape(len(t), n_bodies, 3)
+
+
+def test_positions_match_a_direct_integration(state, ephemeris):
+    t = np.linspace(0.0, SPAN, 61)
+    expected = direct_positions(state, t)
+    np.testing.assert_allclose(ephemeris.positions(t), expected, rtol=0, atol=TOLERANCE)
+    assert fit_error(ephemeris) < TOLERANCE
+
+    earth = state.names.index('Earth')
+    scalar = ephemeris.position('Earth', t[17])
+    assert scalar.shape == (3,)
+    np.testing.assert_allclose(scalar, expected[17, earth], rtol=0, atol=TOLERANCE)
+    array = ephemeris.position('Earth', t.reshape(61, 1))
+    assert array.shape == (61, 1, 3)
+    np.testing.assert_allclose(array[:, 0], expected[:, earth], rtol=0, atol=TOLERANCE)
+
+    # Velocity from the polynomials: finite differences of the direct positions
+    h = 60.0
+    around = direct_positions(state, np.array([0.0, 40 * DAY - h, 40 * DAY + h]))
+    finite_difference = (around[2, earth] - around[1, earth]) / (2 * h)
+    np.testing.assert_allclose(ephemeris.velocity('Earth', 40 * DAY), finite_difference, atol=1e-3)
+
+    with pytest.raises(ValueError):
+        ephemeris.positions(ephemeris.t_end + DAY)
+
+
+def test_save_and_load_round_trip(ephemeris, tmp_path):
+    path = ephemeris.save(str(tmp_path / 'eph'))
+    assert path == str(tmp_path / 'eph.npz')  # the extension np.savez adds is reported
+
+    loaded = Ephemeris.load(path)
+    assert loaded.names == ephemeris.names and loaded.scenario == 'solar_system'
+    assert (loaded.t0, loaded.segment_length) == (ephemeris.t0, ephemeris.segment_length)
+    np.testing.assert_array_equal(loaded.coefficients, ephemeris.coefficients)
+    t = np.linspace(0.0, SPAN, 17)
+    np.testing.assert_array_equal(loaded.positions(t), ephemeris.positions(t))
+    with pytest.raises(ValueError):
+        fit_error(loaded)  # the reference integration is not saved
@@ -0,0 +1,99 @@
+"""Parallel frame export: ordered, identical to serial, streamed to disk, cancellable"""
+
+import threading
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from frame_export import ExportJob, FrameRenderer, animation_states, export_animation, render_frames
+from orbital_simulator import OrbitalSimulator
+
+pytestmark = pytest.mark.filterwarnings('ignore:Glyph .* missing from font')
+
+SMALL = dict(figsize=(2.4, 1.8), dpi=50)
+
+
+def new_simulator():
+    simulator = OrbitalSimulator([], dt=86400.0)
+    simulator.load_scenario('inner_planets')
+    return simulator
+
+
+def test_parallel_gif_matches_serial(tmp_path):
+    serial, parallel = tmp_path / 'serial.gif', tmp_path / 'parallel.gif'
+    assert export_animation(new_simulator(), str(serial), 6, fps=10, workers=1, **SMALL) == 6
+    assert export_animation(new_simulator(), str(parallel), 6, fps=10, workers=2, **SMALL) == 6
+    assert serial.read_bytes() == parallel.read_bytes()
+
+    with Image.open(parallel) as gif:
+        assert gif.size == (120, 90)
+        assert gif.n_frames == 6
+        assert gif.info['duration'] == 100
+        assert gif.info['loop'] == 0
+
+
+def test_png_sequence_holds_the_exact_frames(tmp_path):
+    simulator = new_simulator()
+    bodies = list(simulator.physics_engine.bodies)
+    progress = []
+    export_animation(simulator, str(tmp_path / 'frames' / 'orbit.png'), 4, fps=10,
+                     time_per_frame=6 * 3600.0, use_3d=False, workers=2,
+                     progress=lambda done, total: progress.append((done, total)), **SMALL)
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert simulator.time == pytest.approx(86400.0)  # one step for four 6 h frames
+
+    states = animation_states(new_simulator(), 4, 6 * 3600.0)
+    renderer = FrameRenderer(bodies, *states, False, 'png', 10, **SMALL)
+    for index in (4, 1):  # any order gives the same frame
+        with Image.open(tmp_path / 'frames' / f'orbit_{index - 1:05d}.png') as png:
+            np.testing.assert_array_equal(np.asarray(png.convert('RGB')), renderer.draw(index))
+
+
+def test_stopping_early_leaves_no_work_behind():
+    simulator = new_simulator()
+    bodies = list(simulator.physics_engine.bodies)
+    scene = (bodies, *animation_states(simulator, 20, 86400.0), True, 'gif', 10, *SMALL.values())
+    frames = render_frames(scene, range(1, 21), workers=2)
+    first = next(frames)
+    frames.close()
+    assert first.startswith(b'!\xf9')  # a graphic control block: delay, then the image
+
+
+def test_cancelled_apng_keeps_the_frames_written(tmp_path):
+    path = tmp_path / 'orbit.apng'
+    cancel = threading.Event()
+
+    def progress(done, total):
+        if done == 2:
+            cancel.set()
+
+    assert export_animation(new_simulator(), str(path), 6, fps=10, time_per_frame=6 * 3600.0,
+                            use_3d=False, workers=1, progress=progress, cancel=cancel, **SMALL) == 2
+
+    bodies = list(new_simulator().physics_engine.bodies)
+    renderer = FrameRenderer(bodies, *animation_states(new_simulator(), 2, 6 * 3600.0),
+                             False, 'png', 10, **SMALL)
+    with Image.open(path) as apng:
+        assert apng.format == 'PNG' and apng.n_frames == 2  # the frame count was patched in
+        assert apng.info['loop'] == 0
+        for index in (1, 2):
+            apng.seek(index - 1)
+            assert apng.info['duration'] == 100
+            np.testing.assert_array_equal(np.asarray(apng.convert('RGB')), renderer.draw(index))
+
+
+def test_export_job_runs_in_the_background(tmp_path):
+    job = ExportJob(new_simulator(), str(tmp_path / 'orbit.gif'), 3, workers=1, **SMALL)
+    assert not job.finished
+    assert job.start().wait(timeout=60)
+    assert job.error is None and job.done == job.frames_written == 3
+
+    cancelled = ExportJob(new_simulator(), str(tmp_path / 'cancelled.gif'), 3, workers=1, **SMALL)
+    cancelled.cancel()
+    assert cancelled.start().wait(timeout=60)
+    assert cancelled.frames_written == 0
+    assert not (tmp_path / 'cancelled.gif').exists()  # an empty animation is not left behind
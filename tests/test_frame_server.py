@@ -0,0 +1,161 @@
+"""FrameServer over localhost: encoding, control messages and slow clients"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from frame_server import FrameClient, FrameDecoder, FrameEncoder, FrameServer
+
+TIMEOUT = 5.0
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 30))
+
+
+async def started_server(**kwargs):
+    kwargs.setdefault('scenario', 'inner_planets')
+    kwargs.setdefault('fps', 200.0)
+    server = FrameServer(port=0, **kwargs)
+    await server.start()
+    return server
+
+
+async def connected_client(server):
+    client = FrameClient()
+    await client.connect(server.host, server.port)
+    return client
+
+
+async def read_info(client, **expected):
+    """Read messages until an info message matching `expected` arrives"""
+    while True:
+        kind, message = await asyncio.wait_for(client.read_message(), TIMEOUT)
+        if kind == 'info' and all(message.get(k) == v for k, v in expected.items()):
+            return message
+
+
+def test_encoder_round_trip_with_keyframes_and_deltas():
+    rng = np.random.default_rng(0)
+    positions = np.cumsum(rng.normal(0, 1e-3, (20, 5, 3)), axis=0).astype(np.float32) + 1.0
+    encoder, decoder = FrameEncoder(delta=True, keyframe_interval=4), FrameDecoder()
+
+    flags = []
+    for index, frame in enumerate(positions):
+        message = encoder.encode(index, index * 3600.0, frame)
+        payload = message[5:]
+        flags.append(payload[5])
+        decoded_index, decoded_time, decoded = decoder.decode(payload)
+        assert (decoded_index, decoded_time) == (index, index * 3600.0)
+        np.testing.assert_allclose(decoded, frame, atol=1e-6)
+
+    assert flags[0] == 0 and flags[5] == 0  # keyframes every 5th frame
+    assert flags[1:5] == [1, 1, 1, 1]
+
+
+def test_delta_stream_decodes_over_localhost():
+    async def scenario():
+        server = await started_server(delta=True, keyframe_interval=5)
+        client = await connected_client(server)
+        try:
+            info = await read_info(client)
+            earth = info['names'].index('Earth')
+            indices = []
+            for _ in range(20):
+                index, _, positions = await asyncio.wait_for(client.read_frame(), TIMEOUT)
+                indices.append(index)
+                assert np.linalg.norm(positions[earth]) == pytest.approx(1.0, abs=0.03)
+            assert indices == sorted(indices)
+        finally:
+            await client.close()
+            await server.stop()
+
+    run(scenario())
+
+
+def test_pause_dt_and_scenario_controls():
+    async def scenario():
+        server = await started_server()
+        client = await connected_client(server)
+        try:
+            await read_info(client)
+
+            await client.send_control('dt', value=1800)
+            await read_info(client, dt=1800.0)
+            assert server.simulator.dt == 1800.0
+
+            await client.send_control('pause')
+            await read_info(client, paused=True)
+            # Frames already queued may still arrive, then the stream goes quiet
+            with pytest.raises(asyncio.TimeoutError):
+                while True:
+                    await asyncio.wait_for(client.read_message(), 0.5)
+
+            await client.send_control('resume')
+            await read_info(client, paused=False)
+            await asyncio.wait_for(client.read_frame(), TIMEOUT)
+
+            await client.send_control('scenario', name='earth_moon')
+            info = await read_info(client, scenario='earth_moon')
+            assert info['names'] == ['Earth', 'Moon']
+            assert server.simulator.physics_engine.time == pytest.approx(server.simulator.time)
+            _, _, positions = await asyncio.wait_for(client.read_frame(), TIMEOUT)
+            assert positions.shape == (2, 3)
+        finally:
+            await client.close()
+            await server.stop()
+
+    run(scenario())
+
+
+def test_bad_command_gets_an_error_reply():
+    async def scenario():
+        server = await started_server()
+        client = await connected_client(server)
+        try:
+            await read_info(client)
+            await client.send_control('warp', factor=9)
+            error = await read_info(client, type='error')
+            assert 'warp' in error['message']
+
+            for value in (0, -60, float('nan'), float('inf')):
+                await client.send_control('dt', value=value)
+                error = await read_info(client, type='error')
+                assert 'dt' in error['message']
+            assert server.simulator.dt == 3600.0
+
+            await client.send_control('scenario', name='no_such_scenario')
+            await read_info(client, type='error')
+            await asyncio.wait_for(client.read_frame(), TIMEOUT)  # still streaming
+        finally:
+            await client.close()
+            await server.stop()
+
+    run(scenario())
+
+
+def test_slow_client_does_not_stall_others():
+    async def scenario():
+        server = await started_server(scenario='random')
+        # Large frames fill the slow client's socket quickly; skip the forces
+        # so stepping 3000 bodies stays cheap
+        server.simulator.load_scenario('random', n_bodies=3000)
+        server.simulator.physics_engine.update_positions_velocities = lambda dt: None
+        slow = await connected_client(server)  # never reads
+        fast = await connected_client(server)
+        try:
+            await read_info(fast)
+            for _ in range(300):
+                await asyncio.wait_for(fast.read_frame(), TIMEOUT)
+
+            # The blocked client only lost its own frames from a bounded queue
+            dropped = [c for c in server.clients if c.frames.dropped > 0]
+            assert len(dropped) == 1
+            assert dropped[0].frames.queue.qsize() <= 2
+        finally:
+            await slow.close()
+            await fast.close()
+            await server.stop()
+
+    run(scenario())
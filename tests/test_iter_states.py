@@ -0,0 +1,49 @@
+"""iter_states: lazy snapshots matching step(), and run_simulation built on it"""
+
+import numpy as np
+import pytest
+
+from orbital_simulator import OrbitalSimulator
+
+
+def new_simulator():
+    simulator = OrbitalSimulator([], dt=6 * 3600.0)
+    simulator.load_scenario('inner_planets')
+    return simulator
+
+
+def test_iter_states_matches_repeated_steps():
+    lazy, stepped = new_simulator(), new_simulator()
+    states = lazy.iter_states(10 * lazy.dt, every=3)
+    first = next(states)
+    assert first.time == 0.0 and lazy.time == 0.0  # nothing runs until asked
+
+    expected = [stepped.snapshot()]
+    for step in range(1, 11):
+        stepped.step()
+        if step % 3 == 0 or step == 10:  # the final state is always yielded
+            expected.append(stepped.snapshot())
+
+    states = [first, *states]
+    assert [state.time for state in states] == [state.time for state in expected]
+    for state, reference in zip(states, expected):
+        assert state.names == reference.names
+        np.testing.assert_array_equal(state.positions, reference.positions)
+        np.testing.assert_array_equal(state.velocities, reference.velocities)
+        assert not state.positions.flags.writeable
+
+    with pytest.raises(ValueError):
+        next(new_simulator().iter_states(lazy.dt, every=0))
+
+
+@pytest.mark.parametrize('steps', [0, 1, 5, 9])
+def test_run_simulation_shorter_than_ten_steps(steps, capsys):
+    # total_steps // 10 was 0 here, and the progress check divided by it
+    simulator = new_simulator()
+    simulator.run_simulation(steps * simulator.dt)
+    assert simulator.time == pytest.approx(steps * simulator.dt)
+    output = capsys.readouterr().out
+    if steps:
+        assert output.splitlines()[-1] == "Simulation progress: 100.0%"
+    else:
+        assert output == ""
@@ -0,0 +1,60 @@
+"""Keyframe seeking against straight runs"""
+
+import numpy as np
+import pytest
+
+from orbital_simulator import OrbitalSimulator
+
+DAY = 86400.0
+
+
+def make_simulator(dt=3600.0):
+    simulator = OrbitalSimulator([], dt=dt)
+    simulator.load_scenario('earth_moon')
+    return simulator
+
+
+def run_to(simulator, t):
+    while simulator.time + 1e-6 < t:
+        simulator.step()
+    return simulator.snapshot().positions
+
+
+@pytest.mark.parametrize('on_disk', [False, True])
+def test_seek_backwards_matches_straight_run(tmp_path, on_disk):
+    simulator = make_simulator()
+    simulator.enable_keyframes(10 * DAY, directory=str(tmp_path) if on_disk else None)
+    simulator.seek(60 * DAY)
+    simulator.seek(23 * DAY)
+
+    assert simulator.time == pytest.approx(23 * DAY)
+    assert len(simulator.trajectories['Earth']) == 23 * 24
+    np.testing.assert_array_equal(simulator.snapshot().positions,
+                                  run_to(make_simulator(), 23 * DAY))
+
+
+def test_max_keyframes_thins_the_store():
+    simulator = make_simulator()
+    store = simulator.enable_keyframes(DAY, max_keyframes=8)
+    simulator.seek(40 * DAY)
+    assert len(store) <= 8
+    assert store.interval > DAY
+
+
+def test_seek_after_dt_change_follows_the_new_step():
+    simulator = make_simulator()
+    simulator.enable_keyframes(10 * DAY)
+    simulator.seek(100 * DAY)
+    simulator.seek(23 * DAY)
+    simulator.dt = 7200.0
+    simulator.seek(50 * DAY)
+
+    reference = make_simulator()
+    run_to(reference, 23 * DAY)
+    reference.dt = 7200.0
+    np.testing.assert_array_equal(simulator.snapshot().positions, run_to(reference, 50 * DAY))
+
+
+def test_seek_requires_keyframes():
+    with pytest.raises(RuntimeError):
+        make_simulator().seek(DAY)
@@ -0,0 +1,58 @@
+"""Snapshots handed between threads: frozen trails and the latest-state slot"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from orbital_simulator import OrbitalSimulator
+from simulation_service import LatestState
+
+
+@pytest.fixture
+def simulator():
+    simulator = OrbitalSimulator([], dt=6 * 3600.0)
+    simulator.load_scenario('inner_planets')
+    return simulator
+
+
+def test_frozen_trails_survive_appends_and_truncation(simulator):
+    for _ in range(10):
+        simulator.step()
+    state = simulator.snapshot(trajectories=True)
+    frozen = state.trajectories
+    expected = frozen.positions.copy()
+    assert not frozen.positions.flags.writeable and not state.positions.flags.writeable
+
+    simulator.trajectories.truncate(4)
+    for _ in range(20):
+        simulator.step()
+    np.testing.assert_array_equal(frozen.positions, expected)
+    np.testing.assert_array_equal(simulator.trajectories.positions[:4], expected[:4])
+    assert simulator.trajectories.n_samples == 24
+
+
+def test_readers_always_see_a_whole_published_state(simulator):
+    latest = LatestState(simulator.snapshot(trajectories=True))
+    done = threading.Event()
+
+    def physics():
+        for _ in range(300):
+            simulator.step()
+            latest.publish(simulator.snapshot(trajectories=True))
+        done.set()
+
+    thread = threading.Thread(target=physics)
+    thread.start()
+    seen = 0
+    while not done.is_set() or seen == 0:
+        state = latest.get()
+        trail = state.trajectories
+        # Every trail sample precedes the state, and the last one is one step back
+        assert trail.n_samples == round(state.time / simulator.dt)
+        if trail.n_samples:
+            assert trail.times[-1] == pytest.approx(state.time - simulator.dt)
+        seen += 1
+    thread.join()
+    assert latest.published == 300
+    assert latest.get().time == simulator.time
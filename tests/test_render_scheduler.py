@@ -0,0 +1,125 @@
+"""RenderScheduler on a fake Tk event loop: coalescing, pacing and FPS"""
+
+import pytest
+
+from render_scheduler import RenderScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRoot:
+    """Records after/after_idle callbacks like Tk, and runs them on demand"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.timers = {}  # id -> (due time, callback)
+        self.idle = []
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        self.timers[self._next_id] = (self.clock.now + ms / 1000, callback)
+        return self._next_id
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def after_cancel(self, after_id):
+        del self.timers[after_id]
+
+    def run_next(self):
+        """Run idle callbacks, else advance the clock to the next timer and run it"""
+        if self.idle:
+            self.idle.pop(0)()
+            return
+        after_id = min(self.timers, key=lambda i: self.timers[i][0])
+        due, callback = self.timers.pop(after_id)
+        self.clock.now = max(self.clock.now, due)
+        callback()
+
+
+@pytest.fixture
+def loop():
+    clock = FakeClock()
+    return clock, FakeRoot(clock)
+
+
+def test_requests_are_coalesced_into_one_pending_frame(loop):
+    clock, root = loop
+    draws = []
+    scheduler = RenderScheduler(root, lambda: draws.append(clock.now), max_fps=50, clock=clock)
+    scheduler.start()
+    for _ in range(1000):
+        scheduler.request()
+    assert len(root.timers) == 1
+
+    for _ in range(20):
+        root.run_next()
+        assert len(root.timers) + len(root.idle) == 1
+    assert len(draws) == 1
+
+    scheduler.stop()
+    assert not root.timers and not scheduler.running
+
+
+def test_frames_are_paced_by_max_fps_and_frame_time(loop):
+    clock, root = loop
+    draw_cost = [0.001]
+
+    def draw():
+        clock.now += draw_cost[0]
+
+    scheduler = RenderScheduler(root, draw, max_fps=50, headroom=0.5, clock=clock)
+    scheduler.start()
+
+    def run_for(seconds):
+        end = clock.now + seconds
+        while clock.now < end:
+            scheduler.request()
+            root.run_next()
+
+    run_for(2.0)
+    assert scheduler.fps == pytest.approx(50, rel=0.1)  # capped by max_fps
+    assert scheduler.frame_time == pytest.approx(0.001)
+
+    draw_cost[0] = 0.1  # slower than the cap: leave half a frame to the UI
+    run_for(3.0)
+    assert scheduler.frame_time == pytest.approx(0.1, rel=0.01)
+    assert scheduler.fps == pytest.approx(1 / 0.15, rel=0.1)
+
+    # No requests, no frames
+    for _ in range(100):
+        root.run_next()
+    assert scheduler.fps == 0.0
+
+
+def test_stop_during_a_frame_does_not_schedule_another(loop):
+    clock, root = loop
+    scheduler = RenderScheduler(root, lambda: None, clock=clock)
+    scheduler.start()
+    scheduler.request()
+    root.run_next()  # draws; the frame finishes in the idle queue
+    scheduler.stop()
+    root.run_next()
+    assert not root.timers and not root.idle and scheduler.frames == 1
+
+    scheduler.start()
+    assert len(root.timers) == 1
+
+
+def test_a_tick_queued_before_stop_does_nothing(loop):
+    clock, root = loop
+    draws = []
+    scheduler = RenderScheduler(root, lambda: draws.append(clock.now), clock=clock)
+    scheduler.start()
+    (_, tick), = root.timers.values()
+    scheduler.stop()
+    scheduler.request()  # e.g. a simulation thread's last request
+    tick()  # Tk may already have dequeued the callback when stop() cancelled it
+    assert not draws and not root.timers and not root.idle
@@ -0,0 +1,133 @@
+"""Persistent scene artists: reuse, rebuilds and identical frames"""
+
+import warnings
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from orbital_simulator import OrbitalSimulator
+from scene_renderer import SceneRenderer, starfield
+
+warnings.filterwarnings('ignore', message='Glyph .* missing from font')
+
+
+def new_axis():
+    fig = Figure(figsize=(4, 3), facecolor='black')
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111, projection='3d')
+
+
+def render(fig):
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+@pytest.fixture
+def simulator():
+    simulator = OrbitalSimulator([], dt=6 * 3600.0)
+    simulator.load_scenario('inner_planets')
+    for _ in range(20):
+        simulator.step()
+    return simulator
+
+
+def test_frames_reuse_artists(simulator):
+    fig, ax = new_axis()
+    simulator.draw_scene(ax, simulator.trajectories, show_labels=True)
+    artists = list(ax.collections) + list(ax.lines) + list(ax.texts)
+
+    simulator.step()
+    simulator.draw_scene(ax, simulator.trajectories, show_labels=True)
+    assert list(ax.collections) + list(ax.lines) + list(ax.texts) == artists
+
+    simulator.draw_scene(ax, simulator.trajectories, show_labels=False)
+    assert not ax.texts  # changed options rebuild the scene
+
+
+@pytest.mark.parametrize('realistic', [True, False])
+def test_updated_frame_matches_a_fresh_build(simulator, realistic):
+    fig, ax = new_axis()
+    simulator.draw_scene(ax, simulator.trajectories, realistic=realistic, show_labels=True)
+    for _ in range(10):
+        simulator.step()
+    simulator.draw_scene(ax, simulator.trajectories, realistic=realistic, show_labels=True)
+    updated = render(fig)
+
+    fresh_fig, fresh_ax = new_axis()
+    SceneRenderer(fresh_ax, simulator, realistic, True).update(simulator.trajectories)
+    np.testing.assert_array_equal(updated, render(fresh_fig))
+
+
+def test_new_bodies_or_cleared_axis_rebuild(simulator):
+    fig, ax = new_axis()
+    simulator.draw_scene(ax, simulator.trajectories)
+    ax.clear()
+    simulator.draw_scene(ax, simulator.trajectories)
+    assert ax.collections
+
+    simulator.load_scenario('earth_moon')
+    simulator.draw_scene(ax, None)
+    assert len(ax.lines) == 2
+
+
+def test_starfield_is_fixed_and_leaves_global_random_alone(simulator):
+    np.random.seed(0)
+    expected = np.random.random()
+    np.random.seed(0)
+    fig, ax = new_axis()
+    collection = simulator._add_starfield(ax, True)
+    assert np.random.random() == expected
+
+    np.testing.assert_array_equal(np.array(collection._offsets3d), starfield())
+    assert starfield() is starfield()
+
+
+@pytest.mark.parametrize('realistic', [True, False])
+def test_bodies_share_one_collection_drawn_back_to_front(simulator, realistic):
+    fig, ax = new_axis()
+    simulator.draw_scene(ax, None, realistic=realistic)
+    assert len(ax.collections) == 2  # starfield and bodies
+    render(fig)
+
+    layers = ax.collections[1]
+    drawn = layers.body_index[layers._z_markers_idx]
+    # Each body's layers are drawn together and in table order
+    assert len(set(drawn)) == len(simulator.physics_engine.bodies)
+    assert sum(drawn[1:] != drawn[:-1]) == len(set(drawn)) - 1
+    for body in set(drawn):
+        assert list(layers._z_markers_idx[drawn == body]) == sorted(np.flatnonzero(layers.body_index == body))
+
+
+def test_2d_blitted_frame_matches_a_full_redraw(simulator):
+    fig = Figure(figsize=(4, 3), facecolor='black')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    renderer = simulator.draw_scene(ax, simulator.trajectories, show_labels=True, blit=True)
+    renderer.draw()  # first frame: full draw, caches the background
+    assert all(artist.get_animated() for artist in renderer.artists)
+
+    for _ in range(3):
+        simulator.step()
+    assert simulator.draw_scene(ax, simulator.trajectories, show_labels=True, blit=True) is renderer
+    assert not renderer.limits_changed
+    renderer.draw()
+    blitted = np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    np.testing.assert_array_equal(blitted, render(fig))
+
+
+def test_snapshot_is_drawn_instead_of_the_live_bodies(simulator):
+    state = simulator.snapshot(trajectories=True)
+    fig, ax = new_axis()
+    simulator.draw_scene(ax, state.trajectories, state=state)
+    published = render(fig)
+
+    for _ in range(10):
+        simulator.step()  # the live bodies move on; the published state does not
+    simulator.draw_scene(ax, state.trajectories, state=state)
+    np.testing.assert_array_equal(render(fig), published)
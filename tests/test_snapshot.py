@@ -0,0 +1,66 @@
+"""Binary snapshot round-trips"""
+
+import os
+
+import numpy as np
+import pytest
+
+from orbital_simulator import OrbitalSimulator
+from snapshot import load_snapshot, read_snapshot, save_snapshot
+
+
+def run_simulator(steps=50):
+    simulator = OrbitalSimulator([], dt=7200.0)
+    simulator.load_scenario('inner_planets')
+    for _ in range(steps):
+        simulator.step()
+    return simulator
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_round_trip_restores_state_and_trajectories(tmp_path, compress):
+    simulator = run_simulator()
+    path = str(tmp_path / 'run.npz')
+    save_snapshot(path, simulator, compress=compress)
+    restored = load_snapshot(path)
+
+    assert restored.time == simulator.time
+    assert restored.dt == simulator.dt
+    assert [b.name for b in restored.physics_engine.bodies] == \
+        [b.name for b in simulator.physics_engine.bodies]
+    np.testing.assert_array_equal(restored.snapshot().positions, simulator.snapshot().positions)
+    np.testing.assert_array_equal(restored.trajectories.velocities,
+                                  simulator.trajectories.velocities)
+    assert os.listdir(tmp_path) == ['run.npz']  # no temporary files left behind
+
+
+def test_uncompressed_members_are_memory_mapped(tmp_path):
+    path = str(tmp_path / 'run.npz')
+    save_snapshot(path, run_simulator())
+    assert isinstance(read_snapshot(path)['trajectory_positions'], np.memmap)
+
+
+def test_loaded_run_continues_like_the_original(tmp_path):
+    simulator = run_simulator()
+    path = str(tmp_path / 'run.npz')
+    save_snapshot(path, simulator)
+    restored = load_snapshot(path)
+    for sim in (simulator, restored):
+        for _ in range(10):
+            sim.step()
+    np.testing.assert_array_equal(restored.trajectories.positions,
+                                  simulator.trajectories.positions)
+
+
+def test_failed_save_keeps_the_previous_snapshot(tmp_path, monkeypatch):
+    path = str(tmp_path / 'run.npz')
+    save_snapshot(path, run_simulator(10))
+    before = open(path, 'rb').read()
+
+    def broken_savez(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(np, 'savez', broken_savez)
+    with pytest.raises(OSError):
+        save_snapshot(path, run_simulator(20))
+    assert open(path, 'rb').read() == before
+    assert os.listdir(tmp_path) == ['run.npz']
@@ -0,0 +1,70 @@
+"""SteppingController on a fake clock: batching, pacing and falling behind"""
+
+import pytest
+
+from orbital_simulator import OrbitalSimulator
+from simulation_service import SteppingController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def simulator():
+    simulator = OrbitalSimulator([], dt=3600.0)
+    simulator.load_scenario('inner_planets')
+    return simulator
+
+
+def run(controller, clock, seconds, step_cost):
+    """Tick like the GUI loop for `seconds` of wall time; returns the batch sizes"""
+    def step():
+        controller.simulator.step()
+        clock.now += step_cost
+
+    batches = []
+    end = clock.now + seconds
+    while clock.now < end:
+        batches.append(controller.tick(step))
+        clock.now += min(controller.wait_time(), 0.05)
+    return batches
+
+
+def test_rate_is_met_with_batches_of_steps(simulator):
+    clock = FakeClock()
+    controller = SteppingController(simulator, rate=10 * 86400, clock=clock)
+    batches = run(controller, clock, 2.0, step_cost=1e-4)
+
+    # 10 days per second of 1 hour steps is 240 steps per second
+    assert simulator.time == pytest.approx(20 * 86400, rel=0.05)
+    assert max(batches) > 1
+    assert controller.achieved_rate == pytest.approx(10 * 86400, rel=0.05)
+    assert not controller.behind
+
+
+def test_slow_rates_wait_between_single_steps(simulator):
+    clock = FakeClock()
+    controller = SteppingController(simulator, rate=3600 * 5, clock=clock)  # 5 steps/s
+    batches = run(controller, clock, 2.0, step_cost=1e-4)
+    assert max(batches) == 1
+    assert simulator.time == pytest.approx(10 * 3600, abs=3600)
+
+
+def test_reports_when_it_cannot_keep_up(simulator):
+    clock = FakeClock()
+    controller = SteppingController(simulator, rate=1000 * 86400, max_batch_time=0.05, clock=clock)
+    batches = run(controller, clock, 1.0, step_cost=0.01)  # at most 100 steps/s
+
+    assert controller.behind
+    assert max(batches) <= 6  # batches stay bounded by max_batch_time
+    assert controller.achieved_rate < 0.01 * controller.rate
+
+    controller.rate = 3600.0
+    run(controller, clock, 1.5, step_cost=0.01)
+    assert not controller.behind
+    assert controller.achieved_rate == pytest.approx(3600.0, rel=0.1)
@@ -0,0 +1,66 @@
+"""Delta and quantized trajectory compression"""
+
+import numpy as np
+import pytest
+
+from orbital_simulator import OrbitalSimulator
+from trajectory_codec import CompressedTrajectory, decode, encode
+
+
+@pytest.fixture(scope='module')
+def trajectories():
+    simulator = OrbitalSimulator([], dt=6 * 3600.0)
+    simulator.load_scenario('inner_planets')
+    for _ in range(2000):
+        simulator.step()
+    return simulator.trajectories
+
+
+def test_lossless_round_trip_is_bit_exact(trajectories):
+    restored = decode(encode(trajectories.positions))
+    assert restored.shape == trajectories.positions.shape
+    np.testing.assert_array_equal(restored, trajectories.positions)
+
+
+def test_quantized_error_is_within_tolerance(trajectories):
+    data = encode(trajectories.positions, tolerance=10.0)
+    error = np.abs(decode(data) - trajectories.positions)
+    assert error.max() <= 10.0 * (1 + 1e-9)
+    assert trajectories.positions.nbytes / len(data) > 10
+
+
+def test_archive_round_trip(tmp_path, trajectories):
+    packed = CompressedTrajectory.from_buffer(trajectories, position_tolerance=1.0,
+                                              velocity_tolerance=1e-4)
+    path = str(tmp_path / 'history.npz')
+    packed.save(path)
+    restored = CompressedTrajectory.load(path).to_buffer()
+
+    assert restored.names == trajectories.names
+    np.testing.assert_array_equal(restored.times, trajectories.times)
+    assert np.abs(restored.velocities - trajectories.velocities).max() <= 1e-4 * (1 + 1e-9)
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        decode(b'NOPE' + bytes(40))
+
+
+@pytest.mark.parametrize('n_samples', [0, 1, 3, 50])
+def test_short_series_round_trip(n_samples):
+    values = np.random.default_rng(n_samples).normal(0, 1e11, (n_samples, 2, 3))
+    np.testing.assert_array_equal(decode(encode(values)), values)
+    assert np.abs(decode(encode(values, tolerance=1.0)) - values).max(initial=0) <= 1.0
+
+
+@pytest.mark.parametrize('values, tolerance, order', [
+    (np.array([[1e11], [np.nan]]), 1.0, 4),
+    (np.array([[np.inf], [0.0]]), 1.0, 4),
+    (np.array([[1e11], [2e11]]), 1e-6, 4),     # 1e17 steps: beyond float64 precision
+    (np.array([[1e11], [2e11]]), 1.0, 40),     # 1e11 steps, doubled 40 times
+])
+def test_rejects_values_the_tolerance_cannot_hold(values, tolerance, order):
+    with pytest.raises(ValueError):
+        encode(values, tolerance=tolerance, order=order)
+    restored = decode(encode(values, order=order))  # lossless keeps them as they are
+    np.testing.assert_array_equal(restored, values)
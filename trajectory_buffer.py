@@ -0,0 +1,136 @@
+"""
+Trajectory Buffer
+Growable NumPy storage for the state history of a fixed set of bodies
+
+Usage:
+    trail = TrajectoryBuffer(['Sun', 'Earth'])
+    trail.append(t, positions, velocities)   # (N, 3) arrays
+    trail['Earth']                           # (T, 3) view of Earth's positions
+    trail.positions, trail.velocities        # (T, N, 3) views
+    trail.frozen()                           # read-only view that later writes never change
+
+The buffer behaves as a read-only mapping from body name to that body's
+positions, so code written for the old dict of position lists keeps
+working. Samples live in one contiguous block that doubles when full, so
+appending is amortised O(N) and saving or exporting needs no conversion.
+"""
+
+from collections.abc import Mapping
+from typing import Iterable
+
+import numpy as np
+
+
+class TrajectoryBuffer(Mapping):
+    """Time, position and velocity samples of N bodies, oldest first"""
+
+    def __init__(self, names: Iterable[str], capacity: int = 0):
+        self.names = tuple(names)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        n_bodies = len(self.names)
+        self._times = np.empty(capacity)
+        self._positions = np.empty((capacity, n_bodies, 3))
+        self._velocities = np.empty((capacity, n_bodies, 3))
+        self.n_samples = 0
+
+    @classmethod
+    def from_arrays(cls, names, times, positions, velocities) -> 'TrajectoryBuffer':
+        """
+        Wrap existing (T,), (T, N, 3), (T, N, 3) arrays without copying
+
+        Read-only arrays (e.g. memory-mapped snapshots) are copied the
+        first time the buffer is written to.
+        """
+        buffer = cls(names, capacity=0)
+        if len(times) != len(positions) or positions.shape != velocities.shape:
+            raise ValueError("times, positions and velocities must have matching lengths")
+        if positions.shape[1:] != (len(buffer.names), 3):
+            raise ValueError(f"Expected arrays of shape (T, {len(buffer.names)}, 3)")
+        buffer._times, buffer._positions, buffer._velocities = times, positions, velocities
+        buffer.n_samples = len(times)
+        return buffer
+
+    # Mapping interface: body name -> (T, 3) positions
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._positions[:self.n_samples, self._index[name]]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times[:self.n_samples]
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions[:self.n_samples]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self._velocities[:self.n_samples]
+
+    @property
+    def nbytes(self) -> int:
+        return self.times.nbytes + self.positions.nbytes + self.velocities.nbytes
+
+    def velocity(self, name: str) -> np.ndarray:
+        """(T, 3) view of one body's velocities"""
+        return self._velocities[:self.n_samples, self._index[name]]
+
+    def _reserve(self, needed: int):
+        """Make room for `needed` samples in writable storage"""
+        capacity = len(self._times)
+        if needed <= capacity and self._times.flags.writeable:
+            return
+        capacity = max(needed, 2 * capacity, 16)
+        for attribute in ('_times', '_positions', '_velocities'):
+            old = getattr(self, attribute)
+            new = np.empty((capacity,) + old.shape[1:])
+            new[:self.n_samples] = old[:self.n_samples]
+            setattr(self, attribute, new)
+
+    def append(self, t: float, positions, velocities):
+        """Add one sample of all bodies"""
+        self._reserve(self.n_samples + 1)
+        self._times[self.n_samples] = t
+        self._positions[self.n_samples] = positions
+        self._velocities[self.n_samples] = velocities
+        self.n_samples += 1
+
+    def extend(self, times, positions, velocities):
+        """Add many samples at once"""
+        count = len(times)
+        self._reserve(self.n_samples + count)
+        end = self.n_samples + count
+        self._times[self.n_samples:end] = times
+        self._positions[self.n_samples:end] = positions
+        self._velocities[self.n_samples:end] = velocities
+        self.n_samples = end
+
+    def frozen(self) -> 'TrajectoryBuffer':
+        """
+        Read-only buffer of the current samples, sharing their memory
+
+        Appends only write past the last sample and truncate() moves later
+        writes to new storage, so the frozen samples never change and can be
+        read from another thread without copying.
+        """
+        arrays = []
+        for array in (self.times, self.positions, self.velocities):
+            view = array.view()
+            view.flags.writeable = False
+            arrays.append(view)
+        return TrajectoryBuffer.from_arrays(self.names, *arrays)
+
+    def truncate(self, n_samples: int = 0):
+        """Keep only the first `n_samples` samples"""
+        n_samples = max(0, n_samples)
+        if n_samples < self.n_samples:
+            # Appending in place would overwrite samples that frozen() views still show
+            self._times = self._times[:n_samples]
+            self._positions = self._positions[:n_samples]
+            self._velocities = self._velocities[:n_samples]
+            self.n_samples = n_samples
@@ -0,0 +1,219 @@
+"""
+Trajectory Codec
+Compresses smooth time series of positions and velocities by predicting
+each sample from the two before it and storing only the small residuals
+
+Usage:
+    from trajectory_codec import CompressedTrajectory
+    packed = CompressedTrajectory.from_buffer(simulator.trajectories,
+                                              position_tolerance=1.0)    # meters
+    packed.nbytes                        # bytes held
+    packed.save('history.npz')           # archive
+    trajectories = CompressedTrajectory.load('history.npz').to_buffer()
+
+    python trajectory_codec.py --days 3650 --tolerance 100
+
+Each (T, ...) array is encoded along time:
+    1. values become int64: rounded to multiples of 2 * tolerance when a
+       tolerance is given (error at most `tolerance`), otherwise the raw
+       float64 bit patterns (lossless)
+    2. order-k differences of those integers (default 4), i.e. the error of
+       a polynomial prediction from the previous k samples; the first k
+       differences of each stream are kept whole as int64
+    3. zigzag to unsigned, narrowed to the smallest integer width that holds
+       every residual, split into byte planes, then zlib
+Integer arithmetic wraps consistently, so decoding (k cumulative sums) is
+exact and quantization error never accumulates.
+"""
+
+import argparse
+import struct
+import time
+import zlib
+from typing import Optional, Sequence
+
+import numpy as np
+
+from trajectory_buffer import TrajectoryBuffer
+
+MAGIC = b'OTRC'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sBBBBBd')  # magic, version, quantized, order, width, ndim, quantum
+MODE_LOSSLESS = 0
+MODE_QUANTIZED = 1
+DEFAULT_ORDER = 4
+MAX_QUANTIZED_BITS = 53  # quantized values beyond 2**53 steps would not decode exactly
+
+
+def encode(values: np.ndarray, tolerance: Optional[float] = None, level: int = 6,
+           order: int = DEFAULT_ORDER) -> bytes:
+    """
+    Encode a float array whose first axis is time
+
+    Args:
+        values: (T, ...) array
+        tolerance: Largest absolute error allowed (None is lossless)
+        level: zlib compression level
+        order: Differences taken along time; 4 suits smooth orbits sampled
+            a few dozen times per period, lower orders suit noisier data
+
+    Raises ValueError when quantizing non-finite values, or values too large
+    for the tolerance to be kept (see MAX_QUANTIZED_BITS).
+    """
+    if not 1 <= order <= 255:
+        raise ValueError("order must be between 1 and 255")
+    values = np.asarray(values, dtype=np.float64)
+    if tolerance is not None:
+        if tolerance <= 0:
+            raise ValueError("tolerance must be positive")
+        if not np.isfinite(values).all():
+            raise ValueError("Quantized encoding needs finite values; use tolerance=None")
+        quantum = 2.0 * tolerance
+        scaled = values / quantum
+        # Each difference can double the range; stay well inside int64 and exact as float64
+        limit = 2.0 ** min(MAX_QUANTIZED_BITS, 62 - order)
+        if scaled.size and np.abs(scaled).max() >= limit:
+            raise ValueError(f"tolerance {tolerance:g} is too small for values up to "
+                             f"{np.abs(values).max():g} with order {order}")
+        integers = np.rint(scaled).astype(np.int64)
+        mode = MODE_QUANTIZED
+    else:
+        quantum = 0.0
+        integers = np.ascontiguousarray(values).view(np.int64)
+        mode = MODE_LOSSLESS
+
+    # Streams are time-contiguous per component: (T, ...) -> (components, T)
+    n_streams = int(np.prod(values.shape[1:], dtype=np.int64))
+    residuals = np.ascontiguousarray(integers.reshape(len(values), n_streams).T)
+    for _ in range(order):
+        residuals = np.diff(residuals, axis=1, prepend=0)
+    # The first samples of a stream predict nothing and would force 8-byte residuals
+    head = np.ascontiguousarray(residuals[:, :order], dtype='<i8')
+    tail = residuals[:, order:]
+    zigzag = ((tail << 1) ^ (tail >> 63)).view(np.uint64)
+
+    largest = int(zigzag.max()) if zigzag.size else 0
+    width = next(w for w in (1, 2, 4, 8) if largest < 1 << (8 * w))
+    planes = zigzag.astype(f'<u{width}').view(np.uint8).reshape(-1, width).T
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, mode, order, width, values.ndim, quantum)
+    shape = struct.pack(f'<{values.ndim}Q', *values.shape)
+    return header + shape + zlib.compress(head.tobytes() + planes.tobytes(), level)
+
+
+def decode(data: bytes) -> np.ndarray:
+    """Reverse encode()"""
+    magic, version, mode, order, width, ndim, quantum = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not an encoded trajectory (bad magic or version)")
+    shape = struct.unpack_from(f'<{ndim}Q', data, HEADER.size)
+    payload = zlib.decompress(memoryview(data)[HEADER.size + 8 * ndim:])
+
+    n_samples = shape[0]
+    n_streams = int(np.prod(shape[1:], dtype=np.int64))
+    n_head = min(order, n_samples)
+    head_size = 8 * n_streams * n_head
+    head = np.frombuffer(payload, dtype='<i8', count=n_streams * n_head)
+
+    planes = np.frombuffer(payload, dtype=np.uint8, offset=head_size).reshape(width, -1)
+    zigzag = np.ascontiguousarray(planes.T).view(f'<u{width}')
+    zigzag = zigzag.reshape(n_streams, n_samples - n_head).astype(np.uint64)
+
+    streams = np.empty((n_streams, n_samples), dtype=np.int64)
+    streams[:, :n_head] = head.reshape(n_streams, n_head)
+    streams[:, n_head:] = ((zigzag >> np.uint64(1)).view(np.int64)
+                           ^ -(zigzag & np.uint64(1)).view(np.int64))
+    for _ in range(order):
+        np.cumsum(streams, axis=1, out=streams)
+
+    integers = np.ascontiguousarray(streams.T).reshape(shape)
+    if mode == MODE_QUANTIZED:
+        return integers * quantum
+    return integers.view(np.float64)
+
+
+class CompressedTrajectory:
+    """A TrajectoryBuffer held as encoded times, positions and velocities"""
+
+    def __init__(self, names: Sequence[str], times: bytes, positions: bytes, velocities: bytes):
+        self.names = tuple(names)
+        self.times = times
+        self.positions = positions
+        self.velocities = velocities
+
+    @classmethod
+    def from_buffer(cls, buffer: TrajectoryBuffer, position_tolerance: Optional[float] = None,
+                    velocity_tolerance: Optional[float] = None,
+                    level: int = 6) -> 'CompressedTrajectory':
+        """
+        Encode a buffer; times are always lossless
+
+        Args:
+            position_tolerance: Largest position error in meters (None is lossless)
+            velocity_tolerance: Largest velocity error in m/s (None is lossless)
+        """
+        return cls(buffer.names, encode(buffer.times, None, level),
+                   encode(buffer.positions, position_tolerance, level),
+                   encode(buffer.velocities, velocity_tolerance, level))
+
+    def to_buffer(self) -> TrajectoryBuffer:
+        return TrajectoryBuffer.from_arrays(self.names, decode(self.times),
+                                            decode(self.positions), decode(self.velocities))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.times) + len(self.positions) + len(self.velocities)
+
+    def save(self, path: str):
+        """Write the encoded streams to an .npz archive"""
+        np.savez(path, version=FORMAT_VERSION, names=np.array(self.names, dtype=str),
+                 times=np.frombuffer(self.times, np.uint8),
+                 positions=np.frombuffer(self.positions, np.uint8),
+                 velocities=np.frombuffer(self.velocities, np.uint8))
+
+    @classmethod
+    def load(cls, path: str) -> 'CompressedTrajectory':
+        with np.load(path) as data:
+            if int(data['version']) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported trajectory archive version {int(data['version'])}")
+            return cls([str(name) for name in data['names']], data['times'].tobytes(),
+                       data['positions'].tobytes(), data['velocities'].tobytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the codec on a simulated history")
+    parser.add_argument('--scenario', default='realistic_space_scene')
+    parser.add_argument('--days', type=float, default=3650.0)
+    parser.add_argument('--dt-hours', type=float, default=6.0)
+    parser.add_argument('--tolerance', type=float, default=100.0,
+                        help="position tolerance in meters (velocity uses tolerance / 1e4 m/s)")
+    args = parser.parse_args()
+
+    from orbital_simulator import OrbitalSimulator
+
+    print("🗜️ Trajectory Codec")
+    print("=" * 30)
+    simulator = OrbitalSimulator([], dt=args.dt_hours * 3600)
+    simulator.load_scenario(args.scenario)
+    for _ in range(int(args.days * 24 / args.dt_hours)):
+        simulator.step()
+    buffer = simulator.trajectories
+    print(f"{len(buffer.names)} bodies x {buffer.n_samples:,} samples, "
+          f"{buffer.nbytes / 2**20:.1f} MiB raw")
+
+    settings = [("lossless", None, None),
+                (f"{args.tolerance:g} m", args.tolerance, args.tolerance / 1e4)]
+    for label, position_tolerance, velocity_tolerance in settings:
+        start = time.perf_counter()
+        packed = CompressedTrajectory.from_buffer(buffer, position_tolerance, velocity_tolerance)
+        encoded = time.perf_counter() - start
+        start = time.perf_counter()
+        restored = packed.to_buffer()
+        decoded = time.perf_counter() - start
+        error = np.max(np.abs(restored.positions - buffer.positions))
+        print(f"  {label:<10} {packed.nbytes / 2**10:9.1f} KiB  {buffer.nbytes / packed.nbytes:6.1f}x  "
+              f"encode {encoded * 1000:6.1f} ms  decode {decoded * 1000:6.1f} ms  "
+              f"max error {error:.3g} m")
+
+if __name__ == "__main__":
+    main()